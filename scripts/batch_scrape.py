@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""Script for scraping tweets from many Twitter profiles in parallel."""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.batch import BatchScraper
+from src.async_scraper import AsyncTwitterScraper
+from src.scheduler import load_credentials
+from src.monitoring import MetricsServer, write_textfile
+from src.monitoring.profiling import PROFILE_SUFFIXES
+from src.tweet.sinks import SINKS
+
+# Initialize Rich console
+console = Console()
+
+STATUS_STYLES = {
+    'queued': 'dim',
+    'retrying': 'yellow',
+    'done': 'green',
+    'empty': 'yellow',
+    'failed': 'red'
+}
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Scrape tweets from many Twitter profiles with a pool of browsers.")
+    parser.add_argument('usernames', nargs='*', help="Profiles to scrape (without @)")
+    parser.add_argument('-f', '--file', help="File with one username per line ('#' starts a comment)")
+    parser.add_argument('-w', '--workers', type=int, help="Concurrent browsers (default: CPU count)")
+    parser.add_argument('-r', '--retries', type=int, help="Extra attempts for a failed profile")
+    parser.add_argument('-t', '--tabs', type=int, help="Scrape this many profiles as tabs of one logged-in browser instead of a process pool")
+    parser.add_argument('--show-browser', action='store_true', help="Run browsers with a visible window")
+    parser.add_argument('--mode', choices=['batch', 'incremental', 'network', 'snapshot', 'element'], help="Extraction mode")
+    parser.add_argument('--engine', choices=['browser', 'http'], help="Scraping engine")
+    parser.add_argument('--lean', action='store_true', default=None, help="Block images, video, fonts and trackers")
+    parser.add_argument('--format', dest='formats', action='append', choices=list(SINKS),
+                        help="Output format, repeat for several (default: OUTPUT_SETTINGS['formats'])")
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], help="Compress the output files")
+    parser.add_argument('--skip-known', action='store_true', default=None,
+                        help="Skip tweets saved by earlier runs of the same profile")
+    parser.add_argument('--since-last-run', action='store_true', default=None,
+                        help="Stop at the tweets saved by the last run, then continue an unfinished backfill")
+    parser.add_argument('--database', action='store_true', default=None,
+                        help="Also save tweets to the SQLite database (see scripts/query_tweets.py)")
+    parser.add_argument('--prune', action='store_true', default=None,
+                        help="Collapse processed tweets so very long profiles scroll at a constant cost")
+    parser.add_argument('--pipeline', action='store_true', default=None,
+                        help="Process each scroll's tweets on a worker thread while the browser scrolls on")
+    parser.add_argument('--profile', choices=list(PROFILE_SUFFIXES),
+                        help="Save a profile of each run next to its output file")
+    parser.add_argument('--prometheus-textfile', metavar='PATH',
+                        help="Write run metrics to this .prom file for node_exporter's textfile collector")
+    parser.add_argument('--prometheus-port', type=int, metavar='PORT',
+                        help="Serve run metrics at http://localhost:PORT/metrics while the batch runs")
+    parser.add_argument('--prometheus-host', metavar='HOST',
+                        help="Interface the metrics server binds, e.g. 0.0.0.0 for a remote Prometheus "
+                             "(default: METRICS_SETTINGS['prometheus_host'])")
+    return parser.parse_args()
+
+def read_usernames(args):
+    """Collect usernames from the arguments and the optional file.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        list: The usernames to scrape.
+    """
+    usernames = list(args.usernames)
+    if args.file:
+        with open(args.file, encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    usernames.append(line)
+    return usernames
+
+def print_summary(results, summary, elapsed):
+    """Print the per-profile results and run totals.
+
+    Args:
+        results (list): Job results.
+        summary (dict): Totals from BatchScraper.summarize.
+        elapsed (float): Wall-clock seconds for the whole batch.
+    """
+    table = Table(title="Batch results", border_style="blue")
+    table.add_column("Profile", style="bold")
+    table.add_column("Status")
+    table.add_column("Tweets", justify="right")
+    table.add_column("Attempts", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Output / Error")
+
+    for result in results:
+        style = STATUS_STYLES.get(result['status'], '')
+        table.add_row(
+            f"@{result['username']}",
+            f"[{style}]{result['status']}[/{style}]",
+            str(result['tweets']),
+            str(result['attempt']),
+            f"{result['duration']:.0f}s",
+            result['error'] or result['file'] or ''
+        )
+    console.print(table)
+
+    console.print(Panel.fit(
+        f"[bold green]{summary['done']}[/bold green] done  •  "
+        f"[bold yellow]{summary['empty']}[/bold yellow] empty  •  "
+        f"[bold red]{summary['failed']}[/bold red] failed  •  "
+        f"[bold blue]{summary['tweets']}[/bold blue] tweets in {elapsed:.0f}s",
+        border_style="green" if not summary['failed'] else "yellow"
+    ))
+
+def run_tabs(args, usernames, twitter_username, twitter_password):
+    """Scrape the profiles as concurrent tabs of a single browser.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        usernames (list): Profiles to scrape.
+        twitter_username (str): Twitter username or email.
+        twitter_password (str): Twitter password.
+
+    Returns:
+        list: Job results in the same shape as BatchScraper.run.
+    """
+    scraper = AsyncTwitterScraper(
+        headless=not args.show_browser, tabs=args.tabs, extraction_mode=args.mode, lean=args.lean,
+        output_formats=args.formats, compression=args.compress, skip_known=args.skip_known,
+        database=args.database
+    )
+    try:
+        with console.status("[bold blue]Logging in to Twitter...", spinner="dots"):
+            if not scraper.login(twitter_username, twitter_password):
+                console.print("[red]Login failed. Please check your credentials.[/red]")
+                return []
+
+        started = time.time()
+        results = scraper.get_tweets_for_profiles(usernames)
+        elapsed = time.time() - started
+        if scraper.lean:
+            scraper.report_network_savings()
+    finally:
+        scraper.close()
+
+    return [{
+        'username': result['username'],
+        'status': 'done' if result['tweets'] else 'empty',
+        'tweets': result['tweets'],
+        'attempt': 1,
+        'file': result['file'],
+        'error': None,
+        'duration': elapsed,
+        'metrics': None
+    } for result in results]
+
+def main():
+    """Main function for the batch scraping script."""
+    args = parse_args()
+
+    try:
+        usernames = read_usernames(args)
+    except OSError as e:
+        console.print(f"[red]Could not read usernames: {str(e)}[/red]")
+        return
+
+    if not usernames:
+        console.print("[red]No usernames given. Pass them as arguments or with --file.[/red]")
+        return
+
+    load_dotenv()
+    twitter_username = os.getenv('TWITTER_USERNAME')
+    twitter_password = os.getenv('TWITTER_PASSWORD')
+    if not twitter_username or not twitter_password:
+        console.print("[red]Batch mode needs TWITTER_USERNAME and TWITTER_PASSWORD in .env[/red]")
+        return
+
+    Path("data/tweets").mkdir(parents=True, exist_ok=True)
+    usernames = list(dict.fromkeys(name.lstrip('@') for name in usernames))
+
+    if args.tabs:
+        if args.since_last_run:
+            console.print("[yellow]--since-last-run is not supported with --tabs; skipping known tweets instead.[/yellow]")
+            args.skip_known = True
+        console.print(Panel.fit(
+            f"[bold blue]Batch Twitter Scraper[/bold blue]\n"
+            f"[dim]{len(usernames)} profiles on {args.tabs} tabs of one browser[/dim]",
+            border_style="blue"
+        ))
+        started = time.time()
+        try:
+            results = run_tabs(args, usernames, twitter_username, twitter_password)
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Batch interrupted by user.[/yellow]")
+            return
+        if results:
+            print_summary(results, BatchScraper.summarize(results), time.time() - started)
+        return
+
+    # Extra accounts from TWITTER_ACCOUNTS take over when one is rate limited
+    credentials = load_credentials()
+    if len(credentials) > 1:
+        console.print(f"[dim]Rotating through {len(credentials)} accounts when rate limited.[/dim]")
+
+    batch = BatchScraper(
+        twitter_username, twitter_password,
+        workers=args.workers,
+        retries=args.retries,
+        headless=not args.show_browser,
+        extraction_mode=args.mode,
+        engine=args.engine,
+        lean=args.lean,
+        output_formats=args.formats,
+        compression=args.compress,
+        skip_known=args.skip_known,
+        since_last_run=args.since_last_run,
+        database=args.database,
+        credentials=credentials,
+        profile=args.profile,
+        prune=args.prune,
+        pipeline=args.pipeline
+    )
+
+    metrics_server = None
+    if args.prometheus_port:
+        metrics_server = MetricsServer(args.prometheus_port, args.prometheus_host)
+        try:
+            metrics_server.start()
+            console.print(f"[dim]Serving metrics at http://{metrics_server.host}:{metrics_server.port}/metrics[/dim]")
+        except OSError as e:
+            console.print(f"[red]Could not start the metrics server: {str(e)}[/red]")
+            metrics_server = None
+    run_summaries = {}
+
+    console.print(Panel.fit(
+        f"[bold blue]Batch Twitter Scraper[/bold blue]\n"
+        f"[dim]{len(usernames)} profiles on {batch.workers} workers[/dim]",
+        border_style="blue"
+    ))
+
+    def report(username, status, result):
+        if status == 'queued':
+            return
+        style = STATUS_STYLES.get(status, '')
+        detail = f" ({result['tweets']} tweets)" if result and status in ('done', 'empty') else ''
+        if result and result['error']:
+            detail = f" ({result['error']})"
+        console.print(f"[{style}]@{username}: {status}{detail}[/{style}]")
+        
+        if result and result.get('metrics'):
+            run_summaries[username] = result['metrics']
+            if metrics_server:
+                metrics_server.update(result['metrics'])
+            if args.prometheus_textfile:
+                write_textfile(args.prometheus_textfile, list(run_summaries.values()))
+
+    started = time.time()
+    try:
+        results = batch.run(usernames, progress_callback=report)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Batch interrupted by user.[/yellow]")
+        return
+    finally:
+        if metrics_server:
+            metrics_server.stop()
+
+    print_summary(results, batch.summarize(results), time.time() - started)
+
+if __name__ == "__main__":
+    main()
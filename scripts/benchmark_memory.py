@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Compare the memory cost of Tweet records with the old nested tweet dicts."""
+
+import sys
+import random
+import hashlib
+import argparse
+import tracemalloc
+from pathlib import Path
+from rich.console import Console
+from rich.table import Table
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.tweet.processor import TweetProcessor
+
+# Initialize Rich console
+console = Console()
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Measure per-tweet memory of the tweet representations.")
+    parser.add_argument('-n', '--tweets', type=int, default=200000, help="Tweets to build (default: 200000)")
+    parser.add_argument('--text-length', type=int, default=120, help="Characters per tweet text (default: 120)")
+    return parser.parse_args()
+
+def generate_fields(count, text_length):
+    """Generate raw scraped fields, the same sequence on every call.
+
+    Fields are produced one tweet at a time, so whatever a representation
+    keeps of them is what it retains after scraping.
+
+    Args:
+        count (int): Number of tweets.
+        text_length (int): Characters per tweet text.
+
+    Yields:
+        tuple: (status ID, text, timestamp, metric digit strings).
+    """
+    rng = random.Random(42)
+    alphabet = 'abcdefghijklmnopqrstuvwxyz     '
+    for i in range(count):
+        text = ''.join(rng.choice(alphabet) for _ in range(text_length))
+        timestamp = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00.000Z"
+        metrics = [str(rng.randint(0, 10 ** rng.randint(1, 6))) for _ in range(4)]
+        yield str(1700000000000000000 + i), text, timestamp, metrics
+
+def build_dicts(fields):
+    """Build tweets the old way: nested dicts and md5 hex dedup keys.
+
+    Args:
+        fields: Raw fields from generate_fields.
+
+    Returns:
+        tuple: (tweets, dedup keys).
+    """
+    tweets = []
+    seen = set()
+    for status_id, text, timestamp, metrics in fields:
+        seen.add(hashlib.md5(f"{text}{timestamp}".encode('utf-8')).hexdigest())
+        tweets.append({
+            'text': text,
+            'timestamp': timestamp,
+            'metrics': dict(zip(('comments', 'retweets', 'likes', 'views'), metrics)),
+            'status_id': status_id,
+            'url': f"https://x.com/user/status/{status_id}"
+        })
+    return tweets, seen
+
+def build_records(fields):
+    """Build tweets as Tweet records with int dedup keys, through TweetProcessor.
+
+    Args:
+        fields: Raw fields from generate_fields.
+
+    Returns:
+        tuple: (tweets, dedup keys).
+    """
+    processor = TweetProcessor()
+    tweets = []
+    for status_id, text, timestamp, metrics in fields:
+        tweet = processor.process_api_tweet({
+            'text': text,
+            'timestamp': timestamp,
+            'metrics': dict(zip(('comments', 'retweets', 'likes', 'views'), metrics)),
+            'status_id': status_id,
+            'url': f"https://x.com/user/status/{status_id}"
+        })
+        tweets.append(tweet)
+    return tweets, processor.processed_tweet_ids
+
+def measure(builder, count, text_length):
+    """Measure the memory retained by a representation.
+
+    Args:
+        builder: build_dicts or build_records.
+        count (int): Number of tweets.
+        text_length (int): Characters per tweet text.
+
+    Returns:
+        dict: Bytes retained in total, by the tweets and by the dedup keys.
+    """
+    tracemalloc.start()
+    tweets, seen = builder(generate_fields(count, text_length))
+    total = tracemalloc.get_traced_memory()[0]
+
+    # Dropping the tweets leaves the dedup keys, which stay for the whole run
+    del tweets
+    keys = tracemalloc.get_traced_memory()[0]
+    del seen
+    tracemalloc.stop()
+    return {'total': total, 'tweets': total - keys, 'keys': keys}
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    args = parse_args()
+
+    results = {}
+    for name, builder in (('dict + md5 hex', build_dicts), ('Tweet + int', build_records)):
+        with console.status(f"[bold blue]Measuring {name}...", spinner="dots"):
+            results[name] = measure(builder, args.tweets, args.text_length)
+
+    table = Table(title=f"Memory for {args.tweets:,} tweets ({args.text_length}-char texts)", border_style="blue")
+    table.add_column("Representation", style="bold")
+    table.add_column("Total", justify="right")
+    table.add_column("Per tweet", justify="right")
+    table.add_column("Record / tweet", justify="right")
+    table.add_column("Dedup key / tweet", justify="right")
+
+    for name, result in results.items():
+        table.add_row(
+            name,
+            f"{result['total'] / 1e6:.1f} MB",
+            f"{result['total'] / args.tweets:.0f} B",
+            f"{result['tweets'] / args.tweets:.0f} B",
+            f"{result['keys'] / args.tweets:.0f} B"
+        )
+    console.print(table)
+
+    baseline, compact = results['dict + md5 hex']['total'], results['Tweet + int']['total']
+    console.print(f"[green]Tweet records use {compact / baseline:.0%} of the dict representation.[/green]")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Benchmark TwitterScraper.get_tweets against a local synthetic timeline."""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import threading
+from pathlib import Path
+from collections import Counter
+from rich.console import Console
+from rich.table import Table
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.scraper import TwitterScraper
+from src.testing import MockTimelineServer
+from src.config.settings import SITE_SETTINGS, OUTPUT_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# Methods timed for each phase of a run, as (attribute path, method name)
+PHASES = {
+    'scroll': [('browser', 'scroll')],
+    'extract': [
+        ('', 'collect_visible_tweets'),
+        ('tweet_processor', 'process_tweet'),
+        ('tweet_processor', 'process_payload'),
+        ('tweet_processor', 'process_api_tweet')
+    ],
+    'write': [
+        ('file_handler', 'save_tweet'),
+        ('file_handler', 'checkpoint'),
+        ('file_handler', 'close')
+    ]
+}
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Measure scraper throughput in headless Chrome against a local timeline.")
+    parser.add_argument('-n', '--tweets', type=int, default=1000, help="Tweets in the synthetic timeline (default: 1000)")
+    parser.add_argument('--page-size', type=int, default=20, help="Tweets per timeline response (default: 20)")
+    parser.add_argument('--latency', type=float, default=0.2, help="Seconds before each timeline response (default: 0.2)")
+    parser.add_argument('--recycle', type=int, default=None,
+                        help="Articles kept rendered, like the web app's virtualized list (default: keep all)")
+    parser.add_argument('--mode', dest='modes', action='append', choices=['batch', 'incremental', 'network', 'snapshot', 'element'],
+                        help="Extraction mode, repeat to compare several (default: batch)")
+    parser.add_argument('--prune', action='store_true', help="Collapse processed tweets as in long-run mode")
+    parser.add_argument('--pipeline', action='store_true', help="Process tweets on a worker thread while scrolling")
+    parser.add_argument('--show-browser', action='store_true', help="Run Chrome with a visible window")
+    parser.add_argument('--json', help="Also write the results to this JSON file")
+    return parser.parse_args()
+
+class PhaseTimer:
+    """Accumulates wall time spent in wrapped methods, by phase."""
+
+    def __init__(self):
+        """Initialize empty totals."""
+        self.totals = Counter()
+        self.active = None
+
+    def wrap(self, owner, name, phase):
+        """Time every call of a bound method.
+
+        Calls nested inside another timed call are counted once, for the
+        outer phase.
+
+        Args:
+            owner: The object holding the method.
+            name (str): The method name.
+            phase (str): The phase its time counts towards.
+        """
+        method = getattr(owner, name, None)
+        if method is None:
+            return
+
+        def timed(*args, **kwargs):
+            if self.active:
+                return method(*args, **kwargs)
+            self.active = phase
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.totals[phase] += time.perf_counter() - started
+                self.active = None
+
+        setattr(owner, name, timed)
+
+def count_commands(driver):
+    """Count the WebDriver commands sent through a driver.
+
+    Element lookups and property reads go through driver.execute as well,
+    so this sees every round trip to chromedriver.
+
+    Args:
+        driver: The Selenium WebDriver.
+
+    Returns:
+        Counter: Commands sent so far, by command name.
+    """
+    counts = Counter()
+    execute = driver.execute
+
+    def counted(driver_command, params=None):
+        counts[driver_command] += 1
+        return execute(driver_command, params)
+
+    driver.execute = counted
+    return counts
+
+class RssSampler:
+    """Samples the resident memory of this process and its children.
+
+    Chrome runs as descendants of chromedriver, so summing the process tree
+    covers the browser as well. Needs Linux /proc; elsewhere only the
+    Python process' own peak is reported.
+    """
+
+    def __init__(self, interval=0.2):
+        """Initialize the sampler.
+
+        Args:
+            interval (float): Seconds between samples.
+        """
+        self.interval = interval
+        self.peak = 0
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def read_tree_rss(self):
+        """Sum the RSS of this process and all its descendants.
+
+        Returns:
+            int: Bytes resident.
+        """
+        parents = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The command name may contain spaces, so split after its closing parenthesis
+                    fields = f.read().rsplit(')', 1)[1].split()
+                parents[int(entry)] = int(fields[1])
+            except (OSError, IndexError, ValueError):
+                continue
+
+        tree = {os.getpid()}
+        added = True
+        while added:
+            children = {pid for pid, ppid in parents.items() if ppid in tree and pid not in tree}
+            tree |= children
+            added = bool(children)
+
+        total = 0
+        for pid in tree:
+            try:
+                with open(f"/proc/{pid}/statm") as f:
+                    total += int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+            except (OSError, IndexError, ValueError):
+                continue
+        return total
+
+    def run(self):
+        """Sample until stopped."""
+        while not self.stopped.is_set():
+            self.peak = max(self.peak, self.read_tree_rss())
+            self.stopped.wait(self.interval)
+
+    def start(self):
+        """Start sampling in a background thread."""
+        if os.path.isdir('/proc'):
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """Stop sampling.
+
+        Returns:
+            int: Peak bytes resident across the process tree.
+        """
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+            return self.peak
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+def benchmark(mode, args, output_dir):
+    """Scrape the synthetic timeline once and measure the run.
+
+    Args:
+        mode (str): The extraction mode.
+        args (argparse.Namespace): The parsed arguments.
+        output_dir (str): Directory for the output files.
+
+    Returns:
+        dict: The run's measurements.
+    """
+    server = MockTimelineServer(total=args.tweets, page_size=args.page_size, latency=args.latency, recycle=args.recycle)
+    server.start()
+    SITE_SETTINGS['base_url'] = server.base_url
+    OUTPUT_SETTINGS['directory'] = output_dir
+
+    sampler = RssSampler()
+    sampler.start()
+    scraper = None
+    try:
+        scraper = TwitterScraper(headless=not args.show_browser, extraction_mode=mode, engine='browser', prune=args.prune,
+                                 pipeline=args.pipeline)
+        commands = count_commands(scraper.browser.driver)
+        timer = PhaseTimer()
+        for phase, methods in PHASES.items():
+            for path, name in methods:
+                timer.wrap(getattr(scraper, path) if path else scraper, name, phase)
+
+        started = time.perf_counter()
+        tweet_count = scraper.get_tweets('mock_user', retain=False)
+        elapsed = time.perf_counter() - started
+    finally:
+        if scraper:
+            scraper.close()
+        peak_rss = sampler.stop()
+        server.stop()
+
+    split = {phase: timer.totals[phase] for phase in PHASES}
+    split['other'] = max(elapsed - sum(split.values()), 0)
+    return {
+        'mode': mode,
+        'tweets': tweet_count,
+        'expected': args.tweets,
+        'seconds': elapsed,
+        'tweets_per_sec': tweet_count / elapsed if elapsed else 0,
+        'commands': sum(commands.values()),
+        'commands_per_tweet': sum(commands.values()) / tweet_count if tweet_count else None,
+        'top_commands': dict(commands.most_common(5)),
+        'peak_rss_mb': peak_rss / 1e6,
+        'time_split': split
+    }
+
+def main():
+    """Run the benchmark for each mode and print a comparison table."""
+    args = parse_args()
+    modes = args.modes or ['batch']
+
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        for mode in modes:
+            with console.status(f"[bold blue]Scraping {args.tweets} synthetic tweets in {mode} mode...", spinner="dots"):
+                results.append(benchmark(mode, args, output_dir))
+
+    recycle = f", {args.recycle} articles rendered" if args.recycle else ''
+    recycle += ", pruned" if args.prune else ''
+    recycle += ", pipelined" if args.pipeline else ''
+    table = Table(title=f"{args.tweets:,} tweets, {args.latency:.2f}s latency{recycle}", border_style="blue")
+    table.add_column("Mode", style="bold")
+    table.add_column("Tweets", justify="right")
+    table.add_column("Tweets/s", justify="right")
+    table.add_column("Commands/tweet", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    table.add_column("Scroll", justify="right")
+    table.add_column("Extract", justify="right")
+    table.add_column("Write", justify="right")
+    table.add_column("Other", justify="right")
+
+    for result in results:
+        split = result['time_split']
+        commands_per_tweet = result['commands_per_tweet']
+        table.add_row(
+            result['mode'],
+            f"{result['tweets']}/{result['expected']}",
+            f"{result['tweets_per_sec']:.1f}",
+            f"{commands_per_tweet:.2f}" if commands_per_tweet is not None else '-',
+            f"{result['peak_rss_mb']:.0f} MB",
+            *(f"{split[phase] / result['seconds']:.0%}" for phase in ('scroll', 'extract', 'write', 'other'))
+        )
+    console.print(table)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding='utf-8')
+        console.print(f"[green]Results written to {args.json}[/green]")
+
+if __name__ == "__main__":
+    main()
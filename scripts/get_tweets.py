@@ -3,6 +3,7 @@
 
 import os
 import sys
+import argparse
 from pathlib import Path
 from dotenv import load_dotenv
 from rich.console import Console
@@ -15,12 +16,30 @@ from rich.text import Text
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.scraper import TwitterScraper
+from src.scheduler import load_credentials
+from src.monitoring.profiling import PROFILE_SUFFIXES
+from src.tweet.sinks import SINKS
+from src.config.settings import OUTPUT_SETTINGS
 
 # Initialize Rich console
 console = Console()
 
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Interactively scrape tweets from a Twitter profile.")
+    parser.add_argument('--profile', choices=list(PROFILE_SUFFIXES),
+                        help="Save a profile of the run next to the output file")
+    parser.add_argument('--pipeline', action='store_true', default=None,
+                        help="Process each scroll's tweets on a worker thread while the browser scrolls on")
+    return parser.parse_args()
+
 def main():
     """Main function for the tweet scraping script."""
+    args = parse_args()
     try:
         # Show welcome message
         console.print(Panel.fit(
@@ -48,13 +67,31 @@ def main():
         # Ask for headless mode
         use_headless = Confirm.ask("Run in headless mode? (browser will run in background)", default=False)
         
+        # Ask for output formats
+        formats = Prompt.ask(
+            f"Output formats, comma separated ({', '.join(SINKS)})",
+            default=','.join(OUTPUT_SETTINGS['formats'])
+        )
+        output_formats = [name.strip().lower() for name in formats.split(',') if name.strip()]
+        unknown = [name for name in output_formats if name not in SINKS]
+        if unknown or not output_formats:
+            console.print(f"[red]Unknown output format: {', '.join(unknown) or formats}[/red]")
+            return
+        
+        # Ask for incremental mode
+        since_last_run = Confirm.ask("Only fetch tweets newer than the last run?", default=False)
+        
         # Create data directory if it doesn't exist
         data_dir = Path("data/tweets")
         data_dir.mkdir(parents=True, exist_ok=True)
         
         # Initialize scraper
         with console.status("[bold blue]Starting browser...", spinner="dots"):
-            scraper = TwitterScraper(headless=use_headless)
+            scraper = TwitterScraper(
+                headless=use_headless, account=twitter_username, output_formats=output_formats,
+                since_last_run=since_last_run, credentials=load_credentials(), profile=args.profile,
+                pipeline=args.pipeline
+            )
         
         # Login to Twitter
         with console.status("[bold blue]Logging in to Twitter...", spinner="dots"):
@@ -62,11 +99,14 @@ def main():
                 console.print("[red]Login failed. Please check your credentials.[/red]")
                 scraper.close()
                 return
-            console.print("[green]Successfully logged in![/green]")
+            if scraper.browser.session_restored:
+                console.print("[green]Resumed saved session![/green]")
+            else:
+                console.print("[green]Successfully logged in![/green]")
         
         # Scrape tweets
         console.print(f"\n[bold blue]Scraping tweets from @{username}...[/bold blue]")
-        tweets = []
+        tweet_count = 0
         
         with Progress(
             SpinnerColumn(),
@@ -76,23 +116,24 @@ def main():
         ) as progress:
             task = progress.add_task("Collecting tweets...", total=None)
             
-            def update_progress(description):
-                progress.update(task, description=description)
+            def update_progress(event):
+                progress.update(task, description=str(event))
             
-            tweets = scraper.get_tweets(username, progress_callback=update_progress)
+            tweet_count = scraper.get_tweets(username, progress_callback=update_progress, retain=False)
             progress.update(task, completed=True)
         
         # Save results
-        if tweets:
-            with console.status("[bold blue]Saving tweets...", spinner="dots"):
-                filename = scraper.save_tweets_to_file(tweets, username)
+        if tweet_count:
+            filename = scraper.file_handler.current_file
             
             result = Text()
             result.append("\n✨ ", style="bold yellow")
             result.append(f"Successfully saved ", style="bold green")
-            result.append(str(len(tweets)), style="bold blue")
+            result.append(str(tweet_count), style="bold blue")
             result.append(" tweets to:\n", style="bold green")
             result.append(f"📁 {filename}", style="bold blue")
+            for extra_file in scraper.file_handler.current_files[1:]:
+                result.append(f"\n📁 {extra_file}", style="bold blue")
             console.print(Panel(result, border_style="green"))
         else:
             console.print("\n[yellow]No tweets were found or an error occurred.[/yellow]")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Query and export tweets from the SQLite database."""
+
+import sys
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from rich.console import Console
+from rich.table import Table
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.tweet.database import TweetDatabase
+from src.tweet.models import parse_epoch
+from src.tweet.sinks import SINKS, create_sink
+
+# Initialize Rich console
+console = Console()
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Query the tweets saved with --database.")
+    parser.add_argument('account', nargs='?', help="Only tweets scraped from this profile")
+    parser.add_argument('--db', help="Database file (default: DATABASE_SETTINGS['path'])")
+    parser.add_argument('--since', help="Only tweets created on or after this date or ISO time (UTC)")
+    parser.add_argument('--until', help="Only tweets created before this date or ISO time (UTC)")
+    parser.add_argument('--last', type=int, metavar='DAYS', help="Only tweets from the last DAYS days")
+    parser.add_argument('--author', help="Only tweets by this screen name")
+    parser.add_argument('--search', help="Only tweets containing this text")
+    parser.add_argument('-n', '--limit', type=int, help="Maximum number of tweets")
+    parser.add_argument('--oldest-first', action='store_true', help="Sort oldest tweets first")
+    parser.add_argument('--export', choices=list(SINKS), help="Write the tweets to a file in this format")
+    parser.add_argument('-o', '--output', help="Export path without extension (default: data/exports/{account}_query)")
+    parser.add_argument('--accounts', action='store_true', help="List the stored accounts instead")
+    parser.add_argument('--history', type=int, metavar='STATUS_ID', help="Show the metric snapshots of a tweet instead")
+    return parser.parse_args()
+
+def parse_time(value):
+    """Parse a date or ISO time given on the command line.
+
+    Args:
+        value (str): e.g. '2024-05-01' or '2024-05-01T12:00:00Z'.
+
+    Returns:
+        int: Unix seconds, or None if no value was given.
+    """
+    if not value:
+        return None
+    seconds = parse_epoch(value)
+    if seconds is None:
+        raise SystemExit(f"Invalid date: {value}")
+    return seconds
+
+def format_time(seconds):
+    """Format Unix seconds for display.
+
+    Args:
+        seconds (int): Unix seconds, or None.
+
+    Returns:
+        str: The UTC time, or '' if unknown.
+    """
+    if seconds is None:
+        return ''
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime('%Y-%m-%d %H:%M')
+
+def show_accounts(database):
+    """Print every stored account with its tweet count and time range.
+
+    Args:
+        database (TweetDatabase): The open database.
+    """
+    table = Table(title=f"Accounts in {database.path}", border_style="blue")
+    table.add_column("Account", style="bold")
+    table.add_column("Tweets", justify="right")
+    table.add_column("Oldest tweet")
+    table.add_column("Newest tweet")
+    table.add_column("Last scraped")
+    for account in database.get_accounts():
+        table.add_row(
+            f"@{account['username']}", str(account['tweets']), format_time(account['oldest']),
+            format_time(account['newest']), format_time(account['last_scraped_at'])
+        )
+    console.print(table)
+
+def show_history(database, status_id):
+    """Print how a tweet's metrics changed across scrapes.
+
+    Args:
+        database (TweetDatabase): The open database.
+        status_id (int): The tweet's status ID.
+    """
+    table = Table(title=f"Metrics of {status_id}", border_style="blue")
+    table.add_column("Scraped", style="bold")
+    for name in ('Replies', 'Retweets', 'Likes', 'Views'):
+        table.add_column(name, justify="right")
+    for snapshot in database.get_metric_history(status_id):
+        table.add_row(
+            format_time(snapshot['scraped_at']), str(snapshot['comments']), str(snapshot['retweets']),
+            str(snapshot['likes']), str(snapshot['views'])
+        )
+    console.print(table)
+
+def show_tweets(tweets):
+    """Print tweets as a table.
+
+    Args:
+        tweets: Tweets from TweetDatabase.query.
+
+    Returns:
+        int: The number of tweets printed.
+    """
+    table = Table(border_style="blue")
+    table.add_column("Created", style="bold", no_wrap=True)
+    table.add_column("Author")
+    table.add_column("Text")
+    table.add_column("Likes", justify="right")
+    table.add_column("Views", justify="right")
+    count = 0
+    for tweet in tweets:
+        table.add_row(format_time(tweet.created_at), f"@{tweet.author or '?'}", tweet.text,
+                      str(tweet.likes), str(tweet.views))
+        count += 1
+    console.print(table)
+    return count
+
+def export_tweets(tweets, output_format, path_stem, label):
+    """Write tweets with one of the output sinks.
+
+    Args:
+        tweets: Tweets from TweetDatabase.query.
+        output_format (str): A key of SINKS.
+        path_stem (str): Output path without extension.
+        label (str): Name written in the text format's header.
+
+    Returns:
+        tuple: (number of tweets, output path).
+    """
+    Path(path_stem).parent.mkdir(parents=True, exist_ok=True)
+    sink = create_sink(output_format, path_stem)
+    sink.open(label)
+    try:
+        for tweet in tweets:
+            sink.write(tweet)
+    finally:
+        sink.close()
+    return sink.count, sink.path
+
+def main():
+    """Run the query."""
+    args = parse_args()
+    database = TweetDatabase(args.db)
+    try:
+        if args.accounts:
+            show_accounts(database)
+            return
+        if args.history:
+            show_history(database, args.history)
+            return
+
+        since = parse_time(args.since)
+        if args.last:
+            since = int((datetime.now(timezone.utc) - timedelta(days=args.last)).timestamp())
+
+        tweets = database.query(
+            account=args.account, since=since, until=parse_time(args.until), author=args.author,
+            search=args.search, limit=args.limit, newest_first=not args.oldest_first
+        )
+
+        if args.export:
+            label = args.account or args.author or 'query'
+            path_stem = args.output or f"data/exports/{label}_query"
+            count, path = export_tweets(tweets, args.export, path_stem, label)
+            console.print(f"[green]Exported {count} tweets to {path}[/green]")
+        else:
+            count = show_tweets(tweets)
+            console.print(f"[dim]{count} tweets[/dim]")
+
+    finally:
+        database.close()
+
+if __name__ == "__main__":
+    main()
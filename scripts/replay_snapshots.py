@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Re-extract tweets from recorded page snapshots without a browser."""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from rich.console import Console
+from rich.table import Table
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.snapshots import replay_snapshots
+from src.tweet.sinks import SINKS
+from src.config.settings import SNAPSHOT_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Parse the snapshots saved in snapshot mode again, e.g. after a selector fix."
+    )
+    parser.add_argument('path', nargs='?', default=SNAPSHOT_SETTINGS['directory'],
+                        help="A run's snapshot folder, or a folder holding runs (default: SNAPSHOT_SETTINGS['directory'])")
+    parser.add_argument('--parser', choices=['lxml', 'html.parser'], help="HTML parser (default: SNAPSHOT_SETTINGS['parser'])")
+    parser.add_argument('-w', '--workers', type=int, help="Parsing processes (default: CPU count - 1)")
+    parser.add_argument('--format', dest='formats', action='append', choices=list(SINKS),
+                        help="Output format, repeat for several (default: OUTPUT_SETTINGS['formats'])")
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], help="Compress the output files")
+    return parser.parse_args()
+
+def main():
+    """Main function for the snapshot replay script."""
+    args = parse_args()
+
+    def report(result):
+        console.print(
+            f"[green]@{result['username']}[/green]: {result['tweets']} tweets from "
+            f"{result['snapshots']} snapshots [dim]({result['run']})[/dim]"
+        )
+
+    started = time.time()
+    try:
+        results = replay_snapshots(
+            args.path, backend=args.parser, workers=args.workers, output_formats=args.formats,
+            compression=args.compress, progress_callback=report
+        )
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Replay interrupted by user.[/yellow]")
+        return
+    except Exception as e:
+        console.print(f"[red]Replay failed: {str(e)}[/red]")
+        return
+    if not results:
+        return
+
+    elapsed = time.time() - started
+    table = Table(title=f"Replayed {len(results)} runs in {elapsed:.1f}s", border_style="blue")
+    table.add_column("Profile", style="bold")
+    table.add_column("Snapshots", justify="right")
+    table.add_column("Articles", justify="right")
+    table.add_column("Tweets", justify="right")
+    table.add_column("Output")
+    for result in results:
+        table.add_row(
+            result['username'], str(result['snapshots']), str(result['articles']), str(result['tweets']),
+            "\n".join(result['files'])
+        )
+    console.print(table)
+
+if __name__ == "__main__":
+    main()
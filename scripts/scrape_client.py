@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Thin client for the scraper daemon's job API.
+
+Imports only the standard library, so it starts in milliseconds; the
+browsers, login and scraping all live in scripts/scraper_daemon.py.
+"""
+
+import os
+import sys
+import json
+import argparse
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
+
+# Where scripts/scraper_daemon.py listens by default (DAEMON_SETTINGS)
+DEFAULT_URL = 'http://127.0.0.1:8765'
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Submit and follow scrape jobs on a running scraper daemon.")
+    parser.add_argument('--url', default=os.getenv('SCRAPER_DAEMON_URL', DEFAULT_URL),
+                        help=f"Daemon address (default: $SCRAPER_DAEMON_URL or {DEFAULT_URL})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    submit = commands.add_parser('submit', help="Queue a scrape job")
+    submit.add_argument('username', help="Profile to scrape (without @)")
+    submit.add_argument('-n', '--limit', type=int, help="Stop after this many new tweets")
+    submit.add_argument('--since', help="Only tweets posted from this date or ISO time (UTC)")
+    submit.add_argument('--until', help="Only tweets posted before this date or ISO time (UTC)")
+    submit.add_argument('-f', '--follow', action='store_true', help="Print the tweets as JSON lines until the job ends")
+
+    status = commands.add_parser('status', help="Show one job, or every job")
+    status.add_argument('job', nargs='?', help="Job ID")
+
+    tweets = commands.add_parser('tweets', help="Print a job's tweets as JSON lines")
+    tweets.add_argument('job', help="Job ID")
+    tweets.add_argument('-f', '--follow', action='store_true', help="Keep printing until the job ends")
+    tweets.add_argument('--offset', type=int, default=0, help="Skip this many tweets")
+
+    cancel = commands.add_parser('cancel', help="Cancel a job")
+    cancel.add_argument('job', help="Job ID")
+
+    commands.add_parser('health', help="Show the browser pool and job counts")
+    return parser.parse_args()
+
+def request(url, method='GET', body=None):
+    """Send an API request.
+
+    Args:
+        url (str): The full URL.
+        method (str): The HTTP method.
+        body (dict): JSON body to send.
+
+    Returns:
+        http.client.HTTPResponse: The open response.
+    """
+    headers = {'Content-Type': 'application/json'}
+    if os.getenv('SCRAPER_DAEMON_TOKEN'):
+        headers['Authorization'] = f"Bearer {os.getenv('SCRAPER_DAEMON_TOKEN')}"
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    return urlopen(Request(url, data=data, headers=headers, method=method))
+
+def call(url, method='GET', body=None):
+    """Send an API request and decode its JSON answer.
+
+    Args:
+        url (str): The full URL.
+        method (str): The HTTP method.
+        body (dict): JSON body to send.
+
+    Returns:
+        dict: The decoded response.
+    """
+    with request(url, method, body) as response:
+        return json.load(response)
+
+def stream(base_url, job_id, follow=False, offset=0):
+    """Print a job's tweets as they arrive.
+
+    Args:
+        base_url (str): The daemon address.
+        job_id (str): The job ID.
+        follow (bool): Keep the stream open until the job ends.
+        offset (int): Tweets to skip.
+
+    Returns:
+        int: Tweets printed.
+    """
+    printed = 0
+    url = f"{base_url}/jobs/{job_id}/tweets?offset={offset}&follow={int(follow)}"
+    with request(url) as response:
+        for line in response:
+            sys.stdout.write(line.decode('utf-8'))
+            sys.stdout.flush()
+            printed += 1
+    return printed
+
+def main():
+    """Main function for the daemon client."""
+    args = parse_args()
+    base_url = args.url.rstrip('/')
+    try:
+        if args.command == 'submit':
+            body = {'username': args.username.lstrip('@'), 'limit': args.limit, 'since': args.since, 'until': args.until}
+            job = call(f"{base_url}/jobs", 'POST', body)
+            if not args.follow:
+                print(json.dumps(job, indent=2))
+                return
+            print(f"Job {job['id']} queued for @{job['username']}", file=sys.stderr)
+            stream(base_url, job['id'], follow=True)
+            job = call(f"{base_url}/jobs/{job['id']}")
+            print(f"Job {job['id']} {job['status']}: {job['tweets']} tweets in {job['run_seconds'] or 0:.1f}s "
+                  f"after {job['queued_seconds']:.1f}s queued", file=sys.stderr)
+        elif args.command == 'status':
+            print(json.dumps(call(f"{base_url}/jobs/{args.job}" if args.job else f"{base_url}/jobs"), indent=2))
+        elif args.command == 'tweets':
+            stream(base_url, args.job, follow=args.follow, offset=args.offset)
+        elif args.command == 'cancel':
+            print(json.dumps(call(f"{base_url}/jobs/{args.job}", 'DELETE'), indent=2))
+        elif args.command == 'health':
+            print(json.dumps(call(f"{base_url}/health"), indent=2))
+    except HTTPError as e:
+        detail = e.read().decode('utf-8', 'replace')
+        try:
+            detail = json.loads(detail).get('error', detail)
+        except ValueError:
+            pass
+        sys.exit(f"Daemon answered {e.code}: {detail}")
+    except URLError as e:
+        sys.exit(f"Could not reach the daemon at {base_url}: {e.reason}. Start it with scripts/scraper_daemon.py")
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
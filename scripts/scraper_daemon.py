@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Script for running the scraper daemon with warm, logged-in browsers."""
+
+import os
+import sys
+import signal
+import threading
+import argparse
+from pathlib import Path
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.panel import Panel
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.daemon import BrowserPool, ScraperDaemon
+from src.scheduler import load_credentials
+from src.tweet.sinks import SINKS
+from src.config.settings import DAEMON_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Keep logged-in browsers warm and run scrape jobs submitted over a local HTTP API."
+    )
+    parser.add_argument('-b', '--browsers', type=int, default=DAEMON_SETTINGS['browsers'],
+                        help=f"Browsers kept warm (default: {DAEMON_SETTINGS['browsers']})")
+    parser.add_argument('--host', default=DAEMON_SETTINGS['host'], help=f"Interface to bind (default: {DAEMON_SETTINGS['host']})")
+    parser.add_argument('-p', '--port', type=int, default=DAEMON_SETTINGS['port'],
+                        help=f"Port of the job API (default: {DAEMON_SETTINGS['port']})")
+    parser.add_argument('--show-browser', action='store_true', help="Run browsers with a visible window")
+    parser.add_argument('--mode', choices=['batch', 'incremental', 'network', 'snapshot', 'element'], help="Extraction mode")
+    parser.add_argument('--engine', choices=['browser', 'http'], help="Scroll the page or page through the timeline API")
+    parser.add_argument('--lean', action='store_true', default=None, help="Block images, video, fonts and trackers")
+    parser.add_argument('--format', dest='formats', action='append', choices=list(SINKS),
+                        help="Output format, repeat for several (default: OUTPUT_SETTINGS['formats'])")
+    parser.add_argument('--since-last-run', action='store_true', default=None,
+                        help="Stop each job at the tweets saved by the last run of its profile")
+    parser.add_argument('--database', action='store_true', default=None, help="Also save tweets to the SQLite database")
+    parser.add_argument('--pipeline', action='store_true', default=None,
+                        help="Process each scroll's tweets on a worker thread while the browser scrolls on")
+    return parser.parse_args()
+
+def main():
+    """Main function for the scraper daemon."""
+    args = parse_args()
+
+    load_dotenv()
+    twitter_username = os.getenv('TWITTER_USERNAME')
+    twitter_password = os.getenv('TWITTER_PASSWORD')
+    if not twitter_username or not twitter_password:
+        console.print("[red]The daemon needs TWITTER_USERNAME and TWITTER_PASSWORD in .env[/red]")
+        return
+    token = os.getenv('SCRAPER_DAEMON_TOKEN')
+
+    pool = BrowserPool(args.browsers, twitter_username, twitter_password, {
+        'headless': not args.show_browser,
+        'extraction_mode': args.mode,
+        'engine': args.engine,
+        # Browsers sharing one Chrome profile would lock each other out
+        'account': twitter_username if args.browsers == 1 else None,
+        'lean': args.lean,
+        'output_formats': args.formats,
+        'since_last_run': args.since_last_run,
+        'database': args.database,
+        'credentials': load_credentials(),
+        'pipeline': args.pipeline
+    })
+
+    console.print(Panel.fit(
+        f"[bold blue]Scraper Daemon[/bold blue]\n"
+        f"[dim]{args.browsers} warm browsers at http://{args.host}:{args.port}[/dim]",
+        border_style="blue"
+    ))
+    with console.status(f"[bold blue]Starting {args.browsers} browsers and logging in...", spinner="dots"):
+        ready = pool.start()
+    if not ready:
+        console.print("[yellow]No browser is ready yet; jobs wait until one logs in.[/yellow]")
+
+    daemon = ScraperDaemon(pool, host=args.host, port=args.port, token=token)
+    try:
+        daemon.start()
+    except OSError as e:
+        console.print(f"[red]Could not start the job API: {str(e)}[/red]")
+        pool.close()
+        return
+    console.print(
+        f"[green]{ready} of {args.browsers} browsers ready. Serving jobs at http://{daemon.host}:{daemon.port}[/green]"
+        + (" [dim](token required)[/dim]" if token else '')
+    )
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
+    try:
+        while not stopping.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    console.print("\n[yellow]Stopping: cancelling jobs and closing browsers...[/yellow]")
+    daemon.stop()
+
+if __name__ == "__main__":
+    main()
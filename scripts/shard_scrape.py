@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Script for scraping one profile's history as parallel date windows."""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+from rich.console import Console
+from rich.panel import Panel
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.shards import ShardedScraper
+from src.scheduler import load_credentials
+from src.monitoring.profiling import PROFILE_SUFFIXES
+from src.tweet.sinks import SINKS
+from src.config.settings import SHARD_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+STATUS_STYLES = {
+    'queued': 'dim',
+    'retrying': 'yellow',
+    'done': 'green',
+    'empty': 'dim',
+    'failed': 'red'
+}
+
+def parse_date(value):
+    """Parse a date or date and time argument as UTC.
+
+    Args:
+        value (str): e.g. '2020-01-01' or '2020-01-01T12:00'.
+
+    Returns:
+        datetime: The time in UTC.
+    """
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a date like 2020-01-31")
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+def parse_args():
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Scrape one profile's history as date windows on a pool of browsers, merged into one output."
+    )
+    parser.add_argument('username', help="Profile to scrape (without @)")
+    parser.add_argument('--since', type=parse_date, help=f"Start of the history (default: {SHARD_SETTINGS['start']})")
+    parser.add_argument('--until', type=parse_date, help="End of the history (default: now)")
+    parser.add_argument('-w', '--workers', type=int, help="Concurrent browsers (default: CPU count)")
+    parser.add_argument('-r', '--retries', type=int, help="Extra attempts for a failed window")
+    parser.add_argument('--window-days', type=float, help="Size of the first windows, before the tweet density is known")
+    parser.add_argument('--target', type=int, help="Tweets each window is sized to hold")
+    parser.add_argument('--show-browser', action='store_true', help="Run browsers with a visible window")
+    parser.add_argument('--mode', choices=['batch', 'incremental', 'network', 'snapshot', 'element'], help="Extraction mode")
+    parser.add_argument('--lean', action='store_true', default=None, help="Block images, video, fonts and trackers")
+    parser.add_argument('--format', dest='formats', action='append', choices=list(SINKS),
+                        help="Output format, repeat for several (default: OUTPUT_SETTINGS['formats'])")
+    parser.add_argument('--compress', choices=['gzip', 'zstd'], help="Compress the output files")
+    parser.add_argument('--database', action='store_true', default=None,
+                        help="Also save the merged tweets to the SQLite database")
+    parser.add_argument('--keep-shards', action='store_true', help="Keep the per-window files after merging")
+    parser.add_argument('--profile', choices=list(PROFILE_SUFFIXES), help="Save a profile of each window's run")
+    return parser.parse_args()
+
+def main():
+    """Main function for the sharded scraping script."""
+    args = parse_args()
+
+    load_dotenv()
+    twitter_username = os.getenv('TWITTER_USERNAME')
+    twitter_password = os.getenv('TWITTER_PASSWORD')
+    if not twitter_username or not twitter_password:
+        console.print("[red]Sharded mode needs TWITTER_USERNAME and TWITTER_PASSWORD in .env[/red]")
+        return
+
+    if args.keep_shards:
+        SHARD_SETTINGS['keep_shards'] = True
+
+    scraper = ShardedScraper(
+        twitter_username, twitter_password,
+        workers=args.workers,
+        retries=args.retries,
+        headless=not args.show_browser,
+        extraction_mode=args.mode,
+        lean=args.lean,
+        output_formats=args.formats,
+        compression=args.compress,
+        database=args.database,
+        credentials=load_credentials(),
+        profile=args.profile,
+        window=timedelta(days=args.window_days) if args.window_days else None,
+        target=args.target
+    )
+    username = args.username.lstrip('@')
+
+    console.print(Panel.fit(
+        f"[bold blue]Sharded Twitter Scraper[/bold blue]\n"
+        f"[dim]@{username} as date windows on {scraper.workers} workers[/dim]",
+        border_style="blue"
+    ))
+
+    def report(window, status, result):
+        if status == 'queued':
+            return
+        style = STATUS_STYLES.get(status, '')
+        span = f"{window[0]:%Y-%m-%d %H:%M} → {window[1]:%Y-%m-%d %H:%M}"
+        detail = f" ({result['tweets']} tweets in {result['duration']:.0f}s)" if status in ('done', 'empty') else ''
+        if result and result['error']:
+            detail = f" ({result['error']})"
+        console.print(f"[{style}]{span}: {status}{detail}[/{style}]")
+
+    started = time.time()
+    try:
+        result = scraper.run(username, since=args.since, until=args.until, progress_callback=report)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Sharded scrape interrupted by user.[/yellow]")
+        return
+    elapsed = time.time() - started
+
+    failed = [window for window in result['windows'] if window['status'] == 'failed']
+    lines = [
+        f"[bold blue]{result['tweets']}[/bold blue] tweets from [bold]{len(result['windows'])}[/bold] windows "
+        f"in {elapsed:.0f}s"
+    ]
+    lines.extend(f"📁 {path}" for path in result['files'])
+    if failed:
+        lines.append(f"[red]{len(failed)} windows failed; their shards are kept in {SHARD_SETTINGS['directory']}[/red]")
+    console.print(Panel("\n".join(lines), border_style="yellow" if failed else "green"))
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Twitter scraping package."""
 
 from .scraper import TwitterScraper
+from .async_scraper import AsyncTwitterScraper
 
 __version__ = '1.0.0'
-__all__ = ['TwitterScraper'] 
\ No newline at end of file
+__all__ = ['TwitterScraper', 'AsyncTwitterScraper'] 
\ No newline at end of file
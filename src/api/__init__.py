@@ -0,0 +1,5 @@
+"""Direct timeline API access package."""
+
+from .timeline_client import TimelineClient
+
+__all__ = ['TimelineClient']
@@ -0,0 +1,183 @@
+"""HTTP timeline client that reuses an authenticated browser session."""
+
+import json
+from rich.console import Console
+
+from ..config.settings import SITE_SETTINGS, API_SETTINGS
+from ..scheduler import RateLimitError
+from ..tweet.timeline_parser import TimelineParser
+
+# Initialize Rich console
+console = Console()
+
+class TimelineClient:
+    """Pages through timeline GraphQL endpoints over a pooled HTTP connection."""
+
+    def __init__(self, cookies=None, user_agent=None, http2=None):
+        """Initialize the timeline client.
+
+        Args:
+            cookies (dict): Session cookies by name.
+            user_agent (str): User agent to send, ideally the browser's own.
+            http2 (bool): Whether to negotiate HTTP/2. Defaults to API_SETTINGS['http2'].
+        """
+        import httpx
+
+        self.cookies = cookies or {}
+        self.parser = TimelineParser()
+        self.request_count = 0
+
+        if http2 is None:
+            http2 = API_SETTINGS['http2']
+
+        limits = httpx.Limits(
+            max_connections=API_SETTINGS['max_connections'],
+            max_keepalive_connections=API_SETTINGS['max_connections']
+        )
+        client_args = {
+            'headers': self.build_headers(user_agent),
+            'cookies': self.cookies,
+            'timeout': API_SETTINGS['timeout'],
+            'limits': limits,
+            'follow_redirects': True
+        }
+
+        try:
+            self.client = httpx.Client(http2=http2, **client_args)
+        except ImportError:
+            # HTTP/2 support needs the optional h2 package
+            self.client = httpx.Client(**client_args)
+
+    @classmethod
+    def from_driver(cls, driver, http2=None):
+        """Create a client from a logged-in Selenium driver's session.
+
+        Args:
+            driver: The Selenium WebDriver holding the session.
+            http2 (bool): Whether to negotiate HTTP/2.
+
+        Returns:
+            TimelineClient: A client authenticated as the browser is.
+        """
+        cookies = {cookie['name']: cookie['value'] for cookie in driver.get_cookies()}
+        user_agent = driver.execute_script("return navigator.userAgent")
+        return cls(cookies=cookies, user_agent=user_agent, http2=http2)
+
+    def build_headers(self, user_agent=None):
+        """Build the headers the web app sends with GraphQL requests.
+
+        Args:
+            user_agent (str): User agent to send.
+
+        Returns:
+            dict: Request headers.
+        """
+        headers = {
+            'authorization': f"Bearer {API_SETTINGS['bearer_token']}",
+            'content-type': 'application/json',
+            'x-twitter-active-user': 'yes',
+            'x-twitter-client-language': 'en'
+        }
+        if user_agent:
+            headers['user-agent'] = user_agent
+
+        # Authenticated requests must echo the ct0 cookie as the CSRF token
+        csrf_token = self.cookies.get('ct0')
+        if csrf_token:
+            headers['x-csrf-token'] = csrf_token
+            headers['x-twitter-auth-type'] = 'OAuth2Session'
+        return headers
+
+    def request(self, operation, variables):
+        """Call a GraphQL operation.
+
+        Args:
+            operation (str): The operation name, e.g. 'UserTweets'.
+            variables (dict): The operation variables.
+
+        Returns:
+            dict: The decoded response payload.
+
+        Raises:
+            RateLimitError: If the server throttled the request.
+        """
+        url = f"{SITE_SETTINGS['base_url']}/i/api/graphql/{API_SETTINGS['query_ids'][operation]}/{operation}"
+        params = {
+            'variables': json.dumps(variables, separators=(',', ':')),
+            'features': json.dumps(API_SETTINGS['features'], separators=(',', ':'))
+        }
+
+        self.request_count += 1
+        response = self.client.get(url, params=params)
+        reset_at = response.headers.get('x-rate-limit-reset')
+        reset_at = float(reset_at) if reset_at and reset_at.isdigit() else None
+        if response.status_code == 429:
+            raise RateLimitError(f"{operation} returned HTTP 429", reset_at)
+        response.raise_for_status()
+
+        payload = response.json()
+        # Error code 88 is the API's own rate limit, sometimes sent with a 200
+        for error in payload.get('errors') or []:
+            if error.get('code') == 88:
+                raise RateLimitError(error.get('message') or "Rate limit exceeded", reset_at)
+        return payload
+
+    def get_user_id(self, screen_name):
+        """Resolve a screen name to the user's numeric ID.
+
+        Args:
+            screen_name (str): The Twitter username.
+
+        Returns:
+            str: The user's rest ID.
+        """
+        payload = self.request('UserByScreenName', {
+            'screen_name': screen_name,
+            'withSafetyModeUserFields': True
+        })
+        user_id = (((payload.get('data') or {}).get('user') or {}).get('result') or {}).get('rest_id')
+        if not user_id:
+            raise Exception(f"User @{screen_name} not found.")
+        return user_id
+
+    def iter_pages(self, user_id, cursor=None, max_pages=None):
+        """Page through a user's timeline, oldest pages last.
+
+        Args:
+            user_id (str): The user's rest ID.
+            cursor (str): Bottom cursor to resume from, if any.
+            max_pages (int): Stop after this many pages.
+
+        Yields:
+            dict: Each timeline response payload.
+        """
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            variables = {
+                'userId': user_id,
+                'count': API_SETTINGS['page_size'],
+                'includePromotedContent': False,
+                'withQuickPromoteEligibilityTweetFields': False,
+                'withVoice': True,
+                'withV2Timeline': True
+            }
+            if cursor:
+                variables['cursor'] = cursor
+
+            payload = self.request('UserTweets', variables)
+            pages += 1
+            yield payload
+
+            next_cursor = self.parser.extract_cursor(payload)
+            has_tweets = any(self.parser.extract_tweet_results(entry) for entry in self.parser.iter_entries(payload))
+            # The API keeps returning a cursor on empty pages at the end
+            if not next_cursor or next_cursor == cursor or not has_tweets:
+                break
+            cursor = next_cursor
+
+    def close(self):
+        """Close the pooled connections."""
+        try:
+            self.client.close()
+        except:
+            pass
@@ -0,0 +1,415 @@
+"""Asyncio scraper that drives many timelines as tabs of one Chrome process."""
+
+import json
+import random
+import asyncio
+import itertools
+import urllib.request
+from rich.console import Console
+
+from .browser.browser_manager import BrowserManager
+from .browser.session_store import SessionStore
+from .tweet.processor import TweetProcessor
+from .tweet.dedup_index import DedupIndex
+from .tweet.file_handler import TweetFileHandler
+from .tweet.database import TweetDatabase
+from .tweet.scripts import EXTRACT_ARTICLES_SCRIPT, DRAIN_NEW_ARTICLES_SCRIPT, SCROLL_AND_WAIT_SCRIPT
+from .config.settings import (
+    SCROLL_SETTINGS, LEAN_SETTINGS, SITE_SETTINGS, SESSION_SETTINGS, EXTRACTION_SETTINGS, ASYNC_SETTINGS,
+    DEDUP_SETTINGS, DATABASE_SETTINGS
+)
+
+# Initialize Rich console
+console = Console()
+
+class CDPSession:
+    """A Chrome DevTools Protocol connection to one target over a websocket."""
+
+    def __init__(self, websocket_url, event_handler=None):
+        """Initialize the session.
+
+        Args:
+            websocket_url (str): The target's webSocketDebuggerUrl.
+            event_handler: Called with (method, params) for each event the target sends.
+        """
+        self.websocket_url = websocket_url
+        self.event_handler = event_handler
+        self.websocket = None
+        self.reader = None
+        self.ids = itertools.count(1)
+        self.pending = {}
+
+    async def connect(self):
+        """Open the websocket and start dispatching replies."""
+        import websockets
+
+        self.websocket = await websockets.connect(self.websocket_url, max_size=None)
+        self.reader = asyncio.ensure_future(self.read_loop())
+
+    async def read_loop(self):
+        """Resolve pending commands as their replies arrive and hand events to the event handler."""
+        try:
+            async for message in self.websocket:
+                reply = json.loads(message)
+                if 'id' not in reply:
+                    if self.event_handler and 'method' in reply:
+                        self.event_handler(reply['method'], reply.get('params') or {})
+                    continue
+                future = self.pending.pop(reply.get('id'), None)
+                if future and not future.done():
+                    if 'error' in reply:
+                        future.set_exception(Exception(reply['error'].get('message', 'CDP error')))
+                    else:
+                        future.set_result(reply.get('result', {}))
+        except Exception as e:
+            error = e
+        else:
+            error = Exception("CDP connection closed")
+
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self.pending.clear()
+
+    async def send(self, method, params=None):
+        """Send a CDP command and wait for its result.
+
+        Args:
+            method (str): The CDP method, e.g. 'Page.navigate'.
+            params (dict): The command parameters.
+
+        Returns:
+            dict: The command result.
+        """
+        command_id = next(self.ids)
+        future = asyncio.get_running_loop().create_future()
+        self.pending[command_id] = future
+        await self.websocket.send(json.dumps({'id': command_id, 'method': method, 'params': params or {}}))
+        return await asyncio.wait_for(future, ASYNC_SETTINGS['command_timeout'])
+
+    async def execute_script(self, script, *args):
+        """Run a WebDriver-style script body and return its value.
+
+        Scripts written for execute_script use 'return' and 'arguments', so
+        they are wrapped in a function applied to the given arguments.
+
+        Args:
+            script (str): The script body.
+            *args: JSON-serializable values exposed as 'arguments'.
+
+        Returns:
+            The script's return value.
+        """
+        expression = f"(function() {{\n{script}\n}}).apply(null, {json.dumps(list(args))})"
+        result = await self.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': True
+        })
+        if 'exceptionDetails' in result:
+            raise Exception(result['exceptionDetails'].get('text', 'Script error'))
+        return result.get('result', {}).get('value')
+
+    async def execute_async_script(self, script, *args):
+        """Run a WebDriver-style async script body and return the value it reports.
+
+        As with execute_async_script, the last argument is the callback the
+        script calls with its result.
+
+        Args:
+            script (str): The script body.
+            *args: JSON-serializable values exposed as 'arguments'.
+
+        Returns:
+            The value passed to the callback.
+        """
+        expression = (
+            f"new Promise(function(resolve) {{ (function() {{\n{script}\n}})"
+            f".apply(null, {json.dumps(list(args))}.concat([resolve])); }})"
+        )
+        result = await self.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': True
+        })
+        if 'exceptionDetails' in result:
+            raise Exception(result['exceptionDetails'].get('text', 'Script error'))
+        return result.get('result', {}).get('value')
+
+    async def close(self):
+        """Close the websocket."""
+        try:
+            await self.websocket.close()
+        except:
+            pass
+        if self.reader:
+            self.reader.cancel()
+
+class AsyncTwitterScraper:
+    """Scrapes several profiles concurrently, one tab each, in a single browser."""
+
+    def __init__(self, headless=False, tabs=None, extraction_mode=None, lean=None, output_formats=None,
+                 compression=None, skip_known=None, database=None):
+        """Initialize the async scraper.
+
+        Args:
+            headless (bool): Whether to run the browser in headless mode.
+            tabs (int): Profiles scraped at once. Defaults to ASYNC_SETTINGS['tabs'].
+            extraction_mode (str): 'batch' or 'incremental'. Defaults to EXTRACTION_SETTINGS['mode']
+                when that is an in-page mode, otherwise 'batch'.
+            lean (bool): Whether to block media, fonts and trackers. Defaults to LEAN_SETTINGS['enabled'].
+            output_formats (list): Output formats to write. Defaults to OUTPUT_SETTINGS['formats'].
+            compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+            skip_known (bool): Whether to skip tweets saved by earlier runs of the same profile.
+                Defaults to DEDUP_SETTINGS['enabled'].
+            database (bool): Whether to also save tweets to the SQLite database. Defaults to DATABASE_SETTINGS['enabled'].
+        """
+        mode = extraction_mode or EXTRACTION_SETTINGS['mode']
+        self.extraction_mode = mode if mode in ('batch', 'incremental') else 'batch'
+        self.tabs = tabs or ASYNC_SETTINGS['tabs']
+        self.output_formats = output_formats
+        self.compression = compression
+        self.skip_known = DEDUP_SETTINGS['enabled'] if skip_known is None else skip_known
+        use_database = DATABASE_SETTINGS['enabled'] if database is None else database
+        self.database = TweetDatabase() if use_database else None
+        # Background tabs must keep running timers and loading content
+        self.lean = LEAN_SETTINGS['enabled'] if lean is None else lean
+        self.browser = BrowserManager(headless, extra_options=ASYNC_SETTINGS['chrome_options'], lean=self.lean)
+        self.is_logged_in = False
+        self.session_store = SessionStore() if SESSION_SETTINGS['enabled'] else None
+        self.debugger_address = self.browser.driver.capabilities['goog:chromeOptions']['debuggerAddress']
+        self.browser_session = None
+
+    def login(self, username, password):
+        """Login to Twitter once; every tab shares the session.
+
+        Args:
+            username (str): Twitter username or email.
+            password (str): Twitter password.
+
+        Returns:
+            bool: True if login was successful, False otherwise.
+        """
+        self.is_logged_in = self.browser.login(username, password, session_store=self.session_store)
+        return self.is_logged_in
+
+    def get_browser_websocket_url(self):
+        """Look up the browser-level DevTools websocket.
+
+        Returns:
+            str: The browser's webSocketDebuggerUrl.
+        """
+        with urllib.request.urlopen(f"http://{self.debugger_address}/json/version") as response:
+            return json.load(response)['webSocketDebuggerUrl']
+
+    async def open_tab(self):
+        """Open a new tab and connect to it.
+
+        Returns:
+            tuple: (target ID, connected CDPSession).
+        """
+        target = await self.browser_session.send('Target.createTarget', {'url': 'about:blank'})
+        target_id = target['targetId']
+        # Blocking set up by the browser manager only covers its own tab
+        event_handler = self.browser.count_network_event if self.lean else None
+        session = CDPSession(f"ws://{self.debugger_address}/devtools/page/{target_id}", event_handler)
+        try:
+            await session.connect()
+            await session.send('Page.enable')
+            if self.lean:
+                await session.send('Network.enable')
+                await session.send('Network.setBlockedURLs', {'urls': LEAN_SETTINGS['blocked_urls']})
+            # Keep the tab behaving like a focused, visible one
+            await session.send('Emulation.setFocusEmulationEnabled', {'enabled': True})
+        except Exception:
+            await self.close_tab(target_id, session)
+            raise
+        return target_id, session
+
+    async def close_tab(self, target_id, session):
+        """Disconnect from and close a tab.
+
+        Args:
+            target_id (str): The tab's target ID.
+            session (CDPSession): The tab's session.
+        """
+        await session.close()
+        try:
+            await self.browser_session.send('Target.closeTarget', {'targetId': target_id})
+        except Exception:
+            pass
+
+    async def wait_for_articles(self, session):
+        """Wait until the profile has rendered its first tweet.
+
+        Args:
+            session (CDPSession): The tab's session.
+
+        Returns:
+            bool: True if tweets appeared before the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + ASYNC_SETTINGS['load_timeout']
+        while loop.time() < deadline:
+            count = await session.execute_script("return document.querySelectorAll('article[role=\"article\"]').length")
+            if count:
+                return True
+            await asyncio.sleep(0.25)
+        return False
+
+    async def scroll(self, session):
+        """Scroll one step and wait for content without blocking other tabs.
+
+        Args:
+            session (CDPSession): The tab's session.
+        """
+        if SCROLL_SETTINGS['wait_mode'] == 'event':
+            await session.execute_async_script(
+                "arguments[0] = Math.round(window.innerHeight * arguments[0]);\n" + SCROLL_AND_WAIT_SCRIPT,
+                SCROLL_SETTINGS['scroll_increment'],
+                int(SCROLL_SETTINGS['event_timeout'] * 1000),
+                int(random.uniform(*SCROLL_SETTINGS['event_min_wait']) * 1000)
+            )
+            return
+
+        steps = SCROLL_SETTINGS['scroll_steps']
+        for _ in range(steps):
+            await session.execute_script(
+                "window.scrollBy(0, window.innerHeight * arguments[0] / arguments[1]);",
+                SCROLL_SETTINGS['scroll_increment'], steps
+            )
+            await asyncio.sleep(random.uniform(SCROLL_SETTINGS['min_scroll_wait'], SCROLL_SETTINGS['max_scroll_wait']))
+        await asyncio.sleep(random.uniform(*SCROLL_SETTINGS['content_load_wait']))
+
+    async def scrape_profile(self, username, progress_callback=None):
+        """Scrape one profile in its own tab.
+
+        Tweets are only counted; they are in the output files, which are
+        written as the tab scrolls.
+
+        Args:
+            username (str): The Twitter username to scrape.
+            progress_callback: Called with (username, description).
+
+        Returns:
+            dict: Result with the username, number of tweets saved, main output file and all output files.
+        """
+        processor = TweetProcessor()
+        file_handler = TweetFileHandler(self.output_formats, self.compression, self.database)
+        tweet_count = 0
+
+        if self.extraction_mode == 'incremental':
+            script, args = DRAIN_NEW_ARTICLES_SCRIPT, (EXTRACTION_SETTINGS['incremental_max_attempts'],)
+        else:
+            script, args = EXTRACT_ARTICLES_SCRIPT, ()
+
+        target_id, session = None, None
+        try:
+            if self.skip_known:
+                processor.dedup_index = DedupIndex(username)
+            file_handler.initialize_file(username)
+            target_id, session = await self.open_tab()
+            await session.send('Page.navigate', {'url': f"{SITE_SETTINGS['base_url']}/{username}"})
+            if not await self.wait_for_articles(session):
+                console.print(f"[red]No tweets found on @{username}. Please check the username.[/red]")
+                return {
+                    'username': username, 'tweets': tweet_count,
+                    'file': file_handler.current_file, 'files': file_handler.current_files
+                }
+
+            last_height = 0
+            no_height_change = 0
+            while no_height_change < SCROLL_SETTINGS['max_retries']:
+                result = await session.execute_script(script, *args) or {}
+
+                for payload in result.get('articles') or []:
+                    tweet_data = processor.process_payload(payload)
+                    if tweet_data:
+                        file_handler.save_tweet(tweet_data)
+                        tweet_count += 1
+                saved = file_handler.checkpoint(wait=processor.dedup_index is not None)
+                if saved and processor.dedup_index is not None:
+                    processor.dedup_index.flush()
+
+                if progress_callback:
+                    progress_callback(username, f"Collecting tweets... ({tweet_count} found)")
+
+                current_height = result.get('height', 0)
+                if current_height == last_height:
+                    no_height_change += 1
+                else:
+                    no_height_change = 0
+                last_height = current_height
+
+                await self.scroll(session)
+
+        except Exception as e:
+            console.print(f"[red]Error scraping @{username}: {str(e)}[/red]")
+
+        finally:
+            if session is not None:
+                await self.close_tab(target_id, session)
+            saved = file_handler.close()
+            if processor.dedup_index is not None:
+                processor.dedup_index.close(commit=saved)
+
+        return {
+            'username': username, 'tweets': tweet_count,
+            'file': file_handler.current_file, 'files': file_handler.current_files
+        }
+
+    async def scrape_profiles(self, usernames, progress_callback=None):
+        """Scrape profiles concurrently, at most `tabs` at a time.
+
+        Args:
+            usernames (list): Profiles to scrape.
+            progress_callback: Called with (username, description).
+
+        Returns:
+            list: One result per profile, in input order.
+        """
+        semaphore = asyncio.Semaphore(self.tabs)
+
+        async def run(username):
+            async with semaphore:
+                return await self.scrape_profile(username, progress_callback)
+
+        self.browser_session = CDPSession(self.get_browser_websocket_url())
+        await self.browser_session.connect()
+        try:
+            return await asyncio.gather(*(run(username) for username in usernames))
+        finally:
+            await self.browser_session.close()
+            self.browser_session = None
+
+    def get_tweets_for_profiles(self, usernames, progress_callback=None):
+        """Synchronous entry point for scrape_profiles.
+
+        Args:
+            usernames (list): Profiles to scrape.
+            progress_callback: Called with (username, description).
+
+        Returns:
+            list: One result per profile, in input order.
+        """
+        return asyncio.run(self.scrape_profiles(usernames, progress_callback))
+
+    def report_network_savings(self):
+        """Print what lean mode kept off the wire across all tabs.
+
+        Returns:
+            dict: The browser's network report.
+        """
+        report = self.browser.get_network_report()
+        console.print(
+            f"[dim]Lean mode blocked {report['blocked_requests']} requests "
+            f"(~{report['estimated_bytes_saved'] / 1e6:.1f} MB saved), "
+            f"downloaded {report['bytes_received'] / 1e6:.1f} MB in {report['requests']} requests.[/dim]"
+        )
+        return report
+
+    def close(self):
+        """Close the browser and clean up."""
+        if self.database is not None:
+            self.database.close()
+        self.browser.close()
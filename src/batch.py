@@ -0,0 +1,259 @@
+"""Batch scraping of many profiles with a pool of worker processes."""
+
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from rich.console import Console
+
+from .config.settings import BATCH_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+def scrape_profile_job(job):
+    """Scrape one profile in a worker process.
+
+    Runs at module level so it can be pickled into the pool. Each call owns
+    its Chrome instance from launch to quit.
+
+    Args:
+        job (dict): Job description with username, credentials and scraper options.
+
+    Returns:
+        dict: The job result with status, tweet count, output file, timing and
+            the run's metrics summary.
+    """
+    from .scraper import TwitterScraper
+
+    started = time.time()
+    result = {
+        'username': job['username'],
+        'attempt': job['attempt'],
+        'status': 'failed',
+        'tweets': 0,
+        'file': None,
+        'error': None,
+        'duration': 0.0,
+        'metrics': None
+    }
+
+    scraper = None
+    try:
+        # Retries back off inside the worker so the parent keeps collecting results
+        if job.get('delay'):
+            time.sleep(job['delay'])
+        
+        scraper = TwitterScraper(
+            headless=job['headless'],
+            extraction_mode=job.get('extraction_mode'),
+            engine=job.get('engine'),
+            lean=job.get('lean'),
+            output_formats=job.get('output_formats'),
+            compression=job.get('compression'),
+            skip_known=job.get('skip_known'),
+            since_last_run=job.get('since_last_run'),
+            database=job.get('database'),
+            credentials=job.get('credentials'),
+            profile=job.get('profile'),
+            prune=job.get('prune'),
+            pipeline=job.get('pipeline')
+        )
+        if not scraper.login(job['login_username'], job['login_password']):
+            result['error'] = "Login failed"
+            return result
+
+        # Only the count crosses the process boundary, so don't keep the tweets
+        tweet_count = scraper.get_tweets(job['username'], retain=False)
+        result['tweets'] = tweet_count
+        result['file'] = scraper.file_handler.current_file
+        result['status'] = 'done' if tweet_count else 'empty'
+        result['metrics'] = scraper.metrics.summary()
+
+    except Exception as e:
+        result['error'] = str(e)
+
+    finally:
+        if scraper:
+            scraper.close()
+        result['duration'] = time.time() - started
+
+    return result
+
+class BatchScraper:
+    """Runs scrape jobs for many profiles through a process pool."""
+
+    def __init__(self, login_username, login_password, workers=None, retries=None,
+                 headless=True, extraction_mode=None, engine=None, lean=None, output_formats=None,
+                 compression=None, skip_known=None, since_last_run=None,
+                 database=None, credentials=None, profile=None, prune=None, pipeline=None):
+        """Initialize the batch scraper.
+
+        Args:
+            login_username (str): Twitter username or email used by every worker.
+            login_password (str): Twitter password.
+            workers (int): Concurrent browsers. Defaults to BATCH_SETTINGS or the CPU count.
+            retries (int): Extra attempts for a failed job. Defaults to BATCH_SETTINGS['retries'].
+            headless (bool): Whether the browsers run headless.
+            extraction_mode (str): Passed to each TwitterScraper.
+            engine (str): Passed to each TwitterScraper.
+            lean (bool): Passed to each TwitterScraper.
+            output_formats (list): Passed to each TwitterScraper.
+            compression (str): Passed to each TwitterScraper.
+            skip_known (bool): Passed to each TwitterScraper.
+            since_last_run (bool): Passed to each TwitterScraper.
+            database (bool): Passed to each TwitterScraper.
+            credentials (list): (username, password) tuples each worker rotates
+                through when rate limited.
+            profile (str): Passed to each TwitterScraper.
+            prune (bool): Passed to each TwitterScraper.
+            pipeline (bool): Passed to each TwitterScraper.
+        """
+        self.login_username = login_username
+        self.login_password = login_password
+        self.workers = workers or BATCH_SETTINGS['workers'] or os.cpu_count() or 1
+        self.retries = BATCH_SETTINGS['retries'] if retries is None else retries
+        self.headless = headless
+        self.extraction_mode = extraction_mode
+        self.engine = engine
+        self.lean = lean
+        self.output_formats = output_formats
+        self.compression = compression
+        self.skip_known = skip_known
+        self.since_last_run = since_last_run
+        self.database = database
+        self.credentials = credentials
+        self.profile = profile
+        self.prune = prune
+        self.pipeline = pipeline
+        self.statuses = {}
+
+    def build_job(self, username, attempt):
+        """Build the job description sent to a worker.
+
+        Args:
+            username (str): Profile to scrape.
+            attempt (int): One-based attempt number.
+
+        Returns:
+            dict: The job description.
+        """
+        return {
+            'username': username,
+            'attempt': attempt,
+            'login_username': self.login_username,
+            'login_password': self.login_password,
+            'headless': self.headless,
+            'extraction_mode': self.extraction_mode,
+            'engine': self.engine,
+            'lean': self.lean,
+            'output_formats': self.output_formats,
+            'compression': self.compression,
+            'skip_known': self.skip_known,
+            'since_last_run': self.since_last_run,
+            'database': self.database,
+            'credentials': self.credentials,
+            'profile': self.profile,
+            'prune': self.prune,
+            'pipeline': self.pipeline,
+            'delay': BATCH_SETTINGS['retry_delay'] * (attempt - 1)
+        }
+
+    def set_status(self, username, status, progress_callback=None, result=None):
+        """Record a job's status and report it.
+
+        Args:
+            username (str): The job's profile.
+            status (str): 'queued', 'retrying', 'done', 'empty' or 'failed'.
+            progress_callback: Called with (username, status, result).
+            result (dict): The latest job result, if any.
+        """
+        self.statuses[username] = status
+        if progress_callback:
+            progress_callback(username, status, result)
+
+    def run(self, usernames, progress_callback=None):
+        """Scrape every profile and return one result per profile.
+
+        Args:
+            usernames (list): Profiles to scrape. Duplicates are ignored.
+            progress_callback: Called with (username, status, result) on each status change.
+
+        Returns:
+            list: Final job results in input order.
+        """
+        usernames = list(dict.fromkeys(name.strip().lstrip('@') for name in usernames if name.strip()))
+        results = {}
+        pending = {}
+        pool = self.create_pool()
+
+        def submit(username, attempt):
+            nonlocal pool
+            try:
+                future = pool.submit(scrape_profile_job, self.build_job(username, attempt))
+            except BrokenProcessPool:
+                # A crashed worker poisons the whole pool, so start a fresh one
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = self.create_pool()
+                future = pool.submit(scrape_profile_job, self.build_job(username, attempt))
+            pending[future] = (username, attempt)
+
+        try:
+            for username in usernames:
+                self.set_status(username, 'queued', progress_callback)
+                submit(username, 1)
+
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    username, attempt = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # The worker process itself died, e.g. Chrome took it down
+                        result = {
+                            'username': username, 'attempt': attempt, 'status': 'failed',
+                            'tweets': 0, 'file': None, 'error': str(e) or type(e).__name__, 'duration': 0.0,
+                            'metrics': None
+                        }
+
+                    results[username] = result
+                    if result['status'] == 'failed' and attempt <= self.retries:
+                        self.set_status(username, 'retrying', progress_callback, result)
+                        submit(username, attempt + 1)
+                    else:
+                        self.set_status(username, result['status'], progress_callback, result)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        return [results[username] for username in usernames]
+
+    def create_pool(self):
+        """Create the worker process pool.
+
+        Spawned workers share no browser or parser state with the parent,
+        and one task per child process releases Chrome's memory between jobs.
+
+        Returns:
+            ProcessPoolExecutor: The pool.
+        """
+        context = multiprocessing.get_context('spawn')
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=context, max_tasks_per_child=1)
+
+    @staticmethod
+    def summarize(results):
+        """Aggregate job results into run totals.
+
+        Args:
+            results (list): Job results returned by run().
+
+        Returns:
+            dict: Counts by status, total tweets and total worker time.
+        """
+        summary = {'jobs': len(results), 'done': 0, 'empty': 0, 'failed': 0, 'tweets': 0, 'duration': 0.0}
+        for result in results:
+            summary[result['status']] += 1
+            summary['tweets'] += result['tweets']
+            summary['duration'] += result['duration']
+        return summary
@@ -1,5 +1,7 @@
 """Browser management package."""
 
 from .browser_manager import BrowserManager
+from .session_store import SessionStore
+from .scroll_tuner import ScrollTuner
 
-__all__ = ['BrowserManager'] 
\ No newline at end of file
+__all__ = ['BrowserManager', 'SessionStore', 'ScrollTuner'] 
\ No newline at end of file
@@ -1,7 +1,10 @@
 """Browser management module for Twitter scraping."""
 
+import json
 import time
+import base64
 import random
+from collections import Counter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -11,7 +14,11 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from rich.console import Console
 
-from ..config.settings import USER_AGENTS, CHROME_OPTIONS, SCROLL_SETTINGS
+from ..tweet.scripts import SCROLL_AND_WAIT_SCRIPT, DETECT_ERROR_SCRIPT, PRUNE_ARTICLES_SCRIPT
+from ..config.settings import (
+    USER_AGENTS, CHROME_OPTIONS, SCROLL_SETTINGS, TUNER_SETTINGS, SITE_SETTINGS, SESSION_SETTINGS, LEAN_SETTINGS,
+    RATE_LIMIT_SETTINGS
+)
 
 # Initialize Rich console
 console = Console()
@@ -19,13 +26,37 @@ console = Console()
 class BrowserManager:
     """Manages browser operations for Twitter scraping."""
     
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, capture_network=False, extra_options=None, profile_dir=None, lean=False):
         """Initialize the browser manager.
         
         Args:
             headless (bool): Whether to run the browser in headless mode.
+            capture_network (bool): Whether to record network traffic through CDP
+                performance logging so responses can be read back.
+            extra_options (list): Chrome arguments added after CHROME_OPTIONS.
+            profile_dir (str): Chrome user-data-dir to reuse between runs.
+            lean (bool): Whether to block images, video, fonts and trackers.
         """
         self.headless = headless
+        self.capture_network = capture_network
+        self.extra_options = extra_options or []
+        self.profile_dir = profile_dir
+        self.lean = lean
+        self.session_restored = False
+        self.last_scroll = None
+        self.pending_responses = {}
+        self.response_filter = None
+        self.captured_responses = []
+        self.request_types = {}
+        self.throttled_responses = 0
+        self.rate_limit_reset = None
+        self.metrics = None
+        self.network_stats = {
+            'requests': 0,
+            'bytes_received': 0,
+            'blocked_requests': Counter(),
+            'estimated_bytes_saved': 0
+        }
         self.driver = None
         self.wait = None
         self.setup_driver()
@@ -38,19 +69,270 @@ class BrowserManager:
             chrome_options.add_argument("--headless")
         
         # Add performance optimizations
-        for option in CHROME_OPTIONS:
+        for option in CHROME_OPTIONS + self.extra_options:
             chrome_options.add_argument(option)
         
+        # Reuse a persistent profile so its login survives between runs
+        if self.profile_dir:
+            chrome_options.add_argument(f"--user-data-dir={self.profile_dir}")
+        
         # Add random user agent
         chrome_options.add_argument(f"user-agent={random.choice(USER_AGENTS)}")
         
+        # Stop the content settings we never read from loading at all
+        if self.lean:
+            chrome_options.add_experimental_option('prefs', LEAN_SETTINGS['prefs'])
+        
+        # Record network events in the performance log
+        if self.capture_network or self.lean:
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            chrome_options.add_experimental_option('perfLoggingPrefs', {
+                'enableNetwork': True,
+                'enablePage': False
+            })
+        
         service = Service()
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.wait = WebDriverWait(self.driver, 10)
+        self.driver.set_script_timeout(max(SCROLL_SETTINGS['event_timeout'], TUNER_SETTINGS['max_timeout']) + 10)
+        
+        if self.capture_network or self.lean:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+        
+        if self.lean:
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_SETTINGS['blocked_urls']})
 
-    def smart_scroll(self):
+    def read_network_events(self):
+        """Drain the performance log and process its network events.
+        
+        Updates the traffic statistics and fetches the bodies of finished
+        responses accepted by the current response filter.
+        """
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception as e:
+            console.print(f"[red]Network capture error: {str(e)}[/red]")
+            return
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except:
+                continue
+            
+            method = message.get('method')
+            params = message.get('params') or {}
+            request_id = params.get('requestId')
+            self.count_network_event(method, params)
+            
+            if method == 'Network.responseReceived':
+                response = params.get('response') or {}
+                url = response.get('url', '')
+                if response.get('status') == 429:
+                    self.throttled_responses += 1
+                    headers = {name.lower(): value for name, value in (response.get('headers') or {}).items()}
+                    reset_at = str(headers.get('x-rate-limit-reset', ''))
+                    if reset_at.isdigit():
+                        self.rate_limit_reset = float(reset_at)
+                if self.response_filter and self.response_filter(url):
+                    self.pending_responses[request_id] = url
+            
+            elif method == 'Network.loadingFailed':
+                self.pending_responses.pop(request_id, None)
+            
+            elif method == 'Network.loadingFinished':
+                if request_id in self.pending_responses:
+                    url = self.pending_responses.pop(request_id)
+                    try:
+                        body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                        content = body.get('body', '')
+                        if body.get('base64Encoded'):
+                            content = base64.b64decode(content).decode('utf-8')
+                        self.captured_responses.append((url, json.loads(content)))
+                    except Exception as e:
+                        console.print(f"[red]Could not read response body: {str(e)}[/red]")
+
+    def count_network_event(self, method, params):
+        """Add one network event to the traffic statistics.
+        
+        Also takes events from tabs driven over their own DevTools
+        connection, which never reach the performance log.
+        
+        Args:
+            method (str): The CDP event, e.g. 'Network.loadingFinished'.
+            params (dict): The event parameters.
+        """
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            self.network_stats['requests'] += 1
+            self.request_types[request_id] = params.get('type', 'Other')
+        
+        elif method == 'Network.loadingFailed':
+            resource_type = params.get('type') or self.request_types.get(request_id, 'Other')
+            self.request_types.pop(request_id, None)
+            if params.get('blockedReason'):
+                self.network_stats['blocked_requests'][resource_type] += 1
+                estimates = LEAN_SETTINGS['estimated_bytes']
+                self.network_stats['estimated_bytes_saved'] += estimates.get(resource_type, estimates['Other'])
+        
+        elif method == 'Network.loadingFinished':
+            self.request_types.pop(request_id, None)
+            self.network_stats['bytes_received'] += int(params.get('encodedDataLength') or 0)
+
+    def get_captured_responses(self, url_filter):
+        """Read the bodies of finished responses recorded since the last call.
+        
+        Args:
+            url_filter: Callable taking a URL and returning True for responses to keep.
+            
+        Returns:
+            list: (url, decoded JSON payload) tuples in completion order.
+        """
+        self.response_filter = url_filter
+        self.read_network_events()
+        
+        responses = self.captured_responses
+        self.captured_responses = []
+        return responses
+
+    def get_network_report(self):
+        """Summarize the traffic seen so far, including what lean mode blocked.
+        
+        Bytes saved are estimated from LEAN_SETTINGS['estimated_bytes'] per
+        blocked request, since blocked responses are never downloaded. Images
+        suppressed by the content-setting pref never become requests and are
+        not counted.
+        
+        Returns:
+            dict: Request, byte and blocked-request totals.
+        """
+        self.read_network_events()
+        blocked = self.network_stats['blocked_requests']
+        return {
+            'requests': self.network_stats['requests'],
+            'bytes_received': self.network_stats['bytes_received'],
+            'blocked_requests': sum(blocked.values()),
+            'blocked_by_type': dict(blocked),
+            'estimated_bytes_saved': self.network_stats['estimated_bytes_saved']
+        }
+
+    def detect_rate_limit(self):
+        """Check whether the site stopped serving the timeline because of throttling.
+        
+        Looks for 429 responses in the captured traffic, when network events
+        are recorded, and for the error texts in
+        RATE_LIMIT_SETTINGS['error_texts'] on the page. Costs a round trip,
+        so only call it once a scroll brought nothing new.
+        
+        Returns:
+            tuple: (description, reset time as Unix time or None), or None if
+                the page is not throttled.
+        """
+        if self.capture_network or self.lean:
+            self.read_network_events()
+        if self.throttled_responses:
+            throttled = (f"{self.throttled_responses} requests returned HTTP 429", self.rate_limit_reset)
+            self.throttled_responses = 0
+            self.rate_limit_reset = None
+            return throttled
+        
+        try:
+            text = self.driver.execute_script(DETECT_ERROR_SCRIPT, RATE_LIMIT_SETTINGS['error_texts'])
+        except Exception as e:
+            console.print(f"[red]Rate limit check error: {str(e)}[/red]")
+            return None
+        return (f"Page shows '{text}'", None) if text else None
+
+    def prune_articles(self, keep, require_seen=False):
+        """Collapse processed articles above the viewport.
+        
+        Args:
+            keep (int): Articles left rendered above the viewport.
+            require_seen (bool): Only collapse articles the incremental
+                extraction script marked as drained.
+            
+        Returns:
+            dict: Articles collapsed ('pruned'), articles still rendered and
+                the page's element count, or an empty dict on failure.
+        """
+        try:
+            return self.driver.execute_script(PRUNE_ARTICLES_SCRIPT, keep, require_seen) or {}
+        except Exception as e:
+            console.print(f"[red]Prune error: {str(e)}[/red]")
+            return {}
+
+    def get_heap_usage(self):
+        """Read the page's JavaScript heap size through CDP.
+        
+        Returns:
+            float: Megabytes in use, or None if Chrome did not say.
+        """
+        try:
+            usage = self.driver.execute_cdp_cmd('Runtime.getHeapUsage', {})
+            return usage['usedSize'] / 1e6
+        except Exception:
+            return None
+
+    def scroll(self, scroll_fraction=None, timeout=None):
+        """Scroll down once using the configured wait mode.
+        
+        Args:
+            scroll_fraction (float): Viewport fraction to scroll. Defaults to SCROLL_SETTINGS['scroll_increment'].
+            timeout (float): Seconds to wait for new content in 'event' mode.
+            
+        Returns:
+            bool: True if the scroll was successful, False otherwise.
+        """
+        if SCROLL_SETTINGS['wait_mode'] != 'event':
+            return self.smart_scroll(scroll_fraction)
+        
+        measurement = self.scroll_and_wait(scroll_fraction, timeout)
+        if not measurement:
+            return False
+        return (measurement['position'] > measurement['previous_position']
+                or measurement['height'] > measurement['previous_height'])
+
+    def scroll_and_wait(self, scroll_fraction=None, timeout=None):
+        """Scroll and wait for the page to react, in a single script call.
+        
+        Instead of fixed sleeps, waits until more articles render, the page
+        height changes or the loading spinner clears, up to
+        SCROLL_SETTINGS['event_timeout']. An optional random floor from
+        SCROLL_SETTINGS['event_min_wait'] keeps some human-like jitter.
+        
+        Args:
+            scroll_fraction (float): Viewport fraction to scroll. Defaults to SCROLL_SETTINGS['scroll_increment'].
+            timeout (float): Seconds to wait for new content. Defaults to SCROLL_SETTINGS['event_timeout'].
+            
+        Returns:
+            dict: Heights, positions and article counts before and after, the
+                wait reason ('content' or 'timeout') and elapsed seconds, or
+                None if the scroll failed.
+        """
+        try:
+            fraction = scroll_fraction or SCROLL_SETTINGS['scroll_increment']
+            viewport_height = self.last_scroll['viewport'] if self.last_scroll else None
+            if not viewport_height:
+                viewport_height = self.driver.execute_script("return window.innerHeight")
+            
+            floor = random.uniform(*SCROLL_SETTINGS['event_min_wait'])
+            self.last_scroll = self.driver.execute_async_script(
+                SCROLL_AND_WAIT_SCRIPT,
+                int(viewport_height * fraction),
+                int((timeout or SCROLL_SETTINGS['event_timeout']) * 1000),
+                int(floor * 1000)
+            )
+            return self.last_scroll
+        except Exception as e:
+            console.print(f"[red]Scroll error: {str(e)}[/red]")
+            return None
+
+    def smart_scroll(self, scroll_fraction=None):
         """Optimized scroll with better performance.
         
+        Args:
+            scroll_fraction (float): Viewport fraction to scroll. Defaults to SCROLL_SETTINGS['scroll_increment'].
+            
         Returns:
             bool: True if the scroll was successful, False otherwise.
         """
@@ -61,7 +343,7 @@ class BrowserManager:
             current_position = self.driver.execute_script("return window.pageYOffset")
             
             # Calculate scroll amount
-            scroll_amount = int(viewport_height * SCROLL_SETTINGS['scroll_increment'])
+            scroll_amount = int(viewport_height * (scroll_fraction or SCROLL_SETTINGS['scroll_increment']))
             
             # Scroll in smaller increments
             steps = SCROLL_SETTINGS['scroll_steps']
@@ -89,20 +371,89 @@ class BrowserManager:
             min_seconds (float): Minimum sleep time in seconds.
             max_seconds (float): Maximum sleep time in seconds.
         """
-        time.sleep(random.uniform(min_seconds, max_seconds))
+        if self.metrics is None:
+            time.sleep(random.uniform(min_seconds, max_seconds))
+            return
+        with self.metrics.timer('sleep'):
+            time.sleep(random.uniform(min_seconds, max_seconds))
+
+    def is_logged_in(self):
+        """Check whether the browser holds a valid session.
+        
+        Returns:
+            bool: True if the home timeline shows the logged-in navigation.
+        """
+        try:
+            self.driver.get(f"{SITE_SETTINGS['base_url']}/home")
+            WebDriverWait(self.driver, SESSION_SETTINGS['validate_timeout']).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'a[aria-label="Profile"]'))
+            )
+            return True
+        except:
+            return False
+
+    def restore_session(self, username, session_store):
+        """Resume a stored session instead of logging in.
+        
+        Args:
+            username (str): Twitter username or email the session belongs to.
+            session_store (SessionStore): Where sessions are kept.
+            
+        Returns:
+            bool: True if the browser is logged in afterwards.
+        """
+        # A reused Chrome profile may still be logged in on its own
+        if self.profile_dir and self.is_logged_in():
+            return True
+        
+        cookies = session_store.load(username)
+        if not cookies:
+            return False
+        
+        try:
+            # Cookies can only be set for the domain currently loaded
+            self.driver.get(SITE_SETTINGS['base_url'])
+            for cookie in cookies:
+                cookie = {key: value for key, value in cookie.items() if key != 'sameSite'}
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+        except Exception as e:
+            console.print(f"[yellow]Could not restore session: {str(e)}[/yellow]")
+            return False
+        
+        if self.is_logged_in():
+            return True
+        
+        # The server no longer accepts this session
+        session_store.clear(username)
+        self.driver.delete_all_cookies()
+        return False
 
-    def login(self, username, password):
+    def login(self, username, password, session_store=None):
         """Login to Twitter with optimized waits.
         
+        When a session store is given, a stored session is reused if it is
+        still valid and a fresh login is saved for the next run.
+        
         Args:
             username (str): Twitter username or email.
             password (str): Twitter password.
+            session_store (SessionStore): Optional store of saved sessions.
             
         Returns:
             bool: True if login was successful, False otherwise.
         """
+        self.session_restored = False
+        if session_store and self.restore_session(username, session_store):
+            self.session_restored = True
+            return True
+        
         try:
-            self.driver.get("https://twitter.com/i/flow/login")
+            self.driver.get(f"{SITE_SETTINGS['base_url']}/i/flow/login")
             self.random_sleep(1, 2)
 
             # Enter username
@@ -124,9 +475,12 @@ class BrowserManager:
             # Verify login success
             try:
                 self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, 'a[aria-label="Profile"]')))
-                return True
             except:
                 return False
+            
+            if session_store:
+                session_store.save(username, self.driver.get_cookies())
+            return True
 
         except Exception as e:
             console.print(f"[red]Login error: {str(e)}[/red]")
@@ -0,0 +1,120 @@
+"""Online tuning of scroll distance and pacing from observed yield."""
+
+from rich.console import Console
+
+from ..config.settings import SCROLL_SETTINGS, TUNER_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+class ScrollTuner:
+    """Adjusts scroll distance and wait ceiling from what each scroll produced.
+
+    Uses the duplicate ratio of each extraction to tell whether scrolls are
+    too short (mostly re-reading tweets) or too long (no overlap, so tweets
+    may be skipped), and the load latency of each scroll to tell whether
+    the page keeps up. Every adjustment stays within TUNER_SETTINGS bounds.
+    """
+
+    def __init__(self):
+        """Initialize the tuner from SCROLL_SETTINGS."""
+        self.scroll_fraction = SCROLL_SETTINGS['scroll_increment']
+        self.timeout = SCROLL_SETTINGS['event_timeout']
+        self.latency = None
+        self.logged_timeout = self.timeout
+        self.observations = 0
+        self.changes = 0
+
+    def clamp(self, value, low, high):
+        """Limit a value to a range.
+
+        Args:
+            value (float): The value.
+            low (float): Lower bound.
+            high (float): Upper bound.
+
+        Returns:
+            float: The bounded value.
+        """
+        return max(low, min(high, value))
+
+    def observe(self, extracted, new, measurement=None):
+        """Update the parameters from one loop iteration.
+
+        Args:
+            extracted (int): Tweets extracted this iteration, or None if the
+                mode only returns unseen tweets (no duplicate signal).
+            new (int): Tweets that were not seen before.
+            measurement (dict): The last scroll's measurement from
+                BrowserManager.scroll_and_wait, if any.
+
+        Returns:
+            tuple: (scroll fraction, wait timeout) to use for the next scroll.
+        """
+        self.observations += 1
+        fraction = self.scroll_fraction
+        timeout = self.timeout
+        timed_out = bool(measurement) and measurement.get('reason') == 'timeout'
+
+        # Load latency: smoothed, and the ceiling follows it with headroom
+        if measurement and not timed_out:
+            elapsed = measurement.get('elapsed', 0)
+            alpha = TUNER_SETTINGS['latency_smoothing']
+            self.latency = elapsed if self.latency is None else alpha * elapsed + (1 - alpha) * self.latency
+            timeout = self.latency * TUNER_SETTINGS['timeout_headroom']
+
+        if timed_out and not new:
+            # Outrunning the loader: shorter scrolls and more patience
+            fraction *= TUNER_SETTINGS['backoff_factor']
+            timeout *= TUNER_SETTINGS['timeout_growth']
+
+        elif extracted:
+            duplicate_ratio = 1 - new / extracted
+            low, high = TUNER_SETTINGS['target_duplicate_ratio']
+            if duplicate_ratio > high:
+                # Mostly re-reading the same tweets: scroll further
+                fraction *= TUNER_SETTINGS['growth_factor']
+            elif duplicate_ratio < low and new:
+                # No overlap with the previous screen: tweets may be skipped
+                fraction *= TUNER_SETTINGS['shrink_factor']
+
+        elif extracted is None and new and not timed_out:
+            # Only unseen tweets are reported: probe further while yield holds up
+            fraction *= TUNER_SETTINGS['probe_factor']
+
+        # Without a duplicate signal, skipped tweets would go unnoticed
+        max_increment = TUNER_SETTINGS['max_increment']
+        if extracted is None:
+            max_increment = min(max_increment, TUNER_SETTINGS['max_unobserved_increment'])
+
+        fraction = self.clamp(fraction, TUNER_SETTINGS['min_increment'], max_increment)
+        timeout = self.clamp(timeout, TUNER_SETTINGS['min_timeout'], TUNER_SETTINGS['max_timeout'])
+
+        # Latency smoothing nudges the timeout every scroll; only log real shifts
+        timeout_shift = abs(timeout - self.logged_timeout) > 0.25 * self.logged_timeout
+        if round(fraction, 2) != round(self.scroll_fraction, 2) or timeout_shift:
+            self.changes += 1
+            self.log(fraction, timeout, extracted, new)
+            self.logged_timeout = timeout
+
+        self.scroll_fraction = fraction
+        self.timeout = timeout
+        return self.scroll_fraction, self.timeout
+
+    def log(self, fraction, timeout, extracted, new):
+        """Log a parameter change.
+
+        Args:
+            fraction (float): The new scroll fraction.
+            timeout (float): The new wait ceiling in seconds.
+            extracted (int): Tweets extracted this iteration.
+            new (int): New tweets this iteration.
+        """
+        if not TUNER_SETTINGS['log_changes']:
+            return
+        latency = f"{self.latency:.2f}s" if self.latency is not None else "n/a"
+        seen = f"{new}/{extracted}" if extracted is not None else f"{new}"
+        console.print(
+            f"[dim]Scroll tuner: increment {self.scroll_fraction:.2f} → {fraction:.2f} viewports, "
+            f"timeout {self.logged_timeout:.1f}s → {timeout:.1f}s (new {seen}, latency {latency})[/dim]"
+        )
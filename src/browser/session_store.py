@@ -0,0 +1,137 @@
+"""Persistent session storage so runs can skip the login flow."""
+
+import os
+import re
+import json
+import time
+from pathlib import Path
+from rich.console import Console
+
+from ..config.settings import SESSION_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# Cookie that carries the logged-in session
+AUTH_COOKIE = 'auth_token'
+
+class SessionStore:
+    """Saves and restores browser cookies per account."""
+
+    def __init__(self, sessions_dir=None):
+        """Initialize the session store.
+
+        Args:
+            sessions_dir (str): Directory for session files. Defaults to SESSION_SETTINGS['sessions_dir'].
+        """
+        self.sessions_dir = Path(sessions_dir or SESSION_SETTINGS['sessions_dir'])
+
+    def account_key(self, account):
+        """Turn a login name into a safe file name.
+
+        Args:
+            account (str): Twitter username or email used to log in.
+
+        Returns:
+            str: The normalized key.
+        """
+        return re.sub(r'[^a-z0-9_.@-]', '_', account.strip().lower())
+
+    def path_for(self, account):
+        """Get the session file of an account.
+
+        Args:
+            account (str): Twitter username or email used to log in.
+
+        Returns:
+            Path: The session file path.
+        """
+        return self.sessions_dir / f"{self.account_key(account)}.json"
+
+    def profile_dir_for(self, account):
+        """Get the Chrome user-data-dir reserved for an account.
+
+        Args:
+            account (str): Twitter username or email used to log in.
+
+        Returns:
+            str: The profile directory path.
+        """
+        return str((self.sessions_dir / 'profiles' / self.account_key(account)).resolve())
+
+    def is_expired(self, session):
+        """Check whether a stored session can no longer be valid.
+
+        Args:
+            session (dict): The stored session.
+
+        Returns:
+            bool: True if the session is too old or its auth cookie has expired.
+        """
+        max_age = SESSION_SETTINGS['max_age_days'] * 86400
+        if time.time() - session.get('saved_at', 0) > max_age:
+            return True
+
+        for cookie in session.get('cookies', []):
+            if cookie.get('name') == AUTH_COOKIE:
+                expiry = cookie.get('expiry')
+                return bool(expiry) and expiry <= time.time()
+        return True
+
+    def load(self, account):
+        """Load an account's cookies if a usable session is stored.
+
+        Args:
+            account (str): Twitter username or email used to log in.
+
+        Returns:
+            list: Selenium cookie dicts, or None if there is no valid session.
+        """
+        path = self.path_for(account)
+        if not path.exists():
+            return None
+
+        try:
+            session = json.loads(path.read_text(encoding='utf-8'))
+        except Exception as e:
+            console.print(f"[yellow]Ignoring unreadable session file: {str(e)}[/yellow]")
+            return None
+
+        if self.is_expired(session):
+            self.clear(account)
+            return None
+        return session.get('cookies')
+
+    def save(self, account, cookies):
+        """Store an account's cookies.
+
+        The file is replaced atomically so concurrent workers never read a
+        partial session, and it is only readable by the current user.
+
+        Args:
+            account (str): Twitter username or email used to log in.
+            cookies (list): Selenium cookie dicts from driver.get_cookies().
+        """
+        try:
+            self.sessions_dir.mkdir(parents=True, exist_ok=True)
+            path = self.path_for(account)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'saved_at': time.time(), 'cookies': cookies}, f)
+            os.replace(temp_path, path)
+
+        except Exception as e:
+            console.print(f"[red]Error saving session: {str(e)}[/red]")
+
+    def clear(self, account):
+        """Forget an account's stored session.
+
+        Args:
+            account (str): Twitter username or email used to log in.
+        """
+        try:
+            self.path_for(account).unlink()
+        except FileNotFoundError:
+            pass
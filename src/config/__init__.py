@@ -1,5 +1,21 @@
 """Configuration package."""
 
-from .settings import USER_AGENTS, CHROME_OPTIONS, SCROLL_SETTINGS, FILE_SETTINGS
+from .settings import (
+    USER_AGENTS, CHROME_OPTIONS, SCROLL_SETTINGS, TUNER_SETTINGS,
+    LEAN_SETTINGS, SITE_SETTINGS, SESSION_SETTINGS, EXTRACTION_SETTINGS,
+    NETWORK_SETTINGS, API_SETTINGS, ASYNC_SETTINGS, BATCH_SETTINGS,
+    DEDUP_SETTINGS, WATERMARK_SETTINGS, DATABASE_SETTINGS, OUTPUT_SETTINGS,
+    FILE_SETTINGS, WRITER_SETTINGS, METRICS_SETTINGS, RATE_LIMIT_SETTINGS,
+    SHARD_SETTINGS, PRUNE_SETTINGS, PIPELINE_SETTINGS, SNAPSHOT_SETTINGS,
+    DAEMON_SETTINGS
+)
 
-__all__ = ['USER_AGENTS', 'CHROME_OPTIONS', 'SCROLL_SETTINGS', 'FILE_SETTINGS'] 
\ No newline at end of file
+__all__ = [
+    'USER_AGENTS', 'CHROME_OPTIONS', 'SCROLL_SETTINGS', 'TUNER_SETTINGS',
+    'LEAN_SETTINGS', 'SITE_SETTINGS', 'SESSION_SETTINGS', 'EXTRACTION_SETTINGS',
+    'NETWORK_SETTINGS', 'API_SETTINGS', 'ASYNC_SETTINGS', 'BATCH_SETTINGS',
+    'DEDUP_SETTINGS', 'WATERMARK_SETTINGS', 'DATABASE_SETTINGS', 'OUTPUT_SETTINGS',
+    'FILE_SETTINGS', 'WRITER_SETTINGS', 'METRICS_SETTINGS', 'RATE_LIMIT_SETTINGS',
+    'SHARD_SETTINGS', 'PRUNE_SETTINGS', 'PIPELINE_SETTINGS', 'SNAPSHOT_SETTINGS',
+    'DAEMON_SETTINGS'
+]
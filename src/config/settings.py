@@ -21,7 +21,223 @@ SCROLL_SETTINGS = {
     'scroll_steps': 3,
     'min_scroll_wait': 0.3,
     'max_scroll_wait': 0.5,
-    'content_load_wait': (1, 1.5)
+    'content_load_wait': (1, 1.5),
+    # 'event' scrolls once and waits for new content, 'fixed' uses the sleeps above
+    'wait_mode': 'event',
+    'event_timeout': 3.0,  # Seconds to wait for new content before giving up
+    'event_min_wait': (0, 0)  # Random floor in seconds, e.g. (0.3, 0.8) for stealth
+}
+
+TUNER_SETTINGS = {
+    'enabled': True,  # Adapt scroll distance and wait ceiling during a run
+    'min_increment': 0.5,  # Viewports per scroll
+    'max_increment': 3.0,
+    'max_unobserved_increment': 1.5,  # Cap when the mode reports no duplicates
+    'min_timeout': 1.0,  # Seconds
+    'max_timeout': 8.0,
+    'target_duplicate_ratio': (0.1, 0.5),  # Re-read share of each extraction
+    'growth_factor': 1.25,
+    'shrink_factor': 0.9,
+    'probe_factor': 1.1,
+    'backoff_factor': 0.7,
+    'timeout_growth': 1.5,
+    'timeout_headroom': 2.5,  # Wait ceiling as a multiple of the smoothed latency
+    'latency_smoothing': 0.3,
+    'log_changes': True
+}
+
+LEAN_SETTINGS = {
+    'enabled': False,  # Block media, fonts and trackers while scraping
+    # Chrome content settings applied in lean mode (2 = block)
+    'prefs': {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.media_stream': 2
+    },
+    # URL patterns blocked through CDP Network.setBlockedURLs ('*' is a wildcard)
+    'blocked_urls': [
+        '*pbs.twimg.com/media/*',
+        '*pbs.twimg.com/profile_images/*',
+        '*pbs.twimg.com/profile_banners/*',
+        '*pbs.twimg.com/card_img/*',
+        '*pbs.twimg.com/*_video_thumb/*',
+        '*video.twimg.com/*',
+        '*.mp4*',
+        '*.m3u8*',
+        '*.m4s*',
+        '*.woff',
+        '*.woff2',
+        '*.ttf',
+        '*google-analytics.com/*',
+        '*googletagmanager.com/*',
+        '*doubleclick.net/*',
+        '*ads-twitter.com/*',
+        '*ads-api.twitter.com/*',
+        '*/1.1/jot/*'
+    ],
+    # Typical response sizes used to estimate what blocked requests would have cost
+    'estimated_bytes': {
+        'Image': 60000,
+        'Media': 750000,
+        'Font': 40000,
+        'Other': 2000
+    }
+}
+
+SITE_SETTINGS = {
+    'base_url': 'https://twitter.com'  # Point at a local fixture server for offline runs
+}
+
+SESSION_SETTINGS = {
+    'enabled': True,  # Reuse saved cookies instead of logging in on every run
+    'sessions_dir': 'data/sessions',
+    'reuse_profile': False,  # Also keep a Chrome user-data-dir per account (not for parallel workers)
+    'max_age_days': 30,  # Log in again after this long even if cookies have not expired
+    'validate_timeout': 5  # Seconds to wait for the logged-in home page when checking a session
+}
+
+PRUNE_SETTINGS = {
+    'enabled': False,  # Collapse processed tweets on long scrolls so layout and extraction stay cheap
+    'every': 5,  # Scrolls between prunes
+    'keep_articles': 20,  # Processed tweets left rendered above the viewport
+    'heap_limit_mb': 768,  # Reopen the timeline at the last saved tweet past this JS heap; None to never
+    'heap_check_every': 25  # Scrolls between heap checks
+}
+
+EXTRACTION_SETTINGS = {
+    # 'batch' extracts every visible tweet with one injected script per scroll,
+    # 'incremental' extracts only articles inserted since the previous scroll,
+    # 'network' decodes the timeline GraphQL responses captured through CDP,
+    # 'snapshot' saves the timeline's HTML and parses it in worker processes,
+    # 'element' queries each article through separate WebDriver commands
+    'mode': 'batch',
+    'incremental_max_attempts': 3,  # Drains to wait for an article's text to render
+    # 'browser' scrolls the rendered profile, 'http' pages through the timeline
+    # API with the browser's session and falls back to the browser on failure
+    'engine': 'browser'
+}
+
+SNAPSHOT_SETTINGS = {
+    'directory': 'data/snapshots',  # One folder of gzipped timeline snapshots per run, for replay
+    'parser': 'lxml',  # 'lxml' (needs lxml) or 'html.parser' (standard library, slower)
+    'workers': None,  # Parsing processes; None for one less than the CPU count
+    'keep': True,  # Save the snapshots; False only parses them
+    'compresslevel': 5  # gzip level of saved snapshots
+}
+
+NETWORK_SETTINGS = {
+    'record_dir': None  # Save captured timeline responses here as replayable fixtures
+}
+
+API_SETTINGS = {
+    # Public token the web app sends with every GraphQL request
+    'bearer_token': 'AAAAAAAAAAAAAAAAAAAAANRILgAAAAAAnNwIzUejRCOuH5E6I8xnZz4puTs%3D1Zv7ttfk8LF81IUq16cHjhLTvJu4FA33AGWWjCpTnA',
+    # GraphQL query IDs rotate with web app releases; update them from the browser's network tab
+    'query_ids': {
+        'UserByScreenName': 'G3KGOASz96M-Qu0nwmGXNg',
+        'UserTweets': 'E3opETHurmVJflFsUBVuUQ'
+    },
+    'features': {
+        'responsive_web_graphql_exclude_directive_enabled': True,
+        'verified_phone_label_enabled': False,
+        'responsive_web_graphql_skip_user_profile_image_extensions_enabled': False,
+        'responsive_web_graphql_timeline_navigation_enabled': True,
+        'tweetypie_unmention_optimization_enabled': True,
+        'view_counts_everywhere_api_enabled': True,
+        'longform_notetweets_consumption_enabled': True,
+        'longform_notetweets_rich_text_read_enabled': True,
+        'freedom_of_speech_not_reach_fetch_enabled': True,
+        'standardized_nudges_misinfo': True,
+        'creator_subscriptions_tweet_preview_api_enabled': True,
+        'hidden_profile_likes_enabled': True,
+        'highlights_tweets_tab_ui_enabled': True,
+        'subscriptions_verification_info_verified_since_enabled': True
+    },
+    'page_size': 40,
+    'http2': True,  # Used when the optional h2 package is installed
+    'max_connections': 4,
+    'timeout': 20
+}
+
+ASYNC_SETTINGS = {
+    'tabs': 4,  # Profiles scraped concurrently in one browser
+    'load_timeout': 15,  # Seconds to wait for a profile's first tweet
+    'command_timeout': 30,  # Seconds to wait for a DevTools command reply
+    # Background tabs must not be throttled while they scroll
+    'chrome_options': [
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding"
+    ]
+}
+
+BATCH_SETTINGS = {
+    'workers': None,  # Concurrent browser processes, None for the CPU count
+    'retries': 2,  # Extra attempts for a failed profile
+    'retry_delay': 5  # Seconds, multiplied by the attempt number
+}
+
+SHARD_SETTINGS = {
+    'directory': 'data/tweets/shards',  # Per-window files, merged into one output at the end
+    'start': '2006-03-21',  # Default start of the history, the first day of tweets
+    'window_days': 30,  # Size of the first windows, before the tweet density is known
+    'target_tweets': 500,  # Tweets each later window is sized to hold
+    'min_window_hours': 6,
+    'max_window_days': 365,
+    'keep_shards': False  # Keep the per-window files after a successful merge
+}
+
+DEDUP_SETTINGS = {
+    'enabled': False,  # Skip tweets saved by earlier runs of the same account
+    'index_dir': 'data/index',  # One SQLite index per scraped account
+    'bloom_capacity': 1000000,  # Keys the in-memory Bloom filter is sized for
+    'bloom_error_rate': 0.001  # Share of lookups for new tweets that still query SQLite
+}
+
+WATERMARK_SETTINGS = {
+    'enabled': False,  # Only scrape tweets newer than the last run; implies skipping known tweets
+    'state_dir': 'data/state',  # One JSON watermark file per scraped account
+    'stop_after_known': 5,  # Consecutive known tweets that mark the end of the new ones
+    'backfill': True  # After the new tweets, continue an unfinished scrape of older ones
+}
+
+DATABASE_SETTINGS = {
+    'enabled': False,  # Also save tweets to a SQLite database shared by all runs
+    'path': 'data/tweets.sqlite',
+    'batch_size': 500  # Tweets written per transaction; checkpoints write the rest
+}
+
+OUTPUT_SETTINGS = {
+    'directory': 'data/tweets',
+    'formats': ['text'],  # Any of 'text', 'jsonl', 'csv' and 'parquet' (needs pyarrow)
+    'parquet_row_group_size': 5000,  # Tweets buffered per Parquet row group
+    'compression': None,  # None, 'gzip' or 'zstd' (needs zstandard); Parquet uses it as its codec
+    'compression_level': None,  # None for the codec default
+    'rotate_tweets': None,  # Start a new segment after this many tweets
+    'rotate_bytes': None,  # Start a new segment after this many uncompressed bytes
+    'manifest': True  # Write {file}.manifest.json listing every segment
+}
+
+METRICS_SETTINGS = {
+    'enabled': True,  # Time each phase and WebDriver command of a run
+    'summary': True,  # Write {file}.metrics.json after each profile
+    'buckets': (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),  # Histogram bounds in seconds
+    'prometheus_textfile': None,  # Also write run metrics here for node_exporter's textfile collector
+    'prometheus_host': '127.0.0.1',  # Interface the /metrics server binds; '0.0.0.0' exposes it to the network
+    'profile': None  # 'cprofile' or 'pyinstrument' to save a profile next to each output file
+}
+
+RATE_LIMIT_SETTINGS = {
+    'enabled': True,  # Detect throttling and recover instead of ending the run early
+    'requests_per_minute': None,  # Scrolls or API pages per account and minute, e.g. 30; None to not pace
+    'burst': 5,  # Requests allowed back to back before pacing applies
+    'backoff_base': 30,  # Seconds to wait after the first throttle when no other account is rested
+    'backoff_factor': 2,
+    'backoff_max': 900,
+    'backoff_jitter': 0.2,  # Random share added to or removed from each wait
+    'max_attempts': 6,  # Throttles in a row before giving up on a profile
+    'cooldown': 900,  # Seconds a throttled account rests when the server gives no reset time
+    # Page texts that mean the timeline stopped loading because of throttling
+    'error_texts': ['Something went wrong. Try reloading.', 'Rate limit exceeded', 'You are being rate limited']
 }
 
 FILE_SETTINGS = {
@@ -29,4 +245,30 @@ FILE_SETTINGS = {
     'date_format': '%B %d, %Y at %I:%M %p',
     'separator_line': "=" * 100,
     'subseparator_line': "─" * 100
-} 
\ No newline at end of file
+}
+
+WRITER_SETTINGS = {
+    'background': True,  # Write from a worker thread instead of the scraping thread
+    'queue_size': 1000,  # Tweets buffered before saving blocks
+    'flush_every': 50,  # Flush after this many tweets
+    'flush_interval_ms': 1000,  # Flush pending tweets at least this often
+    'fsync': 'checkpoint',  # 'never', 'checkpoint' (after each scroll/page and on close) or 'flush'
+    'report_stats': False  # Print queue depth and write latency after each profile
+}
+
+PIPELINE_SETTINGS = {
+    'enabled': False,  # Process each scroll's tweets on a worker thread while the browser scrolls on
+    'depth': 1,  # Scrolls the processing may lag behind the browser before scrolling waits
+    'report_stats': False  # Print how long each stage worked and waited after each profile
+}
+
+DAEMON_SETTINGS = {
+    'host': '127.0.0.1',  # Interface the job API listens on; keep it local
+    'port': 8765,  # Port of the job API
+    'browsers': 1,  # Logged-in browsers kept warm, one job each at a time
+    'recycle_after': 50,  # Jobs before a browser is replaced by a fresh one
+    'retry_delay': 30,  # Seconds between attempts to start a browser that failed to log in
+    'keep_jobs': 200,  # Finished jobs kept for status and result queries
+    'spool_dir': 'data/daemon',  # Each job's tweets as JSON lines, served to clients; deleted with the job
+    'stream_poll': 1.0  # Seconds a following stream waits for new tweets between checks
+}
@@ -0,0 +1,660 @@
+"""Long-lived scraper daemon with warm browsers and a local job API."""
+
+import json
+import time
+import uuid
+import queue
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from rich.console import Console
+
+from .scraper import TwitterScraper
+from .config.settings import DAEMON_SETTINGS, SHARD_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# Job states that never change again
+FINISHED_STATES = ('done', 'empty', 'failed', 'cancelled')
+
+def parse_window_time(value):
+    """Parse a window bound sent with a job.
+
+    Args:
+        value (str): An ISO date or time, UTC unless it has an offset.
+
+    Returns:
+        datetime: The time in UTC, or None if no value was given.
+    """
+    if not value:
+        return None
+    moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+class ScrapeJob:
+    """One profile scrape submitted to the daemon, and the tweets it found so far.
+
+    The tweets are spooled to a JSON lines file as they arrive, so a daemon
+    that runs for weeks only keeps each job's tweet count in memory.
+    """
+
+    def __init__(self, username, limit=None, window=None, spool_dir=None):
+        """Initialize a queued job.
+
+        Args:
+            username (str): Profile to scrape.
+            limit (int): Stop after this many new tweets.
+            window (tuple): (since, until) datetimes to scrape only the tweets posted in between.
+            spool_dir (str): Directory of the job's spool file. Defaults to DAEMON_SETTINGS['spool_dir'].
+        """
+        self.id = uuid.uuid4().hex[:12]
+        self.username = username
+        self.limit = limit
+        self.window = window
+        self.status = 'queued'
+        self.error = None
+        self.files = []
+        self.metrics = None
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        # Tweets as JSON lines, streamed to clients from the file as they arrive
+        self.spool_path = Path(spool_dir or DAEMON_SETTINGS['spool_dir']) / f"{self.id}.jsonl"
+        self.spool = None
+        self.tweets = 0
+        self.cancelled = threading.Event()
+        self.changed = threading.Condition()
+
+    @property
+    def finished(self):
+        """bool: Whether the job has ended."""
+        return self.status in FINISHED_STATES
+
+    def start(self):
+        """Mark the job as running.
+
+        Returns:
+            bool: False if the job was cancelled before it started.
+        """
+        with self.changed:
+            if self.finished:
+                return False
+            self.status = 'running'
+            self.started_at = time.time()
+            self.changed.notify_all()
+            return True
+
+    def add(self, tweets):
+        """Spool new tweets and wake up streaming clients.
+
+        Args:
+            tweets (list): Tweet objects.
+        """
+        if not tweets:
+            return
+        text = ''.join(f"{tweet.to_json()}\n" for tweet in tweets)
+        with self.changed:
+            if self.finished:
+                return
+            if self.spool is None:
+                self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+                self.spool = open(self.spool_path, 'a', encoding='utf-8')
+            self.spool.write(text)
+            # Readers only read as many lines as are counted, so they never see half a line
+            self.spool.flush()
+            self.tweets += len(tweets)
+            self.changed.notify_all()
+
+    def finish(self, status, error=None):
+        """End the job.
+
+        Args:
+            status (str): One of FINISHED_STATES.
+            error (str): What went wrong, for failed jobs.
+        """
+        with self.changed:
+            self.status = status
+            self.error = error
+            self.finished_at = time.time()
+            if self.spool:
+                self.spool.close()
+                self.spool = None
+            self.changed.notify_all()
+
+    def wait(self, offset, timeout):
+        """Wait for tweets past an offset or for the job to end.
+
+        Args:
+            offset (int): Tweets the caller has already seen.
+            timeout (float): Seconds to wait at most.
+
+        Returns:
+            tuple: (tweets spooled so far, whether the job has ended).
+        """
+        with self.changed:
+            self.changed.wait_for(lambda: self.tweets > offset or self.finished, timeout)
+            return self.tweets, self.finished
+
+    def remove_spool(self):
+        """Delete the spool file once the job's tweets can no longer be requested."""
+        try:
+            self.spool_path.unlink(missing_ok=True)
+        except OSError as e:
+            console.print(f"[red]Error removing job spool: {str(e)}[/red]")
+
+    def to_dict(self):
+        """Describe the job for the API.
+
+        Returns:
+            dict: ID, profile, status, tweet count, timing, output files and error.
+        """
+        ended = self.finished_at or time.time()
+        return {
+            'id': self.id,
+            'username': self.username,
+            'status': self.status,
+            'tweets': self.tweets,
+            'limit': self.limit,
+            'window': [bound.isoformat() for bound in self.window] if self.window else None,
+            'queued_seconds': round((self.started_at or ended) - self.submitted_at, 3),
+            'run_seconds': round(ended - self.started_at, 3) if self.started_at else None,
+            'files': self.files,
+            'error': self.error
+        }
+
+class BrowserPool:
+    """Keeps logged-in scrapers warm between jobs.
+
+    Each scraper's Chrome is launched and logged in once. A scraper whose
+    browser stopped responding, or that ran DAEMON_SETTINGS['recycle_after']
+    jobs, is replaced in the background while the others keep serving.
+    """
+
+    def __init__(self, size, login_username, login_password, scraper_options=None):
+        """Initialize an empty pool.
+
+        Args:
+            size (int): Number of browsers.
+            login_username (str): Twitter username or email to log in with.
+            login_password (str): Twitter password.
+            scraper_options (dict): Keyword arguments for each TwitterScraper.
+        """
+        self.size = size
+        self.login_username = login_username
+        self.login_password = login_password
+        self.scraper_options = dict(scraper_options or {})
+        self.idle = queue.Queue()
+        self.jobs_run = {}
+        self.ready = 0
+        self.starting = 0
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def create(self):
+        """Launch and log in one scraper.
+
+        Returns:
+            TwitterScraper: The logged-in scraper.
+        """
+        scraper = TwitterScraper(**self.scraper_options)
+        try:
+            if not scraper.login(self.login_username, self.login_password):
+                raise Exception("Login failed")
+        except Exception:
+            scraper.close()
+            raise
+        return scraper
+
+    def start(self):
+        """Warm up every browser in parallel.
+
+        Returns after each browser's first attempt to start and log in.
+
+        Returns:
+            int: Browsers that started; the others keep retrying in the background.
+        """
+        attempts = [threading.Event() for _ in range(self.size)]
+        for attempted in attempts:
+            threading.Thread(target=self.add, args=(attempted,), daemon=True).start()
+        for attempted in attempts:
+            attempted.wait()
+        return self.ready
+
+    def add(self, attempted=None):
+        """Start one scraper and make it available, retrying until it logs in.
+
+        Args:
+            attempted (threading.Event): Set after the first attempt, whether it worked or not.
+        """
+        with self.lock:
+            self.starting += 1
+        try:
+            while not self.closed:
+                try:
+                    scraper = self.create()
+                except Exception as e:
+                    console.print(f"[red]Could not start a browser: {str(e)}[/red]")
+                    if attempted:
+                        attempted.set()
+                    time.sleep(DAEMON_SETTINGS['retry_delay'])
+                    continue
+                if self.closed:
+                    scraper.close()
+                    return
+                with self.lock:
+                    self.jobs_run[id(scraper)] = 0
+                    self.ready += 1
+                self.idle.put(scraper)
+                return
+        finally:
+            with self.lock:
+                self.starting -= 1
+            if attempted:
+                attempted.set()
+
+    def acquire(self):
+        """Take an idle scraper, waiting for one if all are busy.
+
+        Returns:
+            TwitterScraper: The scraper, or None once the pool is closed.
+        """
+        scraper = self.idle.get()
+        if scraper is None or self.closed:
+            return None
+        if not self.is_alive(scraper):
+            console.print("[yellow]A browser stopped responding; starting a new one.[/yellow]")
+            self.replace(scraper)
+            return self.acquire()
+        return scraper
+
+    def release(self, scraper):
+        """Return a scraper after a job, recycling it if it is due.
+
+        Args:
+            scraper (TwitterScraper): The scraper from acquire().
+        """
+        with self.lock:
+            self.jobs_run[id(scraper)] += 1
+            due = self.jobs_run[id(scraper)] >= DAEMON_SETTINGS['recycle_after']
+        if self.closed or due or not self.is_alive(scraper):
+            self.replace(scraper)
+        else:
+            self.idle.put(scraper)
+
+    def replace(self, scraper):
+        """Close a scraper and start a new one in the background.
+
+        Args:
+            scraper (TwitterScraper): The scraper to retire.
+        """
+        with self.lock:
+            self.jobs_run.pop(id(scraper), None)
+            self.ready -= 1
+        try:
+            scraper.close()
+        except Exception as e:
+            console.print(f"[red]Error closing browser: {str(e)}[/red]")
+        if not self.closed:
+            threading.Thread(target=self.add, daemon=True).start()
+
+    def is_alive(self, scraper):
+        """Check that a scraper's browser still answers.
+
+        Args:
+            scraper (TwitterScraper): The scraper.
+
+        Returns:
+            bool: True if WebDriver commands still go through.
+        """
+        try:
+            scraper.browser.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def get_stats(self):
+        """Report the pool's state.
+
+        Returns:
+            dict: Browsers ready, idle and starting.
+        """
+        with self.lock:
+            return {'size': self.size, 'ready': self.ready, 'idle': self.idle.qsize(), 'starting': self.starting}
+
+    def close(self):
+        """Close the idle scrapers and wake up waiting workers.
+
+        Scrapers busy with a job are closed when they are released.
+        """
+        self.closed = True
+        while True:
+            try:
+                scraper = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            if scraper is not None:
+                self.replace(scraper)
+        for _ in range(self.size):
+            self.idle.put(None)
+
+class ScraperDaemon:
+    """Runs scrape jobs on a warm browser pool behind a localhost HTTP API.
+
+    Routes:
+        GET /health: pool and queue state.
+        POST /jobs: submit {"username", "limit", "since", "until"}.
+        GET /jobs: every retained job.
+        GET /jobs/{id}: one job.
+        GET /jobs/{id}/tweets?offset=N&follow=1: the job's tweets as JSON
+            lines, streamed until the job ends when follow is set.
+        DELETE /jobs/{id}: cancel a queued or running job.
+    """
+
+    def __init__(self, pool, host=None, port=None, token=None):
+        """Initialize the daemon.
+
+        Args:
+            pool (BrowserPool): The warm scrapers.
+            host (str): Interface to bind. Defaults to DAEMON_SETTINGS['host'].
+            port (int): Port to listen on, 0 for any. Defaults to DAEMON_SETTINGS['port'].
+            token (str): Bearer token every request must carry, or None for none.
+        """
+        self.pool = pool
+        self.host = host or DAEMON_SETTINGS['host']
+        self.port = DAEMON_SETTINGS['port'] if port is None else port
+        self.token = token
+        self.jobs = OrderedDict()
+        self.queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.workers = []
+        self.httpd = None
+
+    def submit(self, username, limit=None, window=None):
+        """Queue a scrape job.
+
+        Args:
+            username (str): Profile to scrape.
+            limit (int): Stop after this many new tweets.
+            window (tuple): (since, until) datetimes.
+
+        Returns:
+            ScrapeJob: The queued job.
+        """
+        job = ScrapeJob(username.lstrip('@'), limit, window)
+        with self.lock:
+            self.jobs[job.id] = job
+            self.forget_old_jobs()
+        self.queue.put(job)
+        return job
+
+    def forget_old_jobs(self):
+        """Drop the oldest finished jobs past DAEMON_SETTINGS['keep_jobs']."""
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(len(finished) - DAEMON_SETTINGS['keep_jobs'], 0)]:
+            self.jobs.pop(job_id).remove_spool()
+
+    def get_job(self, job_id):
+        """Look up a job.
+
+        Args:
+            job_id (str): The job ID.
+
+        Returns:
+            ScrapeJob: The job, or None if unknown or forgotten.
+        """
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job):
+        """Cancel a job.
+
+        A queued job never starts; a running one stops after its current scroll
+        or API page, keeping what it saved.
+
+        Args:
+            job (ScrapeJob): The job.
+        """
+        job.cancelled.set()
+        if job.status == 'queued':
+            job.finish('cancelled')
+
+    def work(self):
+        """Run queued jobs on pooled scrapers until the daemon stops."""
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            if job.cancelled.is_set():
+                continue
+            scraper = self.pool.acquire()
+            if scraper is None:
+                job.finish('cancelled', "Daemon stopped")
+                return
+            try:
+                self.run_job(job, scraper)
+            finally:
+                self.pool.release(scraper)
+
+    def run_job(self, job, scraper):
+        """Scrape a job's profile, publishing tweets as they arrive.
+
+        Args:
+            job (ScrapeJob): The job.
+            scraper (TwitterScraper): A logged-in scraper.
+        """
+        if not job.start():
+            return
+        batches = scraper.iter_tweets(job.username, batches=True, window=job.window, cancel=job.cancelled)
+        try:
+            for batch in batches:
+                if job.limit:
+                    batch = batch[:job.limit - job.tweets]
+                job.add(batch)
+                if job.cancelled.is_set() or (job.limit and job.tweets >= job.limit):
+                    break
+        except Exception as e:
+            job.finish('failed', str(e))
+            return
+        finally:
+            # Closing the generator stops the scrape and closes its output files
+            batches.close()
+            job.files = list(scraper.file_handler.current_files)
+            job.metrics = scraper.metrics.summary()
+        if scraper.last_error:
+            job.finish('failed', scraper.last_error)
+        elif job.cancelled.is_set():
+            job.finish('cancelled')
+        else:
+            job.finish('done' if job.tweets else 'empty')
+
+    def health(self):
+        """Describe the daemon's state.
+
+        Returns:
+            dict: Pool statistics and job counts by status.
+        """
+        with self.lock:
+            statuses = [job.status for job in self.jobs.values()]
+        return {
+            'pool': self.pool.get_stats(),
+            'jobs': {status: statuses.count(status) for status in set(statuses)}
+        }
+
+    def start(self):
+        """Start the job workers and the HTTP server."""
+        for index in range(self.pool.size):
+            worker = threading.Thread(target=self.work, name=f"daemon-worker-{index}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), self.create_handler())
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Cancel every job, stop serving and close the browsers."""
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+        with self.lock:
+            jobs = list(self.jobs.values())
+        for job in jobs:
+            if not job.finished:
+                self.cancel(job)
+        for _ in self.workers:
+            self.queue.put(None)
+        # Wakes up workers still waiting for a browser, e.g. one that never logged in
+        self.pool.close()
+        for worker in self.workers:
+            worker.join()
+        # Jobs only live in memory, so nothing can ask for their tweets again
+        for job in jobs:
+            job.remove_spool()
+
+    def create_handler(self):
+        """Create the request handler class bound to this daemon.
+
+        Returns:
+            type: A BaseHTTPRequestHandler subclass.
+        """
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                daemon.handle(self, 'GET')
+
+            def do_POST(self):
+                daemon.handle(self, 'POST')
+
+            def do_DELETE(self):
+                daemon.handle(self, 'DELETE')
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def handle(self, handler, method):
+        """Route one API request.
+
+        Args:
+            handler (BaseHTTPRequestHandler): The request.
+            method (str): The HTTP method.
+        """
+        if self.token and handler.headers.get('Authorization') != f"Bearer {self.token}":
+            self.send_json(handler, 401, {'error': "Missing or wrong token"})
+            return
+
+        parsed = urlparse(handler.path)
+        parts = [part for part in parsed.path.split('/') if part]
+        try:
+            if parts == ['health'] and method == 'GET':
+                self.send_json(handler, 200, self.health())
+            elif parts == ['jobs'] and method == 'POST':
+                self.handle_submit(handler)
+            elif parts == ['jobs'] and method == 'GET':
+                with self.lock:
+                    jobs = [job.to_dict() for job in self.jobs.values()]
+                self.send_json(handler, 200, {'jobs': jobs})
+            elif len(parts) in (2, 3) and parts[0] == 'jobs':
+                job = self.get_job(parts[1])
+                if job is None:
+                    self.send_json(handler, 404, {'error': f"Unknown job {parts[1]}"})
+                elif len(parts) == 3 and parts[2] == 'tweets' and method == 'GET':
+                    self.stream_tweets(handler, job, parse_qs(parsed.query))
+                elif len(parts) == 2 and method == 'GET':
+                    self.send_json(handler, 200, job.to_dict())
+                elif len(parts) == 2 and method == 'DELETE':
+                    self.cancel(job)
+                    self.send_json(handler, 200, job.to_dict())
+                else:
+                    self.send_json(handler, 405, {'error': f"{method} not allowed here"})
+            else:
+                self.send_json(handler, 404, {'error': f"No route for {method} {parsed.path}"})
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away mid-stream
+            pass
+
+    def handle_submit(self, handler):
+        """Queue a job from a POST /jobs request.
+
+        Args:
+            handler (BaseHTTPRequestHandler): The request.
+        """
+        try:
+            length = int(handler.headers.get('Content-Length') or 0)
+            body = json.loads(handler.rfile.read(length) or b'{}')
+            username = (body.get('username') or '').strip()
+            if not username:
+                raise ValueError("username is required")
+            limit = int(body['limit']) if body.get('limit') else None
+            since, until = parse_window_time(body.get('since')), parse_window_time(body.get('until'))
+            window = None
+            if since or until:
+                window = (since or parse_window_time(SHARD_SETTINGS['start']), until or datetime.now(timezone.utc))
+        except (ValueError, TypeError) as e:
+            self.send_json(handler, 400, {'error': str(e)})
+            return
+        job = self.submit(username, limit, window)
+        self.send_json(handler, 202, job.to_dict())
+
+    def stream_tweets(self, handler, job, query):
+        """Send a job's tweets as JSON lines, following it until it ends if asked.
+
+        Args:
+            handler (BaseHTTPRequestHandler): The request.
+            job (ScrapeJob): The job.
+            query (dict): Parsed query string with optional offset and follow.
+        """
+        try:
+            offset = int(query.get('offset', ['0'])[0])
+            if offset < 0:
+                raise ValueError("offset must not be negative")
+        except ValueError as e:
+            self.send_json(handler, 400, {'error': str(e)})
+            return
+        follow = query.get('follow', ['0'])[0] not in ('0', 'false', '')
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/x-ndjson')
+        handler.send_header('Connection', 'close')
+        handler.end_headers()
+        spool = None
+        sent = offset
+        try:
+            while True:
+                spooled, finished = job.wait(sent, DAEMON_SETTINGS['stream_poll'] if follow else 0)
+                if spooled > sent:
+                    if spool is None:
+                        spool = open(job.spool_path, encoding='utf-8')
+                        for _ in range(offset):
+                            spool.readline()
+                    lines = [spool.readline() for _ in range(spooled - sent)]
+                    handler.wfile.write(''.join(lines).encode('utf-8'))
+                    handler.wfile.flush()
+                    sent = spooled
+                if finished or not follow or self.httpd is None:
+                    return
+        finally:
+            if spool:
+                spool.close()
+
+    def send_json(self, handler, status, data):
+        """Send a JSON response.
+
+        Args:
+            handler (BaseHTTPRequestHandler): The request.
+            status (int): The HTTP status.
+            data (dict): The response body.
+        """
+        body = json.dumps(data).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
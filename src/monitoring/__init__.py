@@ -0,0 +1,10 @@
+"""Run instrumentation package."""
+
+from .metrics import RunMetrics, ProgressEvent, Histogram
+from .exporters import MetricsServer, format_prometheus, write_textfile
+from .profiling import RunProfiler
+
+__all__ = [
+    'RunMetrics', 'ProgressEvent', 'Histogram', 'MetricsServer', 'format_prometheus', 'write_textfile',
+    'RunProfiler'
+]
@@ -0,0 +1,184 @@
+"""Prometheus exposition of run summaries, as a textfile or over HTTP."""
+
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from rich.console import Console
+
+from ..config.settings import METRICS_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+PREFIX = 'twitter_scraper'
+
+# Summary fields exported as one sample per account: (name, type, help, summary key)
+RUN_METRICS = (
+    ('tweets_total', 'counter', 'New tweets saved.', 'tweets'),
+    ('extracted_total', 'counter', 'Tweets extracted, duplicates included.', 'extracted'),
+    ('run_seconds', 'gauge', 'Duration of the last run.', 'seconds'),
+    ('tweets_per_second', 'gauge', 'New tweets per second in the last run.', 'tweets_per_sec'),
+    ('duplicate_ratio', 'gauge', 'Share of extracted tweets that were duplicates.', 'duplicate_ratio'),
+    ('webdriver_commands_total', 'counter', 'WebDriver commands sent.', 'webdriver_commands')
+)
+
+def escape_label(value):
+    """Escape a label value for the text format.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        str: The escaped value.
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_labels(**labels):
+    """Format a label set.
+
+    Args:
+        **labels: Label names and values.
+
+    Returns:
+        str: e.g. '{account="x",phase="scroll"}'.
+    """
+    return '{' + ','.join(f'{name}="{escape_label(value)}"' for name, value in labels.items()) + '}'
+
+def format_histogram(lines, name, histogram, **labels):
+    """Append one histogram's samples.
+
+    Args:
+        lines (list): Output lines.
+        name (str): The full metric name.
+        histogram (dict): A Histogram.to_dict() result.
+        **labels: The series labels.
+    """
+    for bound, count in histogram['buckets']:
+        lines.append(f"{name}_bucket{format_labels(**labels, le=bound)} {count}")
+    lines.append(f"{name}_bucket{format_labels(**labels, le='+Inf')} {histogram['count']}")
+    lines.append(f"{name}_sum{format_labels(**labels)} {histogram['total']}")
+    lines.append(f"{name}_count{format_labels(**labels)} {histogram['count']}")
+
+def format_prometheus(summaries):
+    """Render run summaries in the Prometheus text exposition format.
+
+    Args:
+        summaries (list): RunMetrics.summary() results, the latest per account.
+
+    Returns:
+        str: The exposition text.
+    """
+    lines = []
+    for suffix, metric_type, help_text, key in RUN_METRICS:
+        name = f"{PREFIX}_{suffix}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for summary in summaries:
+            lines.append(f"{name}{format_labels(account=summary['username'])} {summary[key] or 0}")
+
+    name = f"{PREFIX}_events_total"
+    lines.append(f"# HELP {name} Rate limiting and recovery events.")
+    lines.append(f"# TYPE {name} counter")
+    for summary in summaries:
+        for event, value in sorted(summary['counters'].items()):
+            if event not in ('tweets', 'extracted'):
+                lines.append(f"{name}{format_labels(account=summary['username'], event=event)} {value}")
+
+    name = f"{PREFIX}_phase_seconds"
+    lines.append(f"# HELP {name} Time spent per phase of the run.")
+    lines.append(f"# TYPE {name} histogram")
+    for summary in summaries:
+        for phase, histogram in summary['phases'].items():
+            format_histogram(lines, name, histogram, account=summary['username'], phase=phase)
+
+    name = f"{PREFIX}_webdriver_command_seconds"
+    lines.append(f"# HELP {name} WebDriver command round trips.")
+    lines.append(f"# TYPE {name} histogram")
+    for summary in summaries:
+        for command, histogram in summary['commands'].items():
+            format_histogram(lines, name, histogram, account=summary['username'], command=command)
+
+    return '\n'.join(lines) + '\n'
+
+def write_textfile(path, summaries):
+    """Write summaries for node_exporter's textfile collector.
+
+    The file is replaced atomically so the collector never reads half of it.
+
+    Args:
+        path (str): The .prom file path.
+        summaries (list): RunMetrics.summary() results.
+    """
+    try:
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(format_prometheus(summaries))
+        os.replace(temp_path, path)
+    except Exception as e:
+        console.print(f"[red]Error writing Prometheus textfile: {str(e)}[/red]")
+
+class MetricsServer:
+    """Serves the latest run summaries at /metrics for Prometheus to scrape."""
+
+    def __init__(self, port, host=None):
+        """Initialize the server.
+
+        Args:
+            port (int): Port to listen on.
+            host (str): Interface to bind. Defaults to METRICS_SETTINGS['prometheus_host'].
+        """
+        self.host = host or METRICS_SETTINGS['prometheus_host']
+        self.port = port
+        self.summaries = {}
+        self.lock = threading.Lock()
+        self.httpd = None
+
+    def update(self, summary):
+        """Publish a run summary, replacing the account's previous one.
+
+        Args:
+            summary (dict): A RunMetrics.summary() result.
+        """
+        with self.lock:
+            self.summaries[summary['username']] = summary
+
+    def render(self):
+        """Render the published summaries.
+
+        Returns:
+            bytes: The exposition text.
+        """
+        with self.lock:
+            summaries = list(self.summaries.values())
+        return format_prometheus(summaries).encode('utf-8')
+
+    def start(self):
+        """Start serving in a background thread."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = server.render()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self):
+        """Stop serving."""
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
@@ -0,0 +1,306 @@
+"""Timers, counters and progress events for scraping runs."""
+
+import os
+import json
+import time
+import bisect
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from rich.console import Console
+
+from ..config.settings import METRICS_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+class Histogram:
+    """Cumulative-bucket histogram of durations in seconds, as Prometheus exposes them."""
+
+    def __init__(self, buckets=None):
+        """Initialize an empty histogram.
+
+        Args:
+            buckets (tuple): Upper bounds in seconds, ascending. Defaults to METRICS_SETTINGS['buckets'].
+        """
+        self.buckets = tuple(buckets or METRICS_SETTINGS['buckets'])
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        """Record one duration.
+
+        Args:
+            value (float): Seconds.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Estimate a quantile from the buckets.
+
+        Args:
+            q (float): The quantile, e.g. 0.95.
+
+        Returns:
+            float: The upper bound of the bucket holding it, or the maximum
+                for the overflow bucket.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self):
+        """Summarize the histogram.
+
+        Returns:
+            dict: count, total, mean, p50, p95 and max seconds, and the cumulative bucket counts.
+        """
+        cumulative = []
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            cumulative.append([bound, seen])
+        return {
+            'count': self.count,
+            'total': round(self.sum, 6),
+            'mean': round(self.sum / self.count, 6) if self.count else 0.0,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'max': round(self.max, 6),
+            'buckets': cumulative
+        }
+
+class ProgressEvent:
+    """A structured progress update passed to progress callbacks.
+
+    str(event) gives the human-readable message, so callbacks written for
+    the old plain-text updates keep working.
+    """
+
+    def __init__(self, kind, message, username=None, tweets=0, extracted=0, elapsed=0.0, **fields):
+        """Initialize the event.
+
+        Args:
+            kind (str): 'progress', 'throttled', 'backoff', 'rotated' or 'finished'.
+            message (str): Human-readable description.
+            username (str): The profile being scraped.
+            tweets (int): New tweets so far.
+            extracted (int): Tweets extracted so far, duplicates included.
+            elapsed (float): Seconds since the run started.
+            **fields: Extra data for the event kind, e.g. delay or account.
+        """
+        self.kind = kind
+        self.message = message
+        self.username = username
+        self.tweets = tweets
+        self.extracted = extracted
+        self.elapsed = elapsed
+        self.fields = fields
+
+    @property
+    def tweets_per_sec(self):
+        """float: New tweets per second so far."""
+        return self.tweets / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self):
+        """Convert to a JSON-serializable dict.
+
+        Returns:
+            dict: The event's fields.
+        """
+        return {
+            'kind': self.kind,
+            'message': self.message,
+            'username': self.username,
+            'tweets': self.tweets,
+            'extracted': self.extracted,
+            'elapsed': round(self.elapsed, 3),
+            'tweets_per_sec': round(self.tweets_per_sec, 3),
+            **self.fields
+        }
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"ProgressEvent({self.kind!r}, {self.message!r})"
+
+class RunMetrics:
+    """Collects where a scraping run spends its time.
+
+    Phases are timed into histograms, WebDriver commands are counted and
+    timed by wrapping the driver, and counters track tweets, duplicates
+    and rate limiting. Phases may nest: 'sleep' is part of 'scroll'.
+    Phases and counters may be recorded from pipeline threads.
+    """
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self, username=None):
+        """Start collecting for a new run.
+
+        Args:
+            username (str): The profile being scraped.
+        """
+        self.username = username
+        self.started_at = datetime.now(timezone.utc)
+        self.started = time.perf_counter()
+        self.finished = None
+        self.phases = {}
+        self.commands = {}
+        self.counters = Counter()
+
+    @property
+    def enabled(self):
+        """bool: Whether timers are recorded."""
+        return METRICS_SETTINGS['enabled']
+
+    @property
+    def elapsed(self):
+        """float: Seconds since the run started, up to its end once finished."""
+        return (self.finished or time.perf_counter()) - self.started
+
+    def observe(self, phase, seconds):
+        """Record a duration for a phase.
+
+        Args:
+            phase (str): The phase name.
+            seconds (float): The duration.
+        """
+        with self.lock:
+            histogram = self.phases.get(phase)
+            if histogram is None:
+                histogram = self.phases[phase] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def timer(self, phase):
+        """Time a block as one observation of a phase.
+
+        Args:
+            phase (str): The phase name.
+        """
+        if not self.enabled:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - started)
+
+    def count(self, name, value=1):
+        """Increase a counter.
+
+        Args:
+            name (str): The counter name.
+            value (int): The increment.
+        """
+        with self.lock:
+            self.counters[name] += value
+
+    def instrument_driver(self, driver):
+        """Count and time every WebDriver command sent through a driver.
+
+        Element lookups and property reads on WebElements go through
+        driver.execute as well, so every round trip to chromedriver is seen.
+
+        Args:
+            driver: The Selenium WebDriver.
+        """
+        execute = driver.execute
+
+        def instrumented(driver_command, params=None):
+            if not self.enabled:
+                return execute(driver_command, params)
+            started = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                seconds = time.perf_counter() - started
+                # Commands also come from the pipeline's worker thread
+                with self.lock:
+                    histogram = self.commands.get(driver_command)
+                    if histogram is None:
+                        histogram = self.commands[driver_command] = Histogram()
+                    histogram.observe(seconds)
+
+        driver.execute = instrumented
+
+    def event(self, kind, message, **fields):
+        """Build a progress event with the current totals.
+
+        Args:
+            kind (str): The event kind.
+            message (str): Human-readable description.
+            **fields: Extra data for the event.
+
+        Returns:
+            ProgressEvent: The event.
+        """
+        return ProgressEvent(
+            kind, message, username=self.username, tweets=self.counters['tweets'],
+            extracted=self.counters['extracted'], elapsed=self.elapsed, **fields
+        )
+
+    def finish(self):
+        """Stop the run clock."""
+        if self.finished is None:
+            self.finished = time.perf_counter()
+
+    def summary(self):
+        """Summarize the run.
+
+        Returns:
+            dict: Totals, rates, the duplicate ratio, counters, phase timings
+                and WebDriver commands.
+        """
+        # Counters and histograms are written from the pipeline's worker thread too
+        with self.lock:
+            elapsed = self.elapsed
+            tweets = self.counters['tweets']
+            extracted = self.counters['extracted']
+            command_count = sum(histogram.count for histogram in self.commands.values())
+            return {
+                'username': self.username,
+                'started_at': self.started_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'seconds': round(elapsed, 3),
+                'tweets': tweets,
+                'extracted': extracted,
+                'tweets_per_sec': round(tweets / elapsed, 3) if elapsed else 0.0,
+                'duplicate_ratio': round(1 - tweets / extracted, 4) if extracted else 0.0,
+                'webdriver_commands': command_count,
+                'commands_per_tweet': round(command_count / tweets, 3) if tweets else None,
+                'counters': dict(self.counters),
+                'phases': {name: histogram.to_dict() for name, histogram in sorted(self.phases.items())},
+                'commands': {name: histogram.to_dict() for name, histogram in sorted(self.commands.items())}
+            }
+
+    def write_summary(self, path):
+        """Write the summary as JSON, replacing the file atomically.
+
+        Args:
+            path (str): The output path.
+        """
+        try:
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.summary(), f, indent=2)
+            os.replace(temp_path, path)
+        except Exception as e:
+            console.print(f"[red]Error writing metrics summary: {str(e)}[/red]")
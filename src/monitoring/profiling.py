@@ -0,0 +1,65 @@
+"""Optional whole-run profiling with cProfile or pyinstrument."""
+
+from rich.console import Console
+
+# Initialize Rich console
+console = Console()
+
+# Output file suffix of each profiler
+PROFILE_SUFFIXES = {'cprofile': '.prof', 'pyinstrument': '.profile.html'}
+
+class RunProfiler:
+    """Profiles the scraping thread between start and stop."""
+
+    def __init__(self, kind):
+        """Initialize the profiler.
+
+        Args:
+            kind (str): 'cprofile' or 'pyinstrument' (needs pyinstrument).
+        """
+        if kind not in PROFILE_SUFFIXES:
+            raise ValueError(f"Unknown profiler '{kind}'. Choose from: {', '.join(PROFILE_SUFFIXES)}")
+        self.kind = kind
+        self.profiler = None
+
+    def start(self):
+        """Start profiling."""
+        if self.kind == 'cprofile':
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        else:
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                raise Exception("pyinstrument profiling needs pyinstrument: pip install pyinstrument")
+            self.profiler = Profiler()
+            self.profiler.start()
+
+    def stop(self, path_stem):
+        """Stop profiling and write the profile.
+
+        Args:
+            path_stem (str): Output path without suffix.
+
+        Returns:
+            str: The profile path, or None if profiling never started.
+        """
+        if self.profiler is None:
+            return None
+
+        path = f"{path_stem}{PROFILE_SUFFIXES[self.kind]}"
+        try:
+            if self.kind == 'cprofile':
+                self.profiler.disable()
+                self.profiler.dump_stats(path)
+            else:
+                self.profiler.stop()
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(self.profiler.output_html())
+        except Exception as e:
+            console.print(f"[red]Error writing profile: {str(e)}[/red]")
+            return None
+        finally:
+            self.profiler = None
+        return path
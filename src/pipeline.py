@@ -0,0 +1,185 @@
+"""Staged scraping pipeline that overlaps scrolling with tweet processing."""
+
+import time
+import queue
+import threading
+
+from .config.settings import PIPELINE_SETTINGS
+
+# Queue marker that stops the stage thread
+_STOP = object()
+
+class PipelineStage:
+    """Runs one stage of a scrape on a worker thread between bounded queues.
+
+    The scroll loop submits the raw articles of each scroll and collects
+    the finished tweets of earlier scrolls, so the browser scrolls on while
+    they are parsed, deduplicated and handed to the writers. Batches are
+    handled one at a time and in order, as dedup and resume positions
+    depend on it. Each collect waits until no more than `depth` batches
+    are in flight, and submit blocks while `depth` are queued, so the scroll
+    loop never runs further ahead of the stage than that.
+    """
+
+    def __init__(self, name, handler, depth=None):
+        """Initialize and start the stage.
+
+        Args:
+            name (str): Stage name, used for the thread and stats.
+            handler: Function turning one submitted batch into its result.
+            depth (int): Batches left in flight after each exchange. Defaults to PIPELINE_SETTINGS['depth'].
+        """
+        self.name = name
+        self.handler = handler
+        self.depth = max(depth or PIPELINE_SETTINGS['depth'], 1)
+        self.inbox = queue.Queue(maxsize=self.depth)
+        self.outbox = queue.Queue()
+        self.pending = 0
+        self.error = None
+        self.closed = False
+        self.stats = {
+            'batches': 0,
+            'items': 0,
+            'max_queue_depth': 0,
+            'busy': 0.0,
+            'idle': 0.0,
+            'blocked': 0.0,
+            'waited': 0.0
+        }
+
+        self.thread = threading.Thread(target=self.run, name=f"pipeline-{name}", daemon=True)
+        self.thread.start()
+
+    def submit(self, batch):
+        """Hand a batch to the stage.
+
+        Blocks while `depth` batches are queued, so a slow stage slows
+        scrolling down instead of buffering pages of articles.
+
+        Args:
+            batch (list): Raw articles or payloads from one scroll.
+        """
+        if self.error:
+            raise self.error
+        started = time.perf_counter()
+        self.inbox.put(batch)
+        self.stats['blocked'] += time.perf_counter() - started
+        self.pending += 1
+        depth = self.inbox.qsize()
+        if depth > self.stats['max_queue_depth']:
+            self.stats['max_queue_depth'] = depth
+
+    def collect(self, outstanding=None):
+        """Take the results of finished batches.
+
+        Args:
+            outstanding (int): Wait until no more than this many batches are
+                still in flight. Defaults to depth, so each call after a
+                submit returns at least the batch submitted `depth` calls ago.
+
+        Returns:
+            list: The results of the finished batches, oldest first.
+        """
+        if outstanding is None:
+            outstanding = self.depth
+        results = []
+        started = time.perf_counter()
+        while self.pending > outstanding:
+            results.append(self.take(block=True))
+        self.stats['waited'] += time.perf_counter() - started
+        while self.pending:
+            try:
+                results.append(self.take(block=False))
+            except queue.Empty:
+                break
+        return results
+
+    def exchange(self, batch):
+        """Submit a batch and collect the tweets finished meanwhile.
+
+        Args:
+            batch (list): Raw articles or payloads from one scroll.
+
+        Returns:
+            list: The finished batches' results, concatenated.
+        """
+        self.submit(batch)
+        return [item for result in self.collect() for item in result]
+
+    def drain(self):
+        """Wait for every submitted batch.
+
+        Returns:
+            list: The remaining results, concatenated.
+        """
+        return [item for result in self.collect(outstanding=0) for item in result]
+
+    def take(self, block):
+        """Take one result from the stage.
+
+        Args:
+            block (bool): Whether to wait for it.
+
+        Returns:
+            The handler's result.
+
+        Raises:
+            Exception: The handler's error, if it failed.
+        """
+        result = self.outbox.get(block=block)
+        self.pending -= 1
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def run(self):
+        """Handle batches until close() is called."""
+        while True:
+            started = time.perf_counter()
+            batch = self.inbox.get()
+            self.stats['idle'] += time.perf_counter() - started
+            if batch is _STOP:
+                return
+
+            started = time.perf_counter()
+            try:
+                result = self.handler(batch)
+            except Exception as e:
+                # Raised on the scroll loop's thread when it collects this batch
+                self.error = e
+                result = e
+            self.stats['busy'] += time.perf_counter() - started
+            self.stats['batches'] += 1
+            self.stats['items'] += len(batch)
+            self.outbox.put(result)
+
+    def get_stats(self):
+        """Report where the stage and the scroll loop spent their time.
+
+        Returns:
+            dict: Batches and items handled, peak queue depth, the stage's busy
+                and idle seconds, and the seconds the scroll loop spent blocked
+                on a full queue or waiting for results.
+        """
+        return {
+            'batches': self.stats['batches'],
+            'items': self.stats['items'],
+            'max_queue_depth': self.stats['max_queue_depth'],
+            'busy_seconds': round(self.stats['busy'], 3),
+            'idle_seconds': round(self.stats['idle'], 3),
+            'blocked_seconds': round(self.stats['blocked'], 3),
+            'waited_seconds': round(self.stats['waited'], 3)
+        }
+
+    def close(self):
+        """Finish the batches still queued and stop the thread.
+
+        Their tweets are saved even though nobody collects them, so an
+        interrupted scrape keeps everything it extracted.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.thread.is_alive():
+            self.inbox.put(_STOP)
+            self.thread.join()
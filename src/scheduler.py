@@ -0,0 +1,251 @@
+"""Rate-limit aware pacing, backoff and credential rotation."""
+
+import os
+import time
+import random
+from rich.console import Console
+
+from .config.settings import RATE_LIMIT_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+class RateLimitError(Exception):
+    """Raised when the site refuses requests because of rate limiting."""
+
+    def __init__(self, message="Rate limit exceeded", reset_at=None):
+        """Initialize the error.
+
+        Args:
+            message (str): What was detected.
+            reset_at (float): Unix time the limit resets, if the server said so.
+        """
+        super().__init__(message)
+        self.reset_at = reset_at
+
+def sleep(seconds, cancel=None):
+    """Sleep, waking up early once a cancel event is set.
+
+    Args:
+        seconds (float): Time to sleep.
+        cancel (threading.Event): Ends the sleep when set.
+
+    Returns:
+        bool: False if the sleep was cancelled.
+    """
+    if cancel is None:
+        time.sleep(seconds)
+        return True
+    return not cancel.wait(seconds)
+
+class TokenBucket:
+    """Paces requests to a sustained rate with short bursts."""
+
+    def __init__(self, rate_per_minute, burst):
+        """Initialize a full bucket.
+
+        Args:
+            rate_per_minute (float): Tokens added per minute.
+            burst (int): Bucket capacity.
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def refill(self):
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, cancel=None):
+        """Take a token, sleeping until one is available.
+
+        Args:
+            cancel (threading.Event): Ends the wait early when set.
+
+        Returns:
+            float: Seconds waited.
+        """
+        self.refill()
+        waited = 0.0
+        if self.tokens < 1:
+            waited = (1 - self.tokens) / self.rate
+            sleep(waited, cancel)
+            self.refill()
+        self.tokens -= 1
+        return waited
+
+class Backoff:
+    """Exponential backoff with jitter."""
+
+    def __init__(self, base=None, factor=None, max_delay=None, jitter=None):
+        """Initialize the backoff.
+
+        Args:
+            base (float): First delay in seconds. Defaults to RATE_LIMIT_SETTINGS['backoff_base'].
+            factor (float): Growth per attempt. Defaults to RATE_LIMIT_SETTINGS['backoff_factor'].
+            max_delay (float): Delay ceiling. Defaults to RATE_LIMIT_SETTINGS['backoff_max'].
+            jitter (float): Random share added or removed. Defaults to RATE_LIMIT_SETTINGS['backoff_jitter'].
+        """
+        self.base = RATE_LIMIT_SETTINGS['backoff_base'] if base is None else base
+        self.factor = RATE_LIMIT_SETTINGS['backoff_factor'] if factor is None else factor
+        self.max_delay = RATE_LIMIT_SETTINGS['backoff_max'] if max_delay is None else max_delay
+        self.jitter = RATE_LIMIT_SETTINGS['backoff_jitter'] if jitter is None else jitter
+        self.attempts = 0
+
+    def next_delay(self):
+        """Get the delay before the next attempt and count the attempt.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        delay = min(self.base * self.factor ** self.attempts, self.max_delay)
+        self.attempts += 1
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def reset(self):
+        """Start over after a success."""
+        self.attempts = 0
+
+def load_credentials():
+    """Read the credential sets from the environment.
+
+    TWITTER_ACCOUNTS holds extra sets as 'user:password' pairs separated by
+    commas, used after TWITTER_USERNAME/TWITTER_PASSWORD.
+
+    Returns:
+        list: (username, password) tuples.
+    """
+    credentials = []
+    if os.getenv('TWITTER_USERNAME') and os.getenv('TWITTER_PASSWORD'):
+        credentials.append((os.getenv('TWITTER_USERNAME'), os.getenv('TWITTER_PASSWORD')))
+    for pair in (os.getenv('TWITTER_ACCOUNTS') or '').split(','):
+        username, _, password = pair.strip().partition(':')
+        if username and password and (username, password) not in credentials:
+            credentials.append((username, password))
+    return credentials
+
+class RateLimitScheduler:
+    """Decides how to pace requests and recover from rate limiting.
+
+    Each credential set has its own token bucket. When the active one is
+    throttled it rests until its limit resets (or for
+    RATE_LIMIT_SETTINGS['cooldown']) and the next rested set takes over.
+    When every set is resting, the scraper backs off exponentially, never
+    past the earliest reset.
+    """
+
+    def __init__(self, credentials=None):
+        """Initialize the scheduler.
+
+        Args:
+            credentials (list): (username, password) tuples to rotate through.
+        """
+        self.credentials = []
+        self.resting_until = {}
+        self.buckets = {}
+        self.current = None
+        self.backoff = Backoff()
+        self.throttles = 0
+        for username, password in credentials or []:
+            self.add_credentials(username, password)
+
+    def add_credentials(self, username, password):
+        """Add a credential set to the rotation.
+
+        Args:
+            username (str): Twitter username or email.
+            password (str): Twitter password.
+        """
+        if any(existing[0] == username for existing in self.credentials):
+            return
+        self.credentials.append((username, password))
+
+    def activate(self, username):
+        """Mark the credential set the browser is logged in with.
+
+        Args:
+            username (str): Twitter username or email.
+        """
+        self.current = username
+
+    def rest(self, username, until=None):
+        """Keep a credential set out of the rotation for a while.
+
+        Args:
+            username (str): Twitter username or email.
+            until (float): Unix time it may be used again. Defaults to now
+                plus RATE_LIMIT_SETTINGS['cooldown'].
+        """
+        self.resting_until[username] = until or time.time() + RATE_LIMIT_SETTINGS['cooldown']
+
+    def pace(self, cancel=None):
+        """Wait for the active credential set's next request slot.
+
+        Args:
+            cancel (threading.Event): Ends the wait early when set.
+
+        Returns:
+            float: Seconds waited.
+        """
+        rate = RATE_LIMIT_SETTINGS['requests_per_minute']
+        if not rate:
+            return 0.0
+        bucket = self.buckets.get(self.current)
+        if bucket is None:
+            bucket = self.buckets[self.current] = TokenBucket(rate, RATE_LIMIT_SETTINGS['burst'])
+        return bucket.acquire(cancel)
+
+    def record_success(self):
+        """Reset the backoff once requests go through again."""
+        self.backoff.reset()
+        self.throttles = 0
+
+    def on_rate_limited(self, reset_at=None):
+        """Plan the recovery from a throttled request.
+
+        Args:
+            reset_at (float): Unix time the limit resets, if known.
+
+        Returns:
+            tuple: ('rotate', (username, password)) to switch credential sets,
+                ('wait', seconds) to back off, or ('give_up', None) after
+                RATE_LIMIT_SETTINGS['max_attempts'] throttles in a row.
+        """
+        now = time.time()
+        self.throttles += 1
+        if self.throttles > RATE_LIMIT_SETTINGS['max_attempts']:
+            return 'give_up', None
+
+        if self.current is not None:
+            self.rest(self.current, reset_at)
+
+        for username, password in self.credentials:
+            if username != self.current and self.resting_until.get(username, 0) <= now:
+                return 'rotate', (username, password)
+
+        delay = self.backoff.next_delay()
+        if self.resting_until:
+            # Waiting past the earliest reset gains nothing
+            delay = min(delay, max(min(self.resting_until.values()) - now, 1))
+        return 'wait', delay
+
+    def ready_credentials(self):
+        """Get the credential set to use after a wait.
+
+        Returns:
+            tuple: (username, password) of the set whose rest ends first, or
+                None if the active set is as good as any.
+        """
+        if not self.resting_until:
+            return None
+        username = min(
+            (name for name, _ in self.credentials),
+            key=lambda name: self.resting_until.get(name, 0),
+            default=None
+        )
+        if username is None or username == self.current:
+            return None
+        return next(credential for credential in self.credentials if credential[0] == username)
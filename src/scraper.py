@@ -1,38 +1,130 @@
 """Main Twitter scraping module."""
 
+import json
+from pathlib import Path
+from datetime import timezone
+from collections import deque
+from urllib.parse import quote
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .api.timeline_client import TimelineClient
+from .scheduler import RateLimitScheduler, RateLimitError, sleep
+from .pipeline import PipelineStage
+from .snapshots import SnapshotRecorder
+from .monitoring import RunMetrics, RunProfiler, write_textfile
 from .browser.browser_manager import BrowserManager
+from .browser.session_store import SessionStore
+from .browser.scroll_tuner import ScrollTuner
 from .tweet.processor import TweetProcessor
+from .tweet.dedup_index import DedupIndex
+from .tweet.watermarks import WatermarkStore
 from .tweet.file_handler import TweetFileHandler
-from .config.settings import SCROLL_SETTINGS
+from .tweet.database import TweetDatabase
+from .tweet.timeline_parser import TimelineParser
+from .tweet.scripts import EXTRACT_ARTICLES_SCRIPT, DRAIN_NEW_ARTICLES_SCRIPT, CAPTURE_TIMELINE_SCRIPT
+from .config.settings import (
+    SCROLL_SETTINGS, TUNER_SETTINGS, LEAN_SETTINGS, SITE_SETTINGS, SESSION_SETTINGS, EXTRACTION_SETTINGS,
+    NETWORK_SETTINGS, WRITER_SETTINGS, DEDUP_SETTINGS, WATERMARK_SETTINGS, DATABASE_SETTINGS, METRICS_SETTINGS,
+    RATE_LIMIT_SETTINGS, SHARD_SETTINGS, PRUNE_SETTINGS, PIPELINE_SETTINGS
+)
 
 # Initialize Rich console
 console = Console()
 
+def format_search_time(moment):
+    """Format a time for the since: and until: search operators.
+    
+    Args:
+        moment (datetime): An aware or UTC time.
+        
+    Returns:
+        str: e.g. '2024-01-31_12:00:00_UTC'.
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.strftime('%Y-%m-%d_%H:%M:%S_UTC')
+
 class TwitterScraper:
     """Main class for scraping Twitter profiles."""
     
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, extraction_mode=None, engine=None, account=None, lean=None,
+                 output_formats=None, compression=None, skip_known=None, since_last_run=None,
+                 database=None, credentials=None, profile=None, prune=None, pipeline=None):
         """Initialize the Twitter scraper.
         
         Args:
             headless (bool): Whether to run the browser in headless mode.
+            extraction_mode (str): 'batch', 'incremental', 'network', 'snapshot' or 'element'.
+                Defaults to EXTRACTION_SETTINGS['mode'].
+            engine (str): 'browser' or 'http'. Defaults to EXTRACTION_SETTINGS['engine'].
+            account (str): Login name, used to pick a persistent Chrome profile
+                when SESSION_SETTINGS['reuse_profile'] is on.
+            lean (bool): Whether to block media, fonts and trackers. Defaults to LEAN_SETTINGS['enabled'].
+            output_formats (list): Output formats to write. Defaults to OUTPUT_SETTINGS['formats'].
+            compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+            skip_known (bool): Whether to skip tweets saved by earlier runs of the same profile.
+                Defaults to DEDUP_SETTINGS['enabled'].
+            since_last_run (bool): Whether to stop at the tweets saved by earlier runs and then
+                continue their unfinished backfill. Implies skip_known. Defaults to WATERMARK_SETTINGS['enabled'].
+            database (bool): Whether to also save tweets to the SQLite database. Defaults to DATABASE_SETTINGS['enabled'].
+            credentials (list): Extra (username, password) tuples to rotate to when the
+                logged-in account is rate limited.
+            profile (str): 'cprofile' or 'pyinstrument' to profile each run. Defaults to METRICS_SETTINGS['profile'].
+            prune (bool): Whether to collapse processed tweets and reopen the timeline when
+                the page grows too large. Defaults to PRUNE_SETTINGS['enabled'].
+            pipeline (bool): Whether to process each scroll's tweets on a worker thread
+                while the browser scrolls on. Defaults to PIPELINE_SETTINGS['enabled'].
         """
-        self.browser = BrowserManager(headless)
+        self.extraction_mode = extraction_mode or EXTRACTION_SETTINGS['mode']
+        self.engine = engine or EXTRACTION_SETTINGS['engine']
+        self.session_store = SessionStore() if SESSION_SETTINGS['enabled'] else None
+        self.skip_known = DEDUP_SETTINGS['enabled'] if skip_known is None else skip_known
+        self.since_last_run = WATERMARK_SETTINGS['enabled'] if since_last_run is None else since_last_run
+        self.watermark_store = WatermarkStore() if self.since_last_run else None
+        self.watermark = None
+        
+        profile_dir = None
+        if self.session_store and account and SESSION_SETTINGS['reuse_profile']:
+            profile_dir = self.session_store.profile_dir_for(account)
+        
+        # The HTTP engine falls back to network capture, which dedups on the same status IDs
+        capture_network = self.extraction_mode == 'network' or self.engine == 'http'
+        self.lean = LEAN_SETTINGS['enabled'] if lean is None else lean
+        self.browser = BrowserManager(
+            headless, capture_network=capture_network, profile_dir=profile_dir, lean=self.lean
+        )
         self.is_logged_in = False
         self.no_new_tweets_count = 0
         self.batch_size = 20
         self.tweet_processor = TweetProcessor()
-        self.file_handler = TweetFileHandler()
+        self.timeline_parser = TimelineParser()
+        self.recorded_responses = 0
+        self.tweet_count = 0
+        self.scroll_tuner = ScrollTuner() if TUNER_SETTINGS['enabled'] else None
+        self.prune = PRUNE_SETTINGS['enabled'] if prune is None else prune
+        self.pipeline = PIPELINE_SETTINGS['enabled'] if pipeline is None else pipeline
+        use_database = DATABASE_SETTINGS['enabled'] if database is None else database
+        self.database = TweetDatabase() if use_database else None
+        self.file_handler = TweetFileHandler(output_formats, compression, self.database)
         self.current_username = None
         self.progress_callback = None
+        self.window = None
+        self.window_complete = False
+        self.last_error = None
+        self.cancel = None
+        self.snapshots = None
+        self.metrics = RunMetrics()
+        self.metrics.instrument_driver(self.browser.driver)
+        self.browser.metrics = self.metrics
+        self.profile = METRICS_SETTINGS['profile'] if profile is None else profile
+        self.scheduler = RateLimitScheduler(credentials) if RATE_LIMIT_SETTINGS['enabled'] else None
 
     def login(self, username, password):
-        """Login to Twitter.
+        """Login to Twitter, reusing a saved session when it is still valid.
         
         Args:
             username (str): Twitter username or email.
@@ -41,109 +133,928 @@ class TwitterScraper:
         Returns:
             bool: True if login was successful, False otherwise.
         """
-        self.is_logged_in = self.browser.login(username, password)
+        self.is_logged_in = self.browser.login(username, password, session_store=self.session_store)
+        if self.is_logged_in and self.scheduler:
+            self.scheduler.add_credentials(username, password)
+            self.scheduler.activate(username)
         return self.is_logged_in
 
-    def get_tweets(self, username, progress_callback=None):
+    def get_tweets(self, username, progress_callback=None, retain=True, window=None):
         """Optimized tweet collection with immediate saving.
         
+        A thin wrapper over iter_tweets that runs the scrape to the end.
+        
         Args:
             username (str): The Twitter username to scrape.
-            progress_callback: Callback function to update progress.
+            progress_callback: Callback function receiving a ProgressEvent for each update.
+            retain (bool): Whether to keep the tweets in memory. Pass False when
+                only the saved files matter, so long timelines use constant memory.
+            window (tuple): (since, until) datetimes to scrape only the tweets posted in between.
             
         Returns:
-            list: List of collected tweets.
+            list: List of collected tweets, or the number of tweets if retain is False.
         """
         tweets = []
-        consecutive_empty_scrolls = 0
-        last_height = 0
-        no_height_change = 0
-        max_retries = SCROLL_SETTINGS['max_retries']
+        tweet_count = 0
+        for batch in self.iter_tweets(username, progress_callback, batches=True, window=window):
+            tweet_count += len(batch)
+            if retain:
+                tweets.extend(batch)
+        return tweets if retain else tweet_count
+
+    def iter_tweets(self, username, progress_callback=None, batches=False, window=None, cancel=None):
+        """Scrape a profile and yield tweets as soon as they are extracted.
+        
+        Tweets are saved to the output files before they are yielded. The
+        scrape only advances when the consumer asks for more, so a slow
+        consumer slows scrolling down instead of buffering tweets. Closing
+        the generator (or breaking out of the loop) stops the scrape and
+        closes the output files.
+        
+        Args:
+            username (str): The Twitter username to scrape.
+            progress_callback: Callback function receiving a ProgressEvent for each update.
+            batches (bool): Yield the list of new tweets from each scroll or API
+                page instead of single tweets.
+            window (tuple): (since, until) datetimes to scrape only the tweets posted in between.
+            cancel (threading.Event): Stops the scrape at the next scroll, API page
+                or rate-limit wait once set, for callers on other threads.
+            
+        Yields:
+            Tweet: Each new tweet, or a list of them if batches is True.
+        """
+        for batch in self.iter_tweet_batches(username, progress_callback, window, cancel):
+            if batches:
+                yield batch
+            else:
+                yield from batch
+
+    def iter_tweet_batches(self, username, progress_callback=None, window=None, cancel=None):
+        """Scrape a profile and yield the new tweets of each scroll or API page.
+        
+        With since_last_run the scrape stops once it reaches the tweets
+        saved by earlier runs, then continues an unfinished backfill below
+        the oldest saved tweet. A rate-limited scrape rotates accounts or
+        backs off and resumes where it stopped. Timings and counters are
+        collected in self.metrics and summarized when the run ends.
+        
+        With a window, only the tweets posted between its since and until
+        times are scraped, through a search timeline, into a file of their
+        own under SHARD_SETTINGS['directory']. Watermarks and the dedup
+        index are left alone, as windows of one profile run in parallel.
+        self.window_complete tells whether the search ran to its end.
+        
+        Errors end the run without raising, after the tweets found so far
+        are saved; self.last_error holds the message of the one that did.
+        
+        Args:
+            username (str): The Twitter username to scrape.
+            progress_callback: Callback function receiving a ProgressEvent for each update.
+            window (tuple): (since, until) datetimes in UTC.
+            cancel (threading.Event): Stops the scrape at the next scroll, API page
+                or rate-limit wait once set.
+            
+        Yields:
+            list: The tweets first seen in one scroll or API page.
+        """
+        self.cancel = cancel
+        self.tweet_count = 0
         self.progress_callback = progress_callback
+        self.watermark = None
+        self.window = window
+        self.window_complete = False
+        self.last_error = None
+        # A scraper kept for several runs must not drop tweets an earlier run saw
+        self.tweet_processor.reset()
+        self.metrics.reset(username)
+        profiler = RunProfiler(self.profile) if self.profile else None
+        # The HTTP engine's browser fallback switches modes for this run only
+        extraction_mode = self.extraction_mode
         
         try:
             # Set the username for file naming
             self.current_username = username
             
             # Initialize file handler
-            self.file_handler.initialize_file(username)
+            if window:
+                since, until = window
+                self.file_handler.initialize_file(
+                    username, name=f"{username}_{since:%Y%m%d%H%M%S}_{until:%Y%m%d%H%M%S}",
+                    directory=str(Path(SHARD_SETTINGS['directory']) / username)
+                )
+            else:
+                self.file_handler.initialize_file(username)
+            if self.extraction_mode == 'snapshot':
+                self.snapshots = SnapshotRecorder(
+                    username, Path(self.file_handler.path_stem).name, SITE_SETTINGS['base_url']
+                )
+            if profiler:
+                profiler.start()
             
-            # Navigate to profile and wait for initial load
-            self.browser.driver.get(f"https://twitter.com/{username}")
+            if window:
+                query = f"from:{username} since:{format_search_time(since)} until:{format_search_time(until)}"
+                reached = yield from self.scroll_timeline(self.search_url(query))
+                self.window_complete = reached == 'end'
+                return
             
-            # Wait for tweets with better selector
-            try:
-                self.browser.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'article[role="article"]'))
+            if self.skip_known or self.since_last_run:
+                self.tweet_processor.dedup_index = DedupIndex(username)
+            if self.since_last_run:
+                self.watermark = self.watermark_store.load(username)
+            
+            if self.engine == 'http':
+                try:
+                    reached = yield from self.iter_tweets_http(username, stop_at_known=True)
+                    self.finish_scan(reached)
+                    if self.needs_backfill(reached):
+                        if self.watermark['cursor']:
+                            self.start_scan(backfill=True)
+                            reached = yield from self.iter_tweets_http(username, cursor=self.watermark['cursor'])
+                            self.finish_scan(reached)
+                        else:
+                            console.print("[yellow]No saved API cursor to continue the backfill from; use the browser engine.[/yellow]")
+                    return
+                except KeyboardInterrupt:
+                    raise
+                except Exception as e:
+                    console.print(f"[yellow]HTTP engine failed ({str(e)}), falling back to the browser.[/yellow]")
+                    self.extraction_mode = 'network'
+            
+            reached = yield from self.scroll_timeline(f"{SITE_SETTINGS['base_url']}/{username}", stop_at_known=True)
+            self.finish_scan(reached)
+            if self.needs_backfill(reached):
+                # Search reaches below the oldest saved tweet without scrolling past the newer ones
+                self.start_scan(backfill=True)
+                reached = yield from self.scroll_timeline(
+                    self.search_url(f"from:{username} max_id:{self.watermark['oldest_id'] - 1}")
                 )
-                self.browser.random_sleep(2, 3)
-            except Exception as e:
-                console.print("[red]No tweets found on profile. Please check the username.[/red]")
-                return tweets
+                self.finish_scan(reached)
 
-            while True:
-                # Get all tweet articles directly
-                tweet_elements = self.browser.driver.find_elements(By.CSS_SELECTOR, 'article[role="article"]')
-                current_height = self.browser.driver.execute_script("return document.documentElement.scrollHeight")
-                
-                if not tweet_elements:
-                    consecutive_empty_scrolls += 1
-                    if consecutive_empty_scrolls >= max_retries:
-                        break
-                    self.browser.random_sleep(2, 3)
-                    continue
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Scraping interrupted by user.[/yellow]")
+            
+        except Exception as e:
+            self.last_error = str(e)
+            console.print(f"\n[red]An error occurred: {str(e)}[/red]")
+        
+        finally:
+            self.extraction_mode = extraction_mode
+            if profiler:
+                profile_path = profiler.stop(self.file_handler.path_stem)
+                if profile_path:
+                    console.print(f"[dim]Profile saved to {profile_path}[/dim]")
+            if self.snapshots:
+                self.close_snapshots()
+            # Queued tweets reach the file even when the run was interrupted or the consumer stopped early
+            saved = self.file_handler.close()
+            self.close_dedup_index(commit=saved)
+            if self.lean:
+                self.report_network_savings()
+            if WRITER_SETTINGS['report_stats']:
+                self.report_writer_stats()
+            self.finish_metrics()
 
-                # Process all visible tweets
-                new_tweets = []
-                for tweet in tweet_elements:
-                    tweet_data = self.process_tweet(tweet)
-                    if tweet_data:
-                        new_tweets.append(tweet_data)
-                
+    def scroll_timeline(self, url, stop_at_known=False):
+        """Open a timeline in the browser and scroll it to the end.
+        
+        In pipeline mode the tweets of each scroll are processed and saved
+        on a worker thread while the browser scrolls on, and the stage is
+        drained before the scan ends. Element mode processes on the scraping
+        thread, as each field is a WebDriver command. In snapshot mode the
+        snapshots still being parsed are waited for before the scan ends.
+        
+        Args:
+            url (str): The profile or search URL.
+            stop_at_known (bool): Stop at the tweets saved by earlier runs in since_last_run mode.
+            
+        Yields:
+            list: The tweets first seen in each scroll.
+            
+        Returns:
+            str: 'end' at the end of the timeline, 'known' when stopped at saved
+                tweets, or None if the timeline did not load or stayed rate limited.
+        """
+        if not self.pipeline or self.extraction_mode == 'element':
+            reached = yield from self.scroll_pages(url, stop_at_known)
+            new_tweets = self.process_batch(self.drain_snapshots())
+            if new_tweets:
+                self.record_batch(new_tweets)
+                yield new_tweets
+            return reached
+        
+        stage = PipelineStage('process', self.process_batch)
+        try:
+            reached = yield from self.scroll_pages(url, stop_at_known, stage)
+            stage.submit(self.drain_snapshots())
+            new_tweets = stage.drain()
+            if new_tweets:
+                self.record_batch(new_tweets)
+                yield new_tweets
+            return reached
+        finally:
+            # Batches still queued are saved before the output files close
+            stage.close()
+            if PIPELINE_SETTINGS['report_stats']:
+                self.report_pipeline_stats(stage)
+
+    def scroll_pages(self, url, stop_at_known=False, stage=None):
+        """Scroll an opened timeline, handing each scroll's tweets on.
+        
+        Args:
+            url (str): The profile or search URL.
+            stop_at_known (bool): Stop at the tweets saved by earlier runs in since_last_run mode.
+            stage (PipelineStage): Processing stage to submit the extracted tweets to,
+                or None to process them on this thread.
+            
+        Yields:
+            list: The tweets first seen in each scroll.
+            
+        Returns:
+            str: How the scroll ended, as for scroll_timeline.
+        """
+        consecutive_empty_scrolls = 0
+        last_height = 0
+        no_height_change = 0
+        scrolls = 0
+        max_retries = SCROLL_SETTINGS['max_retries']
+        # Extraction count and scroll measurement of each batch not yet processed
+        in_flight = deque()
+        scroll_fraction, scroll_timeout = None, None
+        self.start_scan(backfill=not stop_at_known)
+        
+        # Navigate to the timeline and wait for initial load
+        opened = self.open_timeline(url)
+        if not opened and self.scheduler:
+            opened = self.resume_timeline(url, self.browser.detect_rate_limit())
+        if not opened:
+            # An empty search means the backfill is past the first tweet
+            if opened is None or not stop_at_known:
+                return None if opened is None else 'end'
+            console.print("[red]No tweets found on profile. Please check the username.[/red]")
+            return None
+        while True:
+            if self.is_cancelled():
+                return None
+            
+            # Get all visible tweets and the current page height
+            with self.metrics.timer('extract'):
+                tweet_elements, current_height = self.collect_visible_tweets()
+            self.metrics.count('extracted', len(tweet_elements))
+            
+            # An empty result in incremental or network mode only means
+            # nothing new arrived since the last scroll, so keep scrolling
+            if not tweet_elements and self.extraction_mode in ('batch', 'element'):
+                consecutive_empty_scrolls += 1
+                if consecutive_empty_scrolls >= max_retries:
+                    return 'end'
+                self.browser.random_sleep(2, 3)
+                continue
+
+            # Process all visible tweets, or take the batches the stage finished meanwhile.
+            # Each result is checked with its own scroll's extraction, which in
+            # pipeline mode was up to `depth` scrolls ago.
+            extracted = len(tweet_elements) if self.extraction_mode in ('batch', 'element') else None
+            in_flight.append((extracted, self.browser.last_scroll))
+            if stage:
+                stage.submit(tweet_elements)
+                results = stage.collect()
+            else:
+                results = [self.process_batch(tweet_elements)]
+            
+            for new_tweets in results:
+                extracted, measurement = in_flight.popleft()
+                # Adapt the next scroll to how much this one yielded
+                if self.scroll_tuner:
+                    scroll_fraction, scroll_timeout = self.scroll_tuner.observe(
+                        extracted, len(new_tweets), measurement
+                    )
                 if new_tweets:
-                    tweets.extend(new_tweets)
+                    self.record_batch(new_tweets)
                     consecutive_empty_scrolls = 0
                     no_height_change = 0
                     
-                    # Update progress with tweet count
-                    if self.progress_callback:
-                        self.progress_callback(f"Collecting tweets... ({len(tweets)} found)")
+                    # The next scroll waits until the consumer wants more
+                    yield new_tweets
                 else:
                     consecutive_empty_scrolls += 1
+            
+            # A throttled timeline looks like one that ran out of tweets
+            if results and not results[-1] and self.scheduler:
+                throttle = self.browser.detect_rate_limit()
+                if throttle:
+                    resumed = self.resume_timeline(url, throttle)
+                    if not resumed:
+                        return None if resumed is None else 'end'
+                    consecutive_empty_scrolls = 0
+                    last_height = 0
+                    no_height_change = 0
+                    continue
+            
+            if stop_at_known and self.reached_known():
+                return 'known'
+            
+            # Keep the page small on long scrolls
+            scrolls += 1
+            reopened = self.maintain_page(url, scrolls) if self.prune else None
+            if reopened is not None:
+                if not reopened and self.scheduler:
+                    reopened = self.resume_timeline(url, self.browser.detect_rate_limit())
+                if not reopened:
+                    return None if reopened is None else 'end'
+                consecutive_empty_scrolls = 0
+                last_height = 0
+                no_height_change = 0
+                continue
+            
+            # Check if we're really at the end
+            if current_height == last_height:
+                no_height_change += 1
+                if no_height_change >= max_retries:
+                    return 'end'
+            else:
+                no_height_change = 0
                 
-                # Check if we're really at the end
-                if current_height == last_height:
-                    no_height_change += 1
-                    if no_height_change >= max_retries:
-                        break
+            last_height = current_height
+            
+            # Scroll with retries
+            scroll_success = False
+            for _ in range(max_retries):
+                self.pace()
+                self.metrics.count('scrolls')
+                with self.metrics.timer('scroll'):
+                    scrolled = self.browser.scroll(scroll_fraction, scroll_timeout)
+                if scrolled:
+                    scroll_success = True
+                    break
+                self.browser.random_sleep(1, 2)
+            
+            if not scroll_success:
+                return 'end'
+            
+            # Network mode drains it on every extraction; otherwise chromedriver
+            # would buffer a whole lean run's performance log until the report
+            if self.lean and self.extraction_mode != 'network':
+                self.browser.read_network_events()
+
+    def process_batch(self, tweet_elements):
+        """Process and save the tweets extracted in one scroll.
+        
+        Runs on the pipeline's worker thread in pipeline mode, so the
+        checkpoint follows the batch's own saves there.
+        
+        Args:
+            tweet_elements (list): Tweet elements or payloads from collect_visible_tweets.
+            
+        Returns:
+            list: The new tweets.
+        """
+        new_tweets = []
+        with self.metrics.timer('process'):
+            for tweet in tweet_elements:
+                if self.extraction_mode == 'element':
+                    tweet_data = self.process_tweet(tweet)
+                elif self.extraction_mode == 'network':
+                    tweet_data = self.process_api_tweet(tweet)
                 else:
-                    no_height_change = 0
-                    
-                last_height = current_height
+                    tweet_data = self.process_tweet_payload(tweet)
+                if tweet_data:
+                    new_tweets.append(tweet_data)
+        if new_tweets:
+            self.checkpoint()
+        return new_tweets
+
+    def record_batch(self, new_tweets):
+        """Count a scroll's new tweets and report the progress.
+        
+        Args:
+            new_tweets (list): The new tweets.
+        """
+        self.tweet_count += len(new_tweets)
+        self.metrics.count('tweets', len(new_tweets))
+        if self.scheduler:
+            self.scheduler.record_success()
+        
+        # Update progress with tweet count
+        self.emit('progress', f"Collecting tweets... ({self.tweet_count} found)")
+
+    def iter_tweets_http(self, username, cursor=None, stop_at_known=False):
+        """Collect tweets by paging through the timeline API directly.
+        
+        Reuses the browser's cookies and user agent, so no page is rendered
+        or scrolled after login.
+        
+        Args:
+            username (str): The Twitter username to scrape.
+            cursor (str): Bottom cursor to resume a backfill from.
+            stop_at_known (bool): Stop at the tweets saved by earlier runs in since_last_run mode.
+            
+        Yields:
+            list: The new tweets of each API page.
+            
+        Returns:
+            str: 'end' after the last page, 'known' when stopped at saved tweets,
+                or None if the API stayed rate limited.
+        """
+        client = TimelineClient.from_driver(self.browser.driver)
+        self.start_scan(backfill=not stop_at_known)
+        user_id = None
+        pages = None
+        try:
+            while True:
+                self.pace()
+                if self.is_cancelled():
+                    return None
+                try:
+                    with self.metrics.timer('fetch'):
+                        if user_id is None:
+                            user_id = client.get_user_id(username)
+                        if pages is None:
+                            pages = client.iter_pages(user_id, cursor=self.scan_cursor or cursor)
+                        payload = next(pages, None)
+                except RateLimitError as e:
+                    if self.scheduler is None:
+                        raise
+                    if not self.recover_from_rate_limit(str(e), e.reset_at):
+                        return None
+                    # Rotating accounts changed the session cookies
+                    client.close()
+                    client = TimelineClient.from_driver(self.browser.driver)
+                    pages = None
+                    continue
+                if payload is None:
+                    return 'end'
                 
-                # Scroll with retries
-                scroll_success = False
-                for _ in range(max_retries):
-                    if self.browser.smart_scroll():
-                        scroll_success = True
-                        break
-                    self.browser.random_sleep(1, 2)
+                self.metrics.count('pages')
+                if self.scheduler:
+                    self.scheduler.record_success()
+                with self.metrics.timer('parse'):
+                    tweets = self.timeline_parser.parse(payload)
+                self.metrics.count('extracted', len(tweets))
                 
-                if not scroll_success:
-                    break
+                new_tweets = []
+                with self.metrics.timer('process'):
+                    for tweet in tweets:
+                        tweet_data = self.process_api_tweet(tweet)
+                        if tweet_data:
+                            new_tweets.append(tweet_data)
+                # Resuming from this cursor skips only pages that were saved
+                self.scan_cursor = self.timeline_parser.extract_cursor(payload)
+                self.checkpoint()
+                self.tweet_count += len(new_tweets)
+                self.metrics.count('tweets', len(new_tweets))
+                
+                self.emit('progress', f"Collecting tweets... ({self.tweet_count} found)")
+                
+                if new_tweets:
+                    # The next page is only requested when the consumer wants more
+                    yield new_tweets
+                
+                if stop_at_known and self.reached_known():
+                    return 'known'
+        finally:
+            client.close()
 
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Scraping interrupted by user.[/yellow]")
+    def open_timeline(self, url):
+        """Navigate to a timeline and wait for its first tweets.
+        
+        Args:
+            url (str): The profile or search URL.
             
-        except Exception as e:
-            console.print(f"\n[red]An error occurred: {str(e)}[/red]")
+        Returns:
+            bool: True if tweets rendered, False otherwise.
+        """
+        with self.metrics.timer('navigate'):
+            self.browser.driver.get(url)
+            try:
+                self.browser.wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'article[role="article"]'))
+                )
+            except Exception:
+                return False
+        self.browser.random_sleep(2, 3)
+        return True
+
+    def maintain_page(self, url, scrolls):
+        """Collapse processed tweets, and reopen the timeline once its heap is too large.
         
-        return tweets
+        Collapsed tweets are no longer laid out, painted or extracted, so
+        layout and extraction cost stay the same however far the scroll has
+        gone. Their nodes stay in the DOM, so what the page still accumulates
+        is bounded by reopening it below the last saved tweet past
+        PRUNE_SETTINGS['heap_limit_mb'].
+        
+        Args:
+            url (str): The URL the scan started from.
+            scrolls (int): Scrolls so far in this scan.
+            
+        Returns:
+            bool: Whether the reopened timeline shows tweets, or None if the
+                page was not reopened.
+        """
+        if scrolls % PRUNE_SETTINGS['every'] == 0:
+            with self.metrics.timer('prune'):
+                result = self.browser.prune_articles(
+                    PRUNE_SETTINGS['keep_articles'], require_seen=self.extraction_mode == 'incremental'
+                )
+            self.metrics.count('pruned', result.get('pruned', 0))
+        
+        heap_limit = PRUNE_SETTINGS['heap_limit_mb']
+        if not heap_limit or scrolls % PRUNE_SETTINGS['heap_check_every'] != 0:
+            return None
+        heap = self.browser.get_heap_usage()
+        if heap is None or heap < heap_limit:
+            return None
+        
+        console.print(f"[dim]Page heap at {heap:.0f} MB, reopening the timeline below the last saved tweet...[/dim]")
+        self.metrics.count('reloads')
+        return self.open_timeline(self.resume_url(url))
+
+    def resume_url(self, url):
+        """Build the URL that continues a scan below the last tweet it saved.
+        
+        Args:
+            url (str): The URL the scan started from.
+            
+        Returns:
+            str: A search for the profile's tweets older than the scan position,
+                or url if the scan has not saved any of them yet.
+        """
+        position = self.tweet_processor.position_id
+        if position is None:
+            return url
+        query = f"from:{self.current_username} max_id:{position - 1}"
+        if self.window:
+            query += f" since:{format_search_time(self.window[0])}"
+        return self.search_url(query)
+
+    def search_url(self, query):
+        """Build the URL of a search timeline in latest-first order.
+        
+        Args:
+            query (str): The search query, e.g. 'from:nasa max_id:123'.
+            
+        Returns:
+            str: The search URL.
+        """
+        return f"{SITE_SETTINGS['base_url']}/search?q={quote(query)}&src=typed_query&f=live"
+
+    def resume_timeline(self, url, throttle):
+        """Wait out rate limiting and reopen the timeline where the scan stopped.
+        
+        Args:
+            url (str): The URL the scan started from.
+            throttle (tuple): (description, reset time) from detect_rate_limit, or None.
+            
+        Returns:
+            bool: True once tweets render again, False if none are left below
+                the scan position, or None after giving up.
+        """
+        while throttle:
+            if not self.recover_from_rate_limit(*throttle):
+                return None
+            if self.open_timeline(self.resume_url(url)):
+                return True
+            throttle = self.browser.detect_rate_limit()
+        return False
+
+    def recover_from_rate_limit(self, message, reset_at=None):
+        """Rotate to a rested account or back off after being throttled.
+        
+        Args:
+            message (str): What was detected.
+            reset_at (float): Unix time the limit resets, if the server said so.
+            
+        Returns:
+            bool: True if the scrape should retry, False to give up on the profile.
+        """
+        self.metrics.count('rate_limited')
+        console.print(f"[yellow]Rate limited: {message}[/yellow]")
+        self.emit('throttled', f"Rate limited: {message}", reset_at=reset_at)
+        
+        action, value = self.scheduler.on_rate_limited(reset_at)
+        if action == 'give_up':
+            console.print("[red]Still rate limited after repeated backoffs, stopping this profile. Progress is saved.[/red]")
+            return False
+        if action == 'rotate':
+            if self.switch_credentials(*value):
+                return True
+            action, value = 'wait', self.scheduler.backoff.next_delay()
+        
+        self.metrics.count('backoffs')
+        console.print(f"[yellow]Backing off for {value:.1f}s...[/yellow]")
+        self.emit('backoff', f"Rate limited, waiting {value:.1f}s...", delay=round(value, 1))
+        with self.metrics.timer('backoff'):
+            if not sleep(value, self.cancel):
+                return False
+        
+        credential = self.scheduler.ready_credentials()
+        if credential:
+            self.switch_credentials(*credential)
+        return True
+
+    def switch_credentials(self, username, password):
+        """Log the browser in as another account.
+        
+        Args:
+            username (str): Twitter username or email.
+            password (str): Twitter password.
+            
+        Returns:
+            bool: True if the browser is logged in as the account.
+        """
+        previous = self.scheduler.current
+        console.print(f"[yellow]Switching to account {username}...[/yellow]")
+        self.browser.driver.delete_all_cookies()
+        if self.login(username, password):
+            self.metrics.count('rotations')
+            self.emit('rotated', f"Switched to account {username}", account=username)
+            return True
+        
+        console.print(f"[red]Could not log in as {username}.[/red]")
+        self.scheduler.rest(username)
+        # Log back in as the throttled account to wait it out
+        for name, previous_password in self.scheduler.credentials:
+            if name == previous:
+                self.login(name, previous_password)
+        return False
+
+    def pace(self):
+        """Wait for the logged-in account's next request slot."""
+        if self.scheduler is None:
+            return
+        waited = self.scheduler.pace(self.cancel)
+        if waited:
+            self.metrics.observe('pace', waited)
+
+    def is_cancelled(self):
+        """Check whether the caller asked the run to stop.
+        
+        Returns:
+            bool: True once the run's cancel event is set.
+        """
+        return self.cancel is not None and self.cancel.is_set()
+
+    def emit(self, kind, message, **fields):
+        """Pass a progress event to the progress callback.
+        
+        Args:
+            kind (str): The event kind, e.g. 'progress' or 'backoff'.
+            message (str): Human-readable description.
+            **fields: Extra data for the event.
+        """
+        if self.progress_callback:
+            self.progress_callback(self.metrics.event(kind, message, **fields))
+
+    def finish_metrics(self):
+        """End the run's metrics and write its summary.
+        
+        Returns:
+            dict: The run summary.
+        """
+        self.metrics.finish()
+        summary = self.metrics.summary()
+        if METRICS_SETTINGS['summary'] and self.file_handler.path_stem:
+            self.metrics.write_summary(f"{self.file_handler.path_stem}.metrics.json")
+        if METRICS_SETTINGS['prometheus_textfile']:
+            write_textfile(METRICS_SETTINGS['prometheus_textfile'], [summary])
+        self.emit(
+            'finished',
+            f"Finished: {summary['tweets']} tweets in {summary['seconds']:.1f}s "
+            f"({summary['tweets_per_sec']:.1f}/s, {summary['duplicate_ratio']:.0%} duplicates)"
+        )
+        return summary
+
+    def start_scan(self, backfill=False):
+        """Reset the position tracking before scrolling or paging a timeline.
+        
+        Args:
+            backfill (bool): Whether the scan extends the saved stretch of the
+                timeline downwards. The first scan of an account does as well.
+        """
+        watermark = self.watermark
+        self.scan_cursor = None
+        self.scan_backfill = backfill
+        self.extends_backfill = watermark is not None and (backfill or watermark['newest_id'] is None)
+        self.tweet_processor.start_scan(
+            self.current_username,
+            watermark['newest_id'] if watermark else None
+        )
+
+    def reached_known(self):
+        """Check whether the scan has reached tweets saved by earlier runs.
+        
+        A pinned tweet or an old retweet is a single known tweet between new
+        ones, so only a run of them ends the new tweets.
+        
+        Returns:
+            bool: True if enough known tweets were seen in a row.
+        """
+        if not self.since_last_run:
+            return False
+        return self.tweet_processor.known_streak >= WATERMARK_SETTINGS['stop_after_known']
+
+    def needs_backfill(self, reached):
+        """Check whether older tweets remain after the new ones.
+        
+        Args:
+            reached (str): How the scan for new tweets ended.
+            
+        Returns:
+            bool: True if the saved stretch does not reach the first tweet yet.
+        """
+        watermark = self.watermark
+        return (
+            watermark is not None and WATERMARK_SETTINGS['backfill'] and reached == 'known'
+            and not watermark['complete'] and watermark['oldest_id'] is not None
+        )
+
+    def save_watermark(self):
+        """Record how far the scan got, after its tweets were saved."""
+        watermark = self.watermark
+        processor = self.tweet_processor
+        if watermark is None or not self.extends_backfill:
+            return
+        # The first scan of an account saves from the newest tweet downwards
+        if processor.newest_id is not None and not self.scan_backfill:
+            watermark['newest_id'] = max(watermark['newest_id'] or 0, processor.newest_id)
+        if processor.position_id is not None:
+            watermark['oldest_id'] = processor.position_id
+            watermark['cursor'] = self.scan_cursor
+        self.watermark_store.save(watermark)
+
+    def finish_scan(self, reached):
+        """Update the watermark once a scan has run to its end.
+        
+        New tweets only raise the watermark when the scan reached the known
+        ones, so an interrupted run never leaves a gap below it.
+        
+        Args:
+            reached (str): 'end', 'known', or None if the timeline did not load.
+        """
+        watermark = self.watermark
+        processor = self.tweet_processor
+        if watermark is None or reached is None:
+            return
+        if not self.file_handler.checkpoint(wait=True):
+            return
+        if processor.newest_id is not None and not self.extends_backfill:
+            watermark['newest_id'] = max(watermark['newest_id'], processor.newest_id)
+        if reached == 'end' and self.extends_backfill:
+            watermark['complete'] = True
+        self.watermark_store.save(watermark)
+        
+        if watermark['newest_id'] is not None:
+            history = "complete" if watermark['complete'] else f"back to {watermark['oldest_at']}"
+            console.print(f"[dim]Watermark at {watermark['newest_at']}, history {history}.[/dim]")
+
+    def checkpoint(self):
+        """Persist progress after a scroll or API page.
+        
+        Flushes the saved tweets and then records their keys in the dedup
+        index, so a crash never marks unsaved tweets as known. Neither the
+        keys nor the watermark move while the files fail to write.
+        """
+        with self.metrics.timer('checkpoint'):
+            if not self.file_handler.checkpoint(wait=self.tweet_processor.dedup_index is not None):
+                return
+            if self.tweet_processor.dedup_index is not None:
+                self.tweet_processor.dedup_index.flush()
+            self.save_watermark()
+
+    def close_dedup_index(self, commit=True):
+        """Close the profile's dedup index and report what it skipped.
+
+        Args:
+            commit (bool): False drops the keys of tweets that failed to save.
+        """
+        dedup_index = self.tweet_processor.dedup_index
+        if dedup_index is None:
+            return
+        self.tweet_processor.dedup_index = None
+        dedup_index.close(commit)
+        if dedup_index.skipped:
+            console.print(f"[dim]Skipped {dedup_index.skipped} tweets saved by earlier runs.[/dim]")
+
+    def drain_snapshots(self):
+        """Wait for the snapshots still being parsed.
+        
+        Returns:
+            list: Their article payloads, or an empty list outside snapshot mode.
+        """
+        if not self.snapshots:
+            return []
+        with self.metrics.timer('extract'):
+            payloads = self.snapshots.collect(wait=True)
+        self.metrics.count('extracted', len(payloads))
+        return payloads
+
+    def close_snapshots(self):
+        """Stop the snapshot parsing pool and report where the snapshots went."""
+        snapshots = self.snapshots
+        self.snapshots = None
+        snapshots.close()
+        if snapshots.keep and snapshots.snapshots:
+            console.print(f"[dim]Saved {snapshots.snapshots} page snapshots to {snapshots.directory}[/dim]")
+
+    def report_network_savings(self):
+        """Print what lean mode kept off the wire during the run.
+        
+        Returns:
+            dict: The browser's network report.
+        """
+        report = self.browser.get_network_report()
+        console.print(
+            f"[dim]Lean mode blocked {report['blocked_requests']} requests "
+            f"(~{report['estimated_bytes_saved'] / 1e6:.1f} MB saved), "
+            f"downloaded {report['bytes_received'] / 1e6:.1f} MB in {report['requests']} requests.[/dim]"
+        )
+        return report
+
+    def report_writer_stats(self):
+        """Print how the background writer kept up during the run.
+        
+        Returns:
+            dict: The file handler's writer statistics, or None.
+        """
+        stats = self.file_handler.get_stats()
+        for output_format, writer_stats in (stats or {}).items():
+            console.print(
+                f"[dim]Writer ({output_format}): {writer_stats['items']} tweets in {writer_stats['batches']} writes, "
+                f"{writer_stats['flushes']} flushes, {writer_stats['fsyncs']} fsyncs, "
+                f"peak queue {writer_stats['max_queue_depth']}, latency avg {writer_stats['avg_latency_ms']:.1f} ms "
+                f"/ max {writer_stats['max_latency_ms']:.1f} ms.[/dim]"
+            )
+        return stats
+
+    def report_pipeline_stats(self, stage):
+        """Print how the processing stage kept up with the browser.
+        
+        Args:
+            stage (PipelineStage): The finished stage.
+            
+        Returns:
+            dict: The stage's statistics.
+        """
+        stats = stage.get_stats()
+        console.print(
+            f"[dim]Pipeline ({stage.name}): {stats['items']} articles in {stats['batches']} batches, "
+            f"busy {stats['busy_seconds']:.1f}s / idle {stats['idle_seconds']:.1f}s, "
+            f"peak queue {stats['max_queue_depth']}; scrolling blocked {stats['blocked_seconds']:.1f}s "
+            f"and waited {stats['waited_seconds']:.1f}s for results.[/dim]"
+        )
+        return stats
 
     def close(self):
         """Close the browser and clean up."""
+        self.file_handler.close()
+        if self.database is not None:
+            self.database.close()
         self.browser.close()
 
+    def collect_visible_tweets(self):
+        """Collect the tweets currently rendered on the page.
+        
+        In 'batch' mode a single injected script returns the raw fields of every
+        visible article, instead of one WebDriver round trip per field. In
+        'incremental' mode the script only returns articles inserted into the
+        page since the previous call, so already-seen tweets cost nothing. In
+        'network' mode tweets are decoded from the timeline responses the page
+        fetched since the previous call instead of from the DOM. In 'snapshot'
+        mode the timeline's HTML is captured in one call and parsed in worker
+        processes, and the payloads of the snapshots parsed so far are returned.
+        
+        Returns:
+            tuple: (list of tweet elements or payloads, current page height).
+        """
+        if self.extraction_mode == 'snapshot':
+            result = self.browser.driver.execute_script(CAPTURE_TIMELINE_SCRIPT) or {}
+            if result.get('html'):
+                self.snapshots.submit(result['html'])
+            return self.snapshots.collect(), result.get('height', 0)
+        
+        if self.extraction_mode == 'element':
+            tweet_elements = self.browser.driver.find_elements(
+                By.CSS_SELECTOR, 'article[role="article"]:not([data-scraper-pruned])'
+            )
+            current_height = self.browser.driver.execute_script("return document.documentElement.scrollHeight")
+            return tweet_elements, current_height
+        
+        if self.extraction_mode == 'network':
+            tweets = []
+            for url, payload in self.browser.get_captured_responses(self.timeline_parser.is_timeline_url):
+                self._record_response(url, payload)
+                tweets.extend(self.timeline_parser.parse(payload))
+            current_height = self.browser.driver.execute_script("return document.documentElement.scrollHeight")
+            return tweets, current_height
+        
+        if self.extraction_mode == 'incremental':
+            result = self.browser.driver.execute_script(
+                DRAIN_NEW_ARTICLES_SCRIPT, EXTRACTION_SETTINGS['incremental_max_attempts']
+            ) or {}
+        else:
+            result = self.browser.driver.execute_script(EXTRACT_ARTICLES_SCRIPT) or {}
+        return result.get('articles') or [], result.get('height', 0)
+
     def process_tweet(self, tweet):
         """Process a single tweet and save it.
         
@@ -151,23 +1062,72 @@ class TwitterScraper:
             tweet: The Selenium element containing the tweet.
             
         Returns:
-            dict: The processed tweet data.
+            Tweet: The processed tweet, or None if it was a duplicate.
         """
         tweet_data = self.tweet_processor.process_tweet(tweet)
         if tweet_data:
             self._save_single_tweet(tweet_data)
         return tweet_data
 
+    def process_tweet_payload(self, payload):
+        """Process a single tweet payload from the batch extraction script and save it.
+        
+        Args:
+            payload (dict): Raw article fields extracted in the page.
+            
+        Returns:
+            Tweet: The processed tweet, or None if it was a duplicate.
+        """
+        tweet_data = self.tweet_processor.process_payload(payload)
+        if tweet_data:
+            self._save_single_tweet(tweet_data)
+        return tweet_data
+
+    def process_api_tweet(self, tweet_data):
+        """Process a single tweet decoded from a timeline response and save it.
+        
+        Args:
+            tweet_data (dict): Tweet data produced by the TimelineParser.
+            
+        Returns:
+            Tweet: The processed tweet, or None if it was a duplicate.
+        """
+        tweet_data = self.tweet_processor.process_api_tweet(tweet_data)
+        if tweet_data:
+            self._save_single_tweet(tweet_data)
+        return tweet_data
+
+    def _record_response(self, url, payload):
+        """Save a captured timeline response as a replayable fixture.
+        
+        Args:
+            url (str): The request URL of the response.
+            payload (dict): The decoded response body.
+        """
+        record_dir = NETWORK_SETTINGS['record_dir']
+        if not record_dir:
+            return
+        
+        try:
+            operation = url.split('?', 1)[0].rsplit('/', 1)[-1]
+            path = Path(record_dir) / f"{operation}_{self.recorded_responses:03d}.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(payload), encoding='utf-8')
+            self.recorded_responses += 1
+        except Exception as e:
+            console.print(f"[red]Error recording response: {str(e)}[/red]")
+
     def _save_single_tweet(self, tweet_data):
         """Save a single tweet immediately after processing.
         
         Args:
-            tweet_data (dict): The tweet data to save.
+            tweet_data (Tweet): The tweet to save.
             
         Returns:
             bool: True if the save was successful, False otherwise.
         """
-        return self.file_handler.save_tweet(tweet_data)
+        with self.metrics.timer('write'):
+            return self.file_handler.save_tweet(tweet_data)
 
     def save_tweets_to_file(self, tweets, username):
         """Save tweets to a text file with optimized formatting.
@@ -0,0 +1,446 @@
+"""Date-window sharding of one profile's history across worker processes."""
+
+import os
+import time
+import multiprocessing
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from rich.console import Console
+
+from .tweet.models import Tweet
+from .tweet.processor import TweetProcessor
+from .tweet.file_handler import TweetFileHandler
+from .tweet.database import TweetDatabase
+from .config.settings import BATCH_SETTINGS, SHARD_SETTINGS, OUTPUT_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# A window looks cut short when its oldest tweet is this many average
+# tweet gaps after the window's start, given at least this many tweets
+TRUNCATION_GAP = 10
+TRUNCATION_MIN_TWEETS = 20
+
+def scrape_window_job(job):
+    """Scrape one time window of a profile in a worker process.
+
+    Args:
+        job (dict): Job description with username, window, credentials and scraper options.
+
+    Returns:
+        dict: The job result with status, tweet count, shard file, oldest
+            tweet time, timing and the run's metrics summary.
+    """
+    from .scraper import TwitterScraper
+
+    # The merge reads each shard back as a single file
+    OUTPUT_SETTINGS['rotate_tweets'] = None
+    OUTPUT_SETTINGS['rotate_bytes'] = None
+
+    started = time.time()
+    result = {
+        'username': job['username'],
+        'since': job['since'],
+        'until': job['until'],
+        'attempt': job['attempt'],
+        'status': 'failed',
+        'tweets': 0,
+        'file': None,
+        'oldest': None,
+        'error': None,
+        'duration': 0.0,
+        'metrics': None
+    }
+
+    scraper = None
+    try:
+        if job.get('delay'):
+            time.sleep(job['delay'])
+
+        scraper = TwitterScraper(
+            headless=job['headless'],
+            extraction_mode=job.get('extraction_mode'),
+            engine='browser',
+            lean=job.get('lean'),
+            output_formats=['jsonl'],
+            skip_known=False,
+            since_last_run=False,
+            database=False,
+            credentials=job.get('credentials'),
+            profile=job.get('profile')
+        )
+        if not scraper.login(job['login_username'], job['login_password']):
+            result['error'] = "Login failed"
+            return result
+
+        tweet_count = 0
+        oldest = None
+        for tweet in scraper.iter_tweets(job['username'], window=(job['since'], job['until'])):
+            tweet_count += 1
+            if tweet.created_at is not None and (oldest is None or tweet.created_at < oldest):
+                oldest = tweet.created_at
+
+        result['tweets'] = tweet_count
+        result['file'] = scraper.file_handler.current_file
+        result['oldest'] = oldest
+        result['metrics'] = scraper.metrics.summary()
+        if scraper.window_complete:
+            result['status'] = 'done' if tweet_count else 'empty'
+        else:
+            result['error'] = "The search stopped before the end of the window"
+
+    except Exception as e:
+        result['error'] = str(e)
+
+    finally:
+        if scraper:
+            scraper.close()
+        result['duration'] = time.time() - started
+
+    return result
+
+def load_shard(path):
+    """Read the tweets of a shard file.
+
+    Args:
+        path (str): A JSON lines file written by a window job.
+
+    Returns:
+        list: The tweets, newest first.
+    """
+    tweets = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                tweets.append(Tweet.from_json(line))
+    tweets.sort(key=lambda tweet: (tweet.created_at or 0, tweet.status_id or 0), reverse=True)
+    return tweets
+
+def remove_shard(path):
+    """Delete a shard file and the manifest and metrics written next to it.
+
+    Args:
+        path (str): The shard's JSON lines file.
+    """
+    stem = Path(path)
+    stem = stem.with_name(stem.name[:-len('.jsonl')]) if stem.name.endswith('.jsonl') else stem
+    for shard_file in stem.parent.glob(f"{stem.name}.*"):
+        try:
+            shard_file.unlink()
+        except OSError as e:
+            console.print(f"[red]Could not remove {shard_file}: {str(e)}[/red]")
+
+class WindowPlanner:
+    """Splits a time range into search windows sized to the profile's tweet density.
+
+    Windows are handed out from the newest end of the range to the oldest.
+    Each finished window updates the estimated tweets per second, and the
+    next window is sized to hold about SHARD_SETTINGS['target_tweets'], so
+    quiet years take one search and busy weeks several.
+    """
+
+    def __init__(self, since, until, window=None, target=None):
+        """Initialize the planner.
+
+        Args:
+            since (datetime): Start of the range in UTC.
+            until (datetime): End of the range in UTC.
+            window (timedelta): Size of the first windows. Defaults to SHARD_SETTINGS['window_days'].
+            target (int): Tweets per window. Defaults to SHARD_SETTINGS['target_tweets'].
+        """
+        self.since = since
+        self.until = until
+        self.initial = window or timedelta(days=SHARD_SETTINGS['window_days'])
+        self.target = target or SHARD_SETTINGS['target_tweets']
+        self.min_window = timedelta(hours=SHARD_SETTINGS['min_window_hours'])
+        self.max_window = timedelta(days=SHARD_SETTINGS['max_window_days'])
+        self.cursor = until
+        self.requeued = []
+        self.density = None
+
+    def window_size(self):
+        """Get the size of the next window.
+
+        Returns:
+            timedelta: The size, within the configured bounds.
+        """
+        if self.density is None:
+            return self.initial
+        if self.density <= 0:
+            return self.max_window
+        size = timedelta(seconds=self.target / self.density)
+        return min(max(size, self.min_window), self.max_window)
+
+    def next_window(self):
+        """Hand out the next window to scrape.
+
+        Returns:
+            tuple: (since, until) datetimes, or None once the range is covered.
+        """
+        if self.requeued:
+            return self.requeued.pop()
+        if self.cursor <= self.since:
+            return None
+        start = max(self.since, self.cursor - self.window_size())
+        window = (start, self.cursor)
+        self.cursor = start
+        return window
+
+    def requeue(self, window):
+        """Hand a window out again, e.g. after its job failed.
+
+        Args:
+            window (tuple): (since, until) datetimes.
+        """
+        self.requeued.append(window)
+
+    def record(self, window, tweets):
+        """Update the density estimate with a finished window.
+
+        Args:
+            window (tuple): (since, until) datetimes the tweets were found in.
+            tweets (int): Tweets found.
+        """
+        seconds = (window[1] - window[0]).total_seconds()
+        density = tweets / seconds if seconds > 0 else 0.0
+        # Weigh recent windows most, as activity drifts over the years
+        self.density = density if self.density is None else (self.density + density) / 2
+
+class ShardedScraper:
+    """Scrapes one profile's history as date windows on a pool of worker processes.
+
+    Each window is a 'from:user since:... until:...' search timeline in its
+    own browser. The windows' tweets are merged by status ID into one
+    output, newest first, once every window is done.
+    """
+
+    def __init__(self, login_username, login_password, workers=None, retries=None, headless=True,
+                 extraction_mode=None, lean=None, output_formats=None, compression=None, database=None,
+                 credentials=None, profile=None, window=None, target=None):
+        """Initialize the sharded scraper.
+
+        Args:
+            login_username (str): Twitter username or email used by every worker.
+            login_password (str): Twitter password.
+            workers (int): Concurrent browsers. Defaults to BATCH_SETTINGS or the CPU count.
+            retries (int): Extra attempts for a failed window. Defaults to BATCH_SETTINGS['retries'].
+            headless (bool): Whether the browsers run headless.
+            extraction_mode (str): Passed to each TwitterScraper.
+            lean (bool): Passed to each TwitterScraper.
+            output_formats (list): Formats of the merged output. Defaults to OUTPUT_SETTINGS['formats'].
+            compression (str): Compression of the merged output.
+            database (bool): Whether to also save the merged tweets to the SQLite database.
+            credentials (list): (username, password) tuples each worker rotates
+                through when rate limited.
+            profile (str): Passed to each TwitterScraper.
+            window (timedelta): Size of the first windows. Defaults to SHARD_SETTINGS['window_days'].
+            target (int): Tweets per window. Defaults to SHARD_SETTINGS['target_tweets'].
+        """
+        self.login_username = login_username
+        self.login_password = login_password
+        self.workers = workers or BATCH_SETTINGS['workers'] or os.cpu_count() or 1
+        self.retries = BATCH_SETTINGS['retries'] if retries is None else retries
+        self.headless = headless
+        self.extraction_mode = extraction_mode
+        self.lean = lean
+        self.output_formats = output_formats
+        self.compression = compression
+        self.database = database
+        self.credentials = credentials
+        self.profile = profile
+        self.window = window
+        self.target = target
+
+    def build_job(self, username, window, attempt):
+        """Build the job description sent to a worker.
+
+        Args:
+            username (str): Profile to scrape.
+            window (tuple): (since, until) datetimes.
+            attempt (int): One-based attempt number.
+
+        Returns:
+            dict: The job description.
+        """
+        return {
+            'username': username,
+            'since': window[0],
+            'until': window[1],
+            'attempt': attempt,
+            'login_username': self.login_username,
+            'login_password': self.login_password,
+            'headless': self.headless,
+            'extraction_mode': self.extraction_mode,
+            'lean': self.lean,
+            'credentials': self.credentials,
+            'profile': self.profile,
+            'delay': BATCH_SETTINGS['retry_delay'] * (attempt - 1)
+        }
+
+    def run(self, username, since=None, until=None, progress_callback=None):
+        """Scrape a profile's tweets between two times and merge them into one output.
+
+        Args:
+            username (str): Profile to scrape.
+            since (datetime): Start of the range. Defaults to SHARD_SETTINGS['start'].
+            until (datetime): End of the range. Defaults to now.
+            progress_callback: Called with (window, status, result) on each status change.
+
+        Returns:
+            dict: The merged tweet count, output files, per-window results and
+                whether every window finished.
+        """
+        username = username.strip().lstrip('@')
+        since = since or datetime.fromisoformat(SHARD_SETTINGS['start']).replace(tzinfo=timezone.utc)
+        until = until or datetime.now(timezone.utc)
+        planner = WindowPlanner(since, until, self.window, self.target)
+        results = []
+        pending = {}
+        pool = self.create_pool()
+
+        def submit(window, attempt):
+            nonlocal pool
+            try:
+                future = pool.submit(scrape_window_job, self.build_job(username, window, attempt))
+            except BrokenProcessPool:
+                # A crashed worker poisons the whole pool, so start a fresh one
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = self.create_pool()
+                future = pool.submit(scrape_window_job, self.build_job(username, window, attempt))
+            pending[future] = (window, attempt)
+            if progress_callback:
+                progress_callback(window, 'queued', None)
+
+        attempts = {}
+
+        def fill():
+            # Windows are planned as workers free up, so each uses the latest density
+            while len(pending) < self.workers:
+                window = planner.next_window()
+                if window is None:
+                    break
+                attempts[window] = attempts.get(window, 0) + 1
+                submit(window, attempts[window])
+
+        try:
+            fill()
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    window, attempt = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # The worker process itself died, e.g. Chrome took it down
+                        result = {
+                            'username': username, 'since': window[0], 'until': window[1], 'attempt': attempt,
+                            'status': 'failed', 'tweets': 0, 'file': None, 'oldest': None,
+                            'error': str(e) or type(e).__name__, 'duration': 0.0, 'metrics': None
+                        }
+
+                    if result['status'] == 'failed' and attempt <= self.retries:
+                        planner.requeue(window)
+                        if progress_callback:
+                            progress_callback(window, 'retrying', result)
+                        continue
+
+                    results.append(result)
+                    if result['status'] != 'failed':
+                        self.plan_after(planner, window, result)
+                    if progress_callback:
+                        progress_callback(window, result['status'], result)
+                fill()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        complete = all(result['status'] != 'failed' for result in results)
+        tweet_count, files = self.merge(username, results)
+        if complete and not SHARD_SETTINGS['keep_shards']:
+            for result in results:
+                if result['file']:
+                    remove_shard(result['file'])
+
+        return {
+            'username': username,
+            'tweets': tweet_count,
+            'file': files[0] if files else None,
+            'files': files,
+            'windows': results,
+            'complete': complete
+        }
+
+    def plan_after(self, planner, window, result):
+        """Feed a finished window back into the planner.
+
+        Search can stop serving before a busy window's start. When the
+        oldest tweet found is much further from the start than the tweets
+        are from each other, the rest of the window is scraped again; if the
+        gap was real, that search comes back empty and costs little.
+
+        Args:
+            planner (WindowPlanner): The run's planner.
+            window (tuple): (since, until) datetimes of the job.
+            result (dict): The job result.
+        """
+        oldest = result['oldest']
+        if result['tweets'] >= TRUNCATION_MIN_TWEETS and oldest is not None:
+            oldest_at = datetime.fromtimestamp(oldest, timezone.utc)
+            spacing = (window[1] - oldest_at) / result['tweets']
+            if oldest_at - window[0] > max(spacing * TRUNCATION_GAP, planner.min_window):
+                planner.record((oldest_at, window[1]), result['tweets'])
+                # until: is exclusive, so the oldest second is fetched again and deduplicated
+                planner.requeue((window[0], oldest_at + timedelta(seconds=1)))
+                return
+        planner.record(window, result['tweets'])
+
+    def merge(self, username, results):
+        """Write the windows' tweets into one output, newest first, without duplicates.
+
+        Shards are read one at a time, so memory holds one window's tweets
+        and the keys of the tweets written so far.
+
+        Args:
+            username (str): The scraped profile.
+            results (list): Window job results.
+
+        Returns:
+            tuple: (tweets written, output file paths).
+        """
+        database = TweetDatabase() if self.database else None
+        file_handler = TweetFileHandler(self.output_formats, self.compression, database)
+        processor = TweetProcessor()
+        seen = set()
+        tweet_count = 0
+        try:
+            file_handler.initialize_file(username)
+            for result in sorted(results, key=lambda result: result['until'], reverse=True):
+                if not result['file']:
+                    continue
+                try:
+                    tweets = load_shard(result['file'])
+                except Exception as e:
+                    console.print(f"[red]Could not read shard {result['file']}: {str(e)}[/red]")
+                    continue
+                for tweet in tweets:
+                    key = processor.dedup_key(tweet.status_id, tweet.text, tweet.timestamp)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    file_handler.save_tweet(tweet)
+                    tweet_count += 1
+        finally:
+            file_handler.close()
+            if database is not None:
+                database.close()
+        return tweet_count, file_handler.current_files
+
+    def create_pool(self):
+        """Create the worker process pool.
+
+        Returns:
+            ProcessPoolExecutor: A spawn-context pool with one task per child.
+        """
+        context = multiprocessing.get_context('spawn')
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=context, max_tasks_per_child=1)
@@ -0,0 +1,212 @@
+"""Recording timeline snapshots and parsing them on a process pool."""
+
+import os
+import json
+import multiprocessing
+from pathlib import Path
+from functools import partial
+from collections import deque
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from rich.console import Console
+
+from .tweet.processor import TweetProcessor
+from .tweet.file_handler import TweetFileHandler
+from .tweet.snapshot_parser import parse_snapshot
+from .config.settings import SNAPSHOT_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# Describes a run's snapshots, for replaying them later
+META_FILE = 'meta.json'
+SNAPSHOT_PATTERN = '*.html.gz'
+
+def parse_workers(workers=None):
+    """Get the number of snapshot parsing processes.
+
+    Args:
+        workers (int): Requested processes. Defaults to SNAPSHOT_SETTINGS['workers'].
+
+    Returns:
+        int: The processes to start, by default one less than the CPU count,
+            leaving a core for the browser.
+    """
+    return workers or SNAPSHOT_SETTINGS['workers'] or max((os.cpu_count() or 2) - 1, 1)
+
+def create_parse_pool(workers):
+    """Create the process pool that parses snapshots.
+
+    Args:
+        workers (int): Parsing processes.
+
+    Returns:
+        ProcessPoolExecutor: A spawn-context pool.
+    """
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+class SnapshotRecorder:
+    """Saves a run's timeline snapshots and parses them in worker processes.
+
+    Each snapshot is written and parsed by a worker, so the scraping thread
+    only hands over the HTML. Results are collected in capture order, so
+    deduplication sees tweets in the order the page showed them.
+    """
+
+    def __init__(self, username, name, base_url, directory=None, backend=None, workers=None, keep=None):
+        """Initialize the recorder and its pool.
+
+        Args:
+            username (str): The profile being scraped.
+            name (str): Run name, used as the snapshot folder's name.
+            base_url (str): Origin the timeline is loaded from, to make permalinks absolute.
+            directory (str): Snapshot root. Defaults to SNAPSHOT_SETTINGS['directory'].
+            backend (str): Parser backend. Defaults to SNAPSHOT_SETTINGS['parser'].
+            workers (int): Parsing processes. Defaults to SNAPSHOT_SETTINGS['workers'].
+            keep (bool): Whether to save the snapshots. Defaults to SNAPSHOT_SETTINGS['keep'].
+        """
+        self.username = username
+        self.base_url = base_url
+        self.backend = backend or SNAPSHOT_SETTINGS['parser']
+        self.keep = SNAPSHOT_SETTINGS['keep'] if keep is None else keep
+        self.directory = Path(directory or SNAPSHOT_SETTINGS['directory']) / username / name
+        self.workers = parse_workers(workers)
+        self.pool = create_parse_pool(self.workers)
+        self.pending = deque()
+        self.snapshots = 0
+        self.started_at = datetime.now(timezone.utc)
+        if self.keep:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self.write_meta()
+
+    def submit(self, html):
+        """Hand a snapshot to the pool.
+
+        Waits for the oldest snapshot when twice as many as there are
+        workers are outstanding, so capturing never outruns parsing by much.
+
+        Args:
+            html (str): The captured HTML.
+        """
+        if len(self.pending) >= self.workers * 2:
+            self.pending[0].result()
+        path = str(self.directory / f"{self.snapshots:06d}.html.gz")
+        self.pending.append(self.pool.submit(
+            parse_snapshot, html, path, self.base_url, self.backend, self.keep
+        ))
+        self.snapshots += 1
+
+    def collect(self, wait=False):
+        """Take the payloads of parsed snapshots, in capture order.
+
+        Args:
+            wait (bool): Wait for every outstanding snapshot. Otherwise stop at
+                the first one still being parsed.
+
+        Returns:
+            list: Article payloads, as EXTRACT_ARTICLES_SCRIPT returns them.
+        """
+        payloads = []
+        while self.pending and (wait or self.pending[0].done()):
+            future = self.pending.popleft()
+            try:
+                payloads.extend(future.result())
+            except Exception as e:
+                console.print(f"[red]Error parsing snapshot: {str(e)}[/red]")
+        return payloads
+
+    def write_meta(self):
+        """Record what replaying the snapshots needs to know."""
+        meta = {
+            'username': self.username,
+            'base_url': self.base_url,
+            'started_at': self.started_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'snapshots': self.snapshots
+        }
+        try:
+            with open(self.directory / META_FILE, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2)
+        except Exception as e:
+            console.print(f"[red]Error writing snapshot metadata: {str(e)}[/red]")
+
+    def close(self):
+        """Wait for the pool and record the final snapshot count.
+
+        Snapshots nobody collected are still saved.
+        """
+        self.pool.shutdown(wait=True)
+        self.pending.clear()
+        if self.keep:
+            self.write_meta()
+
+def find_snapshot_runs(path):
+    """Find the recorded runs in a snapshot folder.
+
+    Args:
+        path (str): A run's folder, or any folder above runs, e.g. one profile's.
+
+    Returns:
+        list: Run folders, sorted by name.
+    """
+    path = Path(path)
+    if (path / META_FILE).exists():
+        return [path]
+    # Run folders are named after their output files, which end in the start time
+    return sorted(meta.parent for meta in path.rglob(META_FILE))
+
+def replay_snapshots(path, backend=None, workers=None, output_formats=None, compression=None,
+                     progress_callback=None):
+    """Re-extract the tweets of recorded runs without a browser.
+
+    Each run's snapshots are parsed on a process pool in capture order,
+    deduplicated like the original run and written to new output files
+    named after the run.
+
+    Args:
+        path (str): A run's folder, or a folder holding runs.
+        backend (str): Parser backend. Defaults to SNAPSHOT_SETTINGS['parser'].
+        workers (int): Parsing processes. Defaults to SNAPSHOT_SETTINGS['workers'].
+        output_formats (list): Output formats to write. Defaults to OUTPUT_SETTINGS['formats'].
+        compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+        progress_callback: Called with each run's result once it is written.
+
+    Returns:
+        list: Per run, a dict with the run folder, username, snapshot, article
+            and tweet counts, and the output files.
+    """
+    results = []
+    runs = find_snapshot_runs(path)
+    if not runs:
+        console.print(f"[yellow]No recorded snapshots found in {path}.[/yellow]")
+        return results
+
+    pool = create_parse_pool(parse_workers(workers))
+    try:
+        for run in runs:
+            with open(run / META_FILE, encoding='utf-8') as f:
+                meta = json.load(f)
+            snapshots = sorted(str(snapshot) for snapshot in run.glob(SNAPSHOT_PATTERN))
+            parse = partial(parse_snapshot, None, base_url=meta.get('base_url'), backend=backend)
+
+            processor = TweetProcessor()
+            file_handler = TweetFileHandler(output_formats, compression)
+            result = {'run': str(run), 'username': meta['username'], 'snapshots': len(snapshots), 'articles': 0,
+                      'tweets': 0, 'files': []}
+            try:
+                file_handler.initialize_file(meta['username'], name=f"{run.name}_replay")
+                # map keeps capture order while the snapshots parse in parallel
+                for payloads in pool.map(parse, snapshots):
+                    result['articles'] += len(payloads)
+                    for payload in payloads:
+                        tweet = processor.process_payload(payload)
+                        if tweet and file_handler.save_tweet(tweet):
+                            result['tweets'] += 1
+            finally:
+                file_handler.close()
+            result['files'] = file_handler.current_files
+            results.append(result)
+            if progress_callback:
+                progress_callback(result)
+    finally:
+        pool.shutdown(wait=True)
+    return results
@@ -0,0 +1,6 @@
+"""Offline stand-ins for the Twitter web app and API."""
+
+from .fixture_server import StandInServer, FixtureServer
+from .mock_timeline import MockTimelineServer
+
+__all__ = ['StandInServer', 'FixtureServer', 'MockTimelineServer']
@@ -0,0 +1,444 @@
+"""Local HTTP stand-in that replays recorded timeline responses."""
+
+import json
+import time
+import threading
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from rich.console import Console
+
+from ..tweet.timeline_parser import TimelineParser
+
+# Initialize Rich console
+console = Console()
+
+# Minimal profile page: fetches the timeline endpoint like the web app does
+# and renders each tweet with the markup TweetProcessor reads.
+TIMELINE_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Timeline stand-in</title>
+<style>
+article { min-height: 240px; border-bottom: 1px solid #ccc; padding: 12px; }
+[data-testid="error-detail"] { padding: 24px; text-align: center; }
+</style>
+</head>
+<body>
+<a aria-label="Profile" href="/home"></a>
+<div id="spacer"></div>
+<div aria-label="Timeline" id="timeline"></div>
+<script>
+var operation = "__OPERATION__";
+var recycle = __RECYCLE__;
+var cursor = null;
+var loading = false;
+var done = false;
+var failed = false;
+
+function collect(node, tweets, cursors) {
+    if (Array.isArray(node)) {
+        node.forEach(function(child) { collect(child, tweets, cursors); });
+        return;
+    }
+    if (!node || typeof node !== 'object') {
+        return;
+    }
+    if (node.legacy && node.legacy.full_text !== undefined && node.rest_id) {
+        tweets.push(node);
+        return;
+    }
+    if (node.cursorType === 'Bottom') {
+        cursors.push(node.value);
+    }
+    Object.keys(node).forEach(function(key) { collect(node[key], tweets, cursors); });
+}
+
+function escapeHtml(text) {
+    var div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+function render(tweet) {
+    var legacy = tweet.legacy;
+    var user = (((tweet.core || {}).user_results || {}).result || {}).legacy || {};
+    var permalink = '/' + (user.screen_name || 'i') + '/status/' + tweet.rest_id;
+    var article = document.createElement('article');
+    article.setAttribute('role', 'article');
+    article.innerHTML =
+        '<a href="' + permalink + '"><time datetime="' + new Date(legacy.created_at).toISOString() + '"></time></a>' +
+        '<div data-testid="tweetText" lang="en">' + escapeHtml(legacy.full_text) + '</div>' +
+        '<div role="group">' +
+        '<div role="button" aria-label="' + legacy.reply_count + ' Replies. Reply"></div>' +
+        '<div role="button" aria-label="' + legacy.retweet_count + ' reposts. Repost"></div>' +
+        '<div role="button" aria-label="' + legacy.favorite_count + ' Likes. Like"></div>' +
+        '<a href="' + permalink + '/analytics" aria-label="' + ((tweet.views || {}).count || 0) + ' views. View post analytics"></a>' +
+        '</div>';
+    document.getElementById('timeline').appendChild(article);
+}
+
+// Like the web app's virtualized list, drop the oldest articles and keep
+// the page height with a spacer so the scroll position does not jump
+function recycleArticles() {
+    var timeline = document.getElementById('timeline');
+    var spacer = document.getElementById('spacer');
+    while (recycle && timeline.children.length > recycle) {
+        var first = timeline.firstElementChild;
+        spacer.style.height = (spacer.offsetHeight + first.offsetHeight) + 'px';
+        timeline.removeChild(first);
+    }
+}
+
+// Like the web app, a failed request stops loading until Retry is clicked
+function showError() {
+    failed = true;
+    var error = document.createElement('div');
+    error.setAttribute('data-testid', 'error-detail');
+    error.innerHTML = '<span>Something went wrong. Try reloading.</span><button type="button">Retry</button>';
+    error.querySelector('button').addEventListener('click', function() {
+        error.parentNode.removeChild(error);
+        failed = false;
+        load();
+    });
+    document.body.appendChild(error);
+}
+
+function load() {
+    if (loading || done || failed) {
+        return;
+    }
+    loading = true;
+    var variables = {count: 20};
+    if (cursor) {
+        variables.cursor = cursor;
+    }
+    fetch('/i/api/graphql/standin/' + operation + '?variables=' + encodeURIComponent(JSON.stringify(variables)))
+        .then(function(response) {
+            if (!response.ok) {
+                throw new Error('HTTP ' + response.status);
+            }
+            return response.json();
+        })
+        .then(function(payload) {
+            var tweets = [];
+            var cursors = [];
+            collect(payload, tweets, cursors);
+            tweets.forEach(render);
+            recycleArticles();
+            cursor = cursors.length ? cursors[0] : null;
+            done = !cursor || !tweets.length;
+            loading = false;
+        })
+        .catch(function() {
+            loading = false;
+            showError();
+        });
+}
+
+window.addEventListener('scroll', function() {
+    if (window.innerHeight + window.scrollY > document.documentElement.scrollHeight - 1500) {
+        load();
+    }
+});
+load();
+</script>
+</body>
+</html>
+"""
+
+class StandInServer:
+    """Serves a profile page and timeline GraphQL endpoint on localhost.
+
+    Subclasses decide which payload answers each timeline request.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=0, operation='UserTweets', recycle=None,
+                 rate_limit=None, rate_window=60, error_every=None):
+        """Initialize the stand-in server.
+
+        Args:
+            host (str): Interface to bind.
+            port (int): Port to bind, 0 for any free port.
+            latency (float): Seconds to wait before answering each API request.
+            operation (str): Timeline operation the profile page requests.
+            recycle (int): Articles the profile page keeps rendered; older ones
+                are removed as new ones load. None keeps them all.
+            rate_limit (int): API requests each session (auth_token cookie) may
+                make per window before getting 429s. None never throttles.
+            rate_window (float): Length of a rate limit window in seconds.
+            error_every (int): Fail every Nth API request with a 500, which the
+                profile page shows as "Something went wrong". None never fails.
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.operation = operation
+        self.recycle = recycle
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.error_every = error_every
+        self.windows = {}
+        self.api_requests = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+        self.httpd = None
+        self.thread = None
+        self.request_count = 0
+
+    @property
+    def base_url(self):
+        """str: Base URL to put in SITE_SETTINGS['base_url']."""
+        return f"http://{self.host}:{self.port}"
+
+    def get_page(self, operation, variables):
+        """Return the payload answering one timeline request.
+
+        Args:
+            operation (str): The GraphQL operation name.
+            variables (dict): The decoded request variables.
+
+        Returns:
+            dict: The response payload, or None for a 404.
+        """
+        raise NotImplementedError
+
+    def session_key(self, handler):
+        """Identify the session a request belongs to, as rate limits apply per account.
+
+        Args:
+            handler: The active request handler.
+
+        Returns:
+            str: The auth_token cookie, or 'anonymous'.
+        """
+        for cookie in (handler.headers.get('cookie') or '').split(';'):
+            name, _, value = cookie.strip().partition('=')
+            if name == 'auth_token' and value:
+                return value
+        return 'anonymous'
+
+    def check_limits(self, handler):
+        """Decide whether to throttle or fail an API request.
+
+        Args:
+            handler: The active request handler.
+
+        Returns:
+            tuple: (status, headers, body) of the injected response, or None
+                to answer normally.
+        """
+        with self.lock:
+            self.api_requests += 1
+            if self.error_every and self.api_requests % self.error_every == 0:
+                return 500, {}, b'{"errors":[{"code":131,"message":"Internal error."}]}'
+
+            if not self.rate_limit:
+                return None
+            now = time.time()
+            key = self.session_key(handler)
+            window = self.windows.get(key)
+            if window is None or now >= window[0] + self.rate_window:
+                window = self.windows[key] = [now, 0]
+            window[1] += 1
+            if window[1] <= self.rate_limit:
+                return None
+
+            self.throttled += 1
+            headers = {
+                'x-rate-limit-limit': str(self.rate_limit),
+                'x-rate-limit-remaining': '0',
+                'x-rate-limit-reset': str(int(window[0] + self.rate_window) + 1)
+            }
+            return 429, headers, b'{"errors":[{"code":88,"message":"Rate limit exceeded."}]}'
+
+    def handle_api(self, handler, parsed):
+        """Answer a GraphQL request.
+
+        Args:
+            handler: The active request handler.
+            parsed: The parsed request URL.
+        """
+        injected = self.check_limits(handler)
+        if injected:
+            status, headers, body = injected
+            self.send(handler, status, 'application/json', body, headers)
+            return
+
+        operation = parsed.path.rsplit('/', 1)[-1]
+        try:
+            variables = json.loads(parse_qs(parsed.query).get('variables', ['{}'])[0])
+        except ValueError:
+            variables = {}
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        payload = self.get_page(operation, variables)
+        if payload is None:
+            self.send(handler, 404, 'application/json', b'{"errors":[{"message":"Not found"}]}')
+        else:
+            self.send(handler, 200, 'application/json', json.dumps(payload).encode('utf-8'))
+
+    def handle_page(self, handler, parsed):
+        """Answer a request for any non-API page with the profile page.
+
+        Args:
+            handler: The active request handler.
+            parsed: The parsed request URL.
+        """
+        page = TIMELINE_PAGE.replace('__OPERATION__', self.operation).replace('__RECYCLE__', str(self.recycle or 0))
+        self.send(handler, 200, 'text/html; charset=utf-8', page.encode('utf-8'))
+
+    def send(self, handler, status, content_type, body, headers=None):
+        """Write a complete response.
+
+        Args:
+            handler: The active request handler.
+            status (int): HTTP status code.
+            content_type (str): Content-Type header value.
+            body (bytes): Response body.
+            headers (dict): Extra response headers.
+        """
+        handler.send_response(status)
+        handler.send_header('Content-Type', content_type)
+        handler.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def create_handler(self):
+        """Create the request handler class bound to this server.
+
+        Returns:
+            type: A BaseHTTPRequestHandler subclass.
+        """
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.request_count += 1
+                parsed = urlparse(self.path)
+                if parsed.path.startswith('/i/api/graphql/'):
+                    server.handle_api(self, parsed)
+                else:
+                    server.handle_page(self, parsed)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Start serving in a background thread.
+
+        Returns:
+            str: The server's base URL.
+        """
+        self.httpd = ThreadingHTTPServer((self.host, self.port), self.create_handler())
+        self.httpd.daemon_threads = True
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Stop serving and release the port."""
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+class FixtureServer(StandInServer):
+    """Replays recorded timeline responses, following their cursors."""
+
+    def __init__(self, fixtures_dir=None, **kwargs):
+        """Initialize the fixture server.
+
+        Fixtures are files named '<Operation>_<NNN>.json' as written by the
+        scraper's network mode when NETWORK_SETTINGS['record_dir'] is set.
+
+        Args:
+            fixtures_dir (str): Directory holding recorded responses.
+                Defaults to the bundled sample fixtures.
+            **kwargs: Passed to StandInServer.
+        """
+        super().__init__(**kwargs)
+        self.fixtures_dir = Path(fixtures_dir or Path(__file__).parent / 'fixtures')
+        self.parser = TimelineParser()
+        self.pages = {}
+        self.cursor_index = {}
+        self.load_fixtures()
+
+    def load_fixtures(self):
+        """Load recorded responses and index them by the cursor that requests them."""
+        for path in sorted(self.fixtures_dir.glob('*_*.json')):
+            operation = path.stem.rsplit('_', 1)[0]
+            payload = json.loads(path.read_text(encoding='utf-8'))
+            pages = self.pages.setdefault(operation, [])
+            pages.append(payload)
+
+        for operation, pages in self.pages.items():
+            for index, payload in enumerate(pages[:-1]):
+                cursor = self.parser.extract_cursor(payload)
+                if cursor:
+                    self.cursor_index[(operation, cursor)] = index + 1
+
+        if not self.pages:
+            console.print(f"[yellow]No fixtures found in {self.fixtures_dir}[/yellow]")
+
+    def get_page(self, operation, variables):
+        """Return the recorded page matching the request's cursor.
+
+        Args:
+            operation (str): The GraphQL operation name.
+            variables (dict): The decoded request variables.
+
+        Returns:
+            dict: The recorded payload, or None if nothing matches.
+        """
+        pages = self.pages.get(operation)
+        if not pages:
+            return None
+
+        cursor = variables.get('cursor')
+        if not cursor:
+            return pages[0]
+
+        index = self.cursor_index.get((operation, cursor))
+        if index is None:
+            # Past the end of the recording: an empty page ends the timeline
+            return {'data': {'user': {'result': {'timeline_v2': {'timeline': {'instructions': []}}}}}}
+        return pages[index]
+
+def main():
+    """Serve a fixture directory until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay recorded timeline responses on localhost.")
+    parser.add_argument('fixtures_dir', nargs='?', help="Directory of recorded responses")
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--latency', type=float, default=0)
+    args = parser.parse_args()
+
+    server = FixtureServer(args.fixtures_dir, port=args.port, latency=args.latency)
+    console.print(f"[green]Serving fixtures from {server.fixtures_dir} at {server.start()}[/green]")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
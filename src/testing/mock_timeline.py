@@ -0,0 +1,115 @@
+"""Local HTTP stand-in that emulates timeline cursor pagination."""
+
+import time
+from rich.console import Console
+
+from .fixture_server import StandInServer
+from .payloads import build_synthetic_page
+
+# Initialize Rich console
+console = Console()
+
+class MockTimelineServer(StandInServer):
+    """Generates a synthetic timeline and pages through it by cursor."""
+
+    def __init__(self, total=200, page_size=20, user_id='1000001', require_auth=False, **kwargs):
+        """Initialize the mock timeline server.
+
+        Args:
+            total (int): Tweets in the timeline, or None for an endless one.
+            page_size (int): Tweets per page, regardless of the requested count.
+            user_id (str): Rest ID returned for every screen name.
+            require_auth (bool): Reject API requests without a CSRF token matching ct0.
+            **kwargs: Passed to StandInServer.
+        """
+        super().__init__(**kwargs)
+        self.total = total
+        self.page_size = page_size
+        self.user_id = user_id
+        self.require_auth = require_auth
+
+    def is_authorized(self, handler):
+        """Check the request carries the session headers the real API requires.
+
+        Args:
+            handler: The active request handler.
+
+        Returns:
+            bool: True if the request would be accepted.
+        """
+        if not self.require_auth:
+            return True
+        csrf_token = handler.headers.get('x-csrf-token')
+        cookies = handler.headers.get('cookie') or ''
+        return bool(csrf_token) and f"ct0={csrf_token}" in cookies
+
+    def handle_api(self, handler, parsed):
+        """Answer a GraphQL request, rejecting unauthenticated ones.
+
+        Args:
+            handler: The active request handler.
+            parsed: The parsed request URL.
+        """
+        if not self.is_authorized(handler):
+            self.send(handler, 403, 'application/json', b'{"errors":[{"code":353,"message":"This request requires a matching csrf cookie and header."}]}')
+            return
+        super().handle_api(handler, parsed)
+
+    def get_page(self, operation, variables):
+        """Return the user lookup or the timeline page addressed by the cursor.
+
+        Args:
+            operation (str): The GraphQL operation name.
+            variables (dict): The decoded request variables.
+
+        Returns:
+            dict: The response payload, or None for unknown operations.
+        """
+        if operation == 'UserByScreenName':
+            screen_name = variables.get('screen_name', 'mock_user')
+            return {'data': {'user': {'result': {
+                '__typename': 'User',
+                'rest_id': self.user_id,
+                'legacy': {'screen_name': screen_name}
+            }}}}
+
+        if operation != self.operation:
+            return None
+
+        cursor = variables.get('cursor') or 'page-0'
+        try:
+            page = int(cursor.rsplit('-', 1)[-1])
+        except ValueError:
+            page = 0
+        return build_synthetic_page(page, self.page_size, screen_name='mock_user', total=self.total)
+
+def main():
+    """Serve a synthetic paginated timeline until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve a synthetic paginated timeline on localhost.")
+    parser.add_argument('--port', type=int, default=8801)
+    parser.add_argument('--total', type=int, default=200)
+    parser.add_argument('--page-size', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0)
+    parser.add_argument('--recycle', type=int, help="Articles kept rendered, like the web app's virtualized list")
+    parser.add_argument('--require-auth', action='store_true')
+    parser.add_argument('--rate-limit', type=int, help="API requests per session and window before answering 429")
+    parser.add_argument('--rate-window', type=float, default=60, help="Rate limit window in seconds")
+    parser.add_argument('--error-every', type=int, help="Fail every Nth API request with a 500")
+    args = parser.parse_args()
+
+    server = MockTimelineServer(
+        total=args.total, page_size=args.page_size, require_auth=args.require_auth,
+        port=args.port, latency=args.latency, recycle=args.recycle,
+        rate_limit=args.rate_limit, rate_window=args.rate_window, error_every=args.error_every
+    )
+    console.print(f"[green]Serving {args.total} synthetic tweets at {server.start()}[/green]")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == '__main__':
+    main()
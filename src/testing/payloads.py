@@ -0,0 +1,128 @@
+"""Builders for timeline GraphQL payloads shaped like the real API's."""
+
+from datetime import datetime, timedelta, timezone
+
+def build_tweet_result(status_id, text, created_at, screen_name='fixture_user', metrics=None):
+    """Build a tweet result object as found in timeline entries.
+    
+    Args:
+        status_id (str): The tweet's status ID.
+        text (str): The tweet text.
+        created_at (datetime): When the tweet was posted.
+        screen_name (str): The author's screen name.
+        metrics (dict): Optional reply/retweet/like/view counts.
+        
+    Returns:
+        dict: The tweet result object.
+    """
+    metrics = metrics or {}
+    return {
+        '__typename': 'Tweet',
+        'rest_id': str(status_id),
+        'core': {
+            'user_results': {
+                'result': {
+                    '__typename': 'User',
+                    'legacy': {'screen_name': screen_name}
+                }
+            }
+        },
+        'views': {'count': str(metrics.get('views', 0)), 'state': 'EnabledWithCount'},
+        'legacy': {
+            'id_str': str(status_id),
+            'full_text': text,
+            'created_at': created_at.strftime('%a %b %d %H:%M:%S +0000 %Y'),
+            'reply_count': metrics.get('comments', 0),
+            'retweet_count': metrics.get('retweets', 0),
+            'favorite_count': metrics.get('likes', 0),
+            'quote_count': 0
+        }
+    }
+
+def build_timeline_payload(tweet_results, bottom_cursor=None, top_cursor=None):
+    """Build a UserTweets response around a page of tweet results.
+    
+    Args:
+        tweet_results (list): Tweet result objects, newest first.
+        bottom_cursor (str): Cursor for the next (older) page, if any.
+        top_cursor (str): Cursor for newer tweets, if any.
+        
+    Returns:
+        dict: The GraphQL response payload.
+    """
+    entries = []
+    for result in tweet_results:
+        entries.append({
+            'entryId': f"tweet-{result['rest_id']}",
+            'sortIndex': result['rest_id'],
+            'content': {
+                'entryType': 'TimelineTimelineItem',
+                '__typename': 'TimelineTimelineItem',
+                'itemContent': {
+                    'itemType': 'TimelineTweet',
+                    '__typename': 'TimelineTweet',
+                    'tweet_results': {'result': result}
+                }
+            }
+        })
+    
+    for cursor_type, value in (('Top', top_cursor), ('Bottom', bottom_cursor)):
+        if value:
+            entries.append({
+                'entryId': f"cursor-{cursor_type.lower()}-{value}",
+                'sortIndex': '0',
+                'content': {
+                    'entryType': 'TimelineTimelineCursor',
+                    '__typename': 'TimelineTimelineCursor',
+                    'value': value,
+                    'cursorType': cursor_type
+                }
+            })
+    
+    return {
+        'data': {
+            'user': {
+                'result': {
+                    '__typename': 'User',
+                    'timeline_v2': {
+                        'timeline': {
+                            'instructions': [
+                                {'type': 'TimelineClearCache'},
+                                {'type': 'TimelineAddEntries', 'entries': entries}
+                            ]
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+def build_synthetic_page(page, page_size, screen_name='fixture_user', total=None, start=None):
+    """Build one page of a deterministic synthetic timeline.
+    
+    Args:
+        page (int): Zero-based page number.
+        page_size (int): Tweets per page.
+        screen_name (str): The author's screen name.
+        total (int): Total tweets in the timeline, or None for unlimited.
+        start (datetime): Timestamp of the newest tweet.
+        
+    Returns:
+        dict: The GraphQL response payload, with a bottom cursor while tweets remain.
+    """
+    start = start or datetime(2024, 1, 1, tzinfo=timezone.utc)
+    first = page * page_size
+    last = first + page_size if total is None else min(first + page_size, total)
+    
+    results = []
+    for index in range(first, last):
+        results.append(build_tweet_result(
+            status_id=1740000000000000000 - index,
+            text=f"Synthetic tweet #{index} from @{screen_name}",
+            created_at=start - timedelta(minutes=17 * index),
+            screen_name=screen_name,
+            metrics={'comments': index % 7, 'retweets': index % 11, 'likes': index % 97, 'views': index * 13}
+        ))
+    
+    has_more = total is None or last < total
+    return build_timeline_payload(results, bottom_cursor=f"page-{page + 1}" if has_more else None)
@@ -2,5 +2,7 @@
 
 from .processor import TweetProcessor
 from .file_handler import TweetFileHandler
+from .models import Tweet
+from .database import TweetDatabase
 
-__all__ = ['TweetProcessor', 'TweetFileHandler'] 
\ No newline at end of file
+__all__ = ['TweetProcessor', 'TweetFileHandler', 'Tweet', 'TweetDatabase'] 
\ No newline at end of file
@@ -0,0 +1,275 @@
+"""SQLite storage for tweets from every scrape run."""
+
+import time
+import sqlite3
+from pathlib import Path
+from rich.console import Console
+
+from .models import Tweet
+from .processor import TweetProcessor
+from ..config.settings import DATABASE_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE COLLATE NOCASE,
+    first_scraped_at INTEGER NOT NULL,
+    last_scraped_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tweets (
+    id INTEGER PRIMARY KEY,
+    status_id INTEGER,
+    account_id INTEGER NOT NULL REFERENCES accounts (id),
+    author TEXT,
+    created_at INTEGER,
+    text TEXT NOT NULL,
+    url TEXT,
+    comments INTEGER NOT NULL DEFAULT 0,
+    retweets INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    views INTEGER NOT NULL DEFAULT 0,
+    first_seen_at INTEGER NOT NULL,
+    last_seen_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tweets_account_created ON tweets (account_id, created_at);
+CREATE INDEX IF NOT EXISTS tweets_status_id ON tweets (status_id);
+CREATE TABLE IF NOT EXISTS account_tweets (
+    account_id INTEGER NOT NULL REFERENCES accounts (id),
+    tweet_id INTEGER NOT NULL REFERENCES tweets (id),
+    PRIMARY KEY (account_id, tweet_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS metric_snapshots (
+    tweet_id INTEGER NOT NULL REFERENCES tweets (id),
+    scraped_at INTEGER NOT NULL,
+    comments INTEGER NOT NULL,
+    retweets INTEGER NOT NULL,
+    likes INTEGER NOT NULL,
+    views INTEGER NOT NULL,
+    PRIMARY KEY (tweet_id, scraped_at)
+) WITHOUT ROWID;
+"""
+
+# A snapshot is only taken when the metrics differ from the stored ones
+INSERT_SNAPSHOT = """
+INSERT OR REPLACE INTO metric_snapshots (tweet_id, scraped_at, comments, retweets, likes, views)
+SELECT ?1, ?2, ?3, ?4, ?5, ?6 WHERE NOT EXISTS (
+    SELECT 1 FROM tweets WHERE id = ?1 AND comments = ?3 AND retweets = ?4 AND likes = ?5 AND views = ?6
+)
+"""
+
+UPSERT_TWEET = """
+INSERT INTO tweets (id, status_id, account_id, author, created_at, text, url,
+                    comments, retweets, likes, views, first_seen_at, last_seen_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    account_id = CASE
+        WHEN excluded.author = (SELECT username FROM accounts WHERE id = excluded.account_id) COLLATE NOCASE
+        THEN excluded.account_id ELSE tweets.account_id
+    END,
+    text = excluded.text,
+    comments = excluded.comments,
+    retweets = excluded.retweets,
+    likes = excluded.likes,
+    views = excluded.views,
+    last_seen_at = excluded.last_seen_at
+"""
+
+# Every profile a tweet was scraped from, e.g. the retweeter's as well as the author's
+LINK_TWEET = "INSERT OR IGNORE INTO account_tweets (account_id, tweet_id) VALUES (?, ?)"
+
+class TweetDatabase:
+    """Stores tweets in one SQLite database shared by all runs.
+
+    Tweets are keyed like TweetProcessor dedups them: by status ID, or by a
+    negative content hash when it is unknown. Saving a tweet again updates
+    its metrics, and every change of the metrics is kept as a snapshot.
+    A tweet belongs to the first profile it was scraped from until its
+    author's own profile is scraped; account_tweets links it to every
+    profile it appeared on, so retweets are found under the retweeter.
+    Writes are buffered and committed in batches, and WAL mode lets
+    queries and other workers' writes run alongside a scrape.
+    """
+
+    def __init__(self, path=None):
+        """Open or create the database.
+
+        Args:
+            path (str): Database file. Defaults to DATABASE_SETTINGS['path'].
+        """
+        self.path = Path(path or DATABASE_SETTINGS['path'])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.processor = TweetProcessor()
+        self.pending = []
+        self.saved = 0
+
+        # Written from the pipeline's processing thread, never at once with the scraper's
+        self.connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        linked = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'account_tweets'"
+        ).fetchone()
+        self.connection.executescript(SCHEMA)
+        if not linked:
+            # Databases from before account_tweets link each tweet to the profile it was saved under
+            self.connection.execute("INSERT INTO account_tweets (account_id, tweet_id) SELECT account_id, id FROM tweets")
+        self.connection.commit()
+
+    def account_id(self, username):
+        """Get an account's ID, adding the account on its first scrape.
+
+        Args:
+            username (str): The scraped profile.
+
+        Returns:
+            int: The account ID.
+        """
+        username = username.lstrip('@')
+        now = int(time.time())
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO accounts (username, first_scraped_at, last_scraped_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (username) DO UPDATE SET last_scraped_at = excluded.last_scraped_at",
+                (username, now, now)
+            )
+        return self.connection.execute("SELECT id FROM accounts WHERE username = ?", (username,)).fetchone()[0]
+
+    def tweet_key(self, tweet):
+        """Get the key a tweet is stored under.
+
+        Args:
+            tweet (Tweet): The tweet.
+
+        Returns:
+            int: The status ID, or a content hash when it is unknown.
+        """
+        return self.processor.dedup_key(tweet.status_id, tweet.text, tweet.timestamp)
+
+    def save_tweet(self, tweet, account_id):
+        """Queue a tweet; it is written with the next batch.
+
+        Args:
+            tweet (Tweet): The tweet to save.
+            account_id (int): The scraped profile's ID from account_id.
+        """
+        self.pending.append((self.tweet_key(tweet), account_id, tweet))
+        if len(self.pending) >= DATABASE_SETTINGS['batch_size']:
+            self.flush()
+
+    def flush(self):
+        """Write the queued tweets in one transaction."""
+        if not self.pending:
+            return
+
+        now = int(time.time())
+        snapshots = []
+        rows = []
+        links = []
+        for key, account_id, tweet in self.pending:
+            snapshots.append((key, now, tweet.comments, tweet.retweets, tweet.likes, tweet.views))
+            links.append((account_id, key))
+            rows.append((
+                key, tweet.status_id, account_id, tweet.author, tweet.created_at, tweet.text, tweet.url,
+                tweet.comments, tweet.retweets, tweet.likes, tweet.views, now, now
+            ))
+
+        try:
+            with self.connection:
+                self.connection.executemany(INSERT_SNAPSHOT, snapshots)
+                self.connection.executemany(UPSERT_TWEET, rows)
+                self.connection.executemany(LINK_TWEET, links)
+            self.saved += len(rows)
+            self.pending = []
+        except sqlite3.Error as e:
+            console.print(f"[red]Error saving tweets to database: {str(e)}[/red]")
+
+    def query(self, account=None, since=None, until=None, author=None, search=None, limit=None, newest_first=True):
+        """Find stored tweets.
+
+        Args:
+            account (str): Only tweets scraped from this profile, retweets included.
+            since (int): Only tweets created at or after these Unix seconds.
+            until (int): Only tweets created before these Unix seconds.
+            author (str): Only tweets by this screen name.
+            search (str): Only tweets whose text contains this string.
+            limit (int): Maximum number of tweets.
+            newest_first (bool): Order by creation time, newest first.
+
+        Yields:
+            Tweet: Each matching tweet.
+        """
+        conditions = []
+        params = []
+        if account:
+            conditions.append(
+                "id IN (SELECT tweet_id FROM account_tweets "
+                "WHERE account_id = (SELECT id FROM accounts WHERE username = ?))"
+            )
+            params.append(account.lstrip('@'))
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(until)
+        if author:
+            conditions.append("author = ? COLLATE NOCASE")
+            params.append(author.lstrip('@'))
+        if search:
+            conditions.append("text LIKE ?")
+            params.append(f"%{search}%")
+
+        sql = "SELECT status_id, text, created_at, author, url, comments, retweets, likes, views FROM tweets"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY created_at {'DESC' if newest_first else 'ASC'}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        for status_id, text, created_at, author, url, comments, retweets, likes, views in \
+                self.connection.execute(sql, params):
+            yield Tweet(text, created_at=created_at, status_id=status_id, author=author, url=url,
+                        comments=comments, retweets=retweets, likes=likes, views=views)
+
+    def get_accounts(self):
+        """Summarize the stored accounts.
+
+        Returns:
+            list: Dicts with username, tweets, oldest, newest, first_scraped_at and last_scraped_at.
+        """
+        rows = self.connection.execute(
+            "SELECT username, COUNT(tweets.id), MIN(created_at), MAX(created_at), first_scraped_at, last_scraped_at "
+            "FROM accounts LEFT JOIN account_tweets ON account_tweets.account_id = accounts.id "
+            "LEFT JOIN tweets ON tweets.id = account_tweets.tweet_id "
+            "GROUP BY accounts.id ORDER BY username"
+        ).fetchall()
+        fields = ('username', 'tweets', 'oldest', 'newest', 'first_scraped_at', 'last_scraped_at')
+        return [dict(zip(fields, row)) for row in rows]
+
+    def get_metric_history(self, status_id):
+        """Get the metric snapshots of a tweet.
+
+        Args:
+            status_id (int): The status ID.
+
+        Returns:
+            list: Dicts with scraped_at and the four counts, oldest first.
+        """
+        rows = self.connection.execute(
+            "SELECT scraped_at, comments, retweets, likes, views FROM metric_snapshots "
+            "WHERE tweet_id = ? ORDER BY scraped_at",
+            (status_id,)
+        ).fetchall()
+        fields = ('scraped_at', 'comments', 'retweets', 'likes', 'views')
+        return [dict(zip(fields, row)) for row in rows]
+
+    def close(self):
+        """Write the queued tweets and close the database."""
+        if self.connection:
+            self.flush()
+            self.connection.close()
+            self.connection = None
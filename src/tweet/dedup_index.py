@@ -0,0 +1,137 @@
+"""Persistent per-account index of tweets already scraped."""
+
+import math
+import sqlite3
+import hashlib
+from pathlib import Path
+from rich.console import Console
+
+from ..config.settings import DEDUP_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+class BloomFilter:
+    """A fixed-size Bloom filter over int keys."""
+
+    def __init__(self, capacity, error_rate):
+        """Initialize an empty filter.
+
+        Args:
+            capacity (int): Keys the filter is sized for.
+            error_rate (float): False positive rate at capacity.
+        """
+        self.capacity = max(int(capacity), 1)
+        self.size = max(int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hash_count = max(int(round(self.size / self.capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, key):
+        """Get the bit positions of a key using double hashing.
+
+        Args:
+            key (int): The key.
+
+        Returns:
+            list: Bit positions.
+        """
+        digest = hashlib.blake2b(key.to_bytes(8, 'big', signed=True), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:], 'big') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        """Add a key.
+
+        Args:
+            key (int): The key.
+        """
+        for position in self.positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(key))
+
+class DedupIndex:
+    """On-disk set of the tweet keys already scraped for one account.
+
+    Keys are the ints TweetProcessor dedups on: status IDs, or content
+    hashes for tweets without one. They live in a SQLite table per account.
+    A Bloom filter in front answers most lookups for new tweets without a
+    query; only possible matches are confirmed against the table.
+    """
+
+    def __init__(self, account, index_dir=None):
+        """Open or create an account's index.
+
+        Args:
+            account (str): The scraped profile.
+            index_dir (str): Directory for index files. Defaults to DEDUP_SETTINGS['index_dir'].
+        """
+        self.account = account.lstrip('@').lower()
+        self.index_dir = Path(index_dir or DEDUP_SETTINGS['index_dir'])
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.index_dir / f"{self.account}.sqlite"
+        self.added = 0
+        self.skipped = 0
+
+        # Written from the pipeline's processing thread, never at once with the scraper's
+        self.connection = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS seen (key INTEGER PRIMARY KEY)")
+        self.connection.commit()
+        self.load_filter()
+
+    def load_filter(self):
+        """Build the Bloom filter from the stored keys, with room to grow."""
+        stored = self.connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        capacity = max(DEDUP_SETTINGS['bloom_capacity'], stored * 2)
+        self.filter = BloomFilter(capacity, DEDUP_SETTINGS['bloom_error_rate'])
+        for (key,) in self.connection.execute("SELECT key FROM seen"):
+            self.filter.add(key)
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def __contains__(self, key):
+        if key not in self.filter:
+            return False
+        return self.connection.execute("SELECT 1 FROM seen WHERE key = ?", (key,)).fetchone() is not None
+
+    def add(self, key):
+        """Record a key. It is stored for good at the next flush.
+
+        Args:
+            key (int): The tweet's dedup key.
+        """
+        self.connection.execute("INSERT OR IGNORE INTO seen (key) VALUES (?)", (key,))
+        self.filter.add(key)
+        self.added += 1
+
+        # Past capacity the false positive rate climbs, so resize. The
+        # connection reads its own uncommitted keys, so this does not commit:
+        # keys are only committed once their tweets are on disk.
+        if self.filter.count > self.filter.capacity:
+            self.load_filter()
+
+    def flush(self):
+        """Commit the keys added since the last flush."""
+        try:
+            self.connection.commit()
+        except sqlite3.Error as e:
+            console.print(f"[red]Error saving dedup index: {str(e)}[/red]")
+
+    def close(self, commit=True):
+        """Commit and close the index.
+
+        Args:
+            commit (bool): False drops the keys added since the last flush,
+                e.g. when their tweets failed to save.
+        """
+        if self.connection:
+            if commit:
+                self.flush()
+            self.connection.close()
+            self.connection = None
@@ -1,123 +1,203 @@
 """File handling module for Twitter scraping."""
 
 import os
-from datetime import datetime
+import json
+from datetime import datetime, timezone
 from pathlib import Path
 from rich.console import Console
 
+from .sinks import create_sink
+from ..config.settings import OUTPUT_SETTINGS
+
 # Initialize Rich console
 console = Console()
 
 class TweetFileHandler:
     """Handles file operations for saving tweets."""
-    
-    def __init__(self):
-        """Initialize the file handler."""
+
+    def __init__(self, formats=None, compression=None, database=None):
+        """Initialize the file handler.
+
+        Args:
+            formats (list): Output formats written side by side ('text', 'jsonl', 'csv', 'parquet').
+                Defaults to OUTPUT_SETTINGS['formats'].
+            compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+            database (TweetDatabase): Also save the tweets here. The caller closes it.
+        """
+        self.formats = list(formats or OUTPUT_SETTINGS['formats'])
+        self.compression = compression
         self.current_file = None
+        self.current_files = []
+        self.manifest_file = None
+        self.path_stem = None
+        self.started_at = None
         self.current_username = None
-        self.file = None
+        self.sinks = []
+        self.last_stats = None
+        self.database = database
+        self.account_id = None
 
     def format_date(self):
         """Format current date for filename.
-        
+
         Returns:
             str: Formatted date string.
         """
         return datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    def format_metrics(self, metrics):
-        """Format tweet metrics for output.
-        
-        Args:
-            metrics (dict): Dictionary containing tweet metrics.
-            
-        Returns:
-            str: Formatted metrics string.
-        """
-        return (f"💬 {metrics['comments']} Comments  •  "
-                f"🔄 {metrics['retweets']} Retweets  •  "
-                f"❤️ {metrics['likes']} Likes  •  "
-                f"👁️ {metrics['views']} Views")
-
-    def format_timestamp(self, timestamp):
-        """Format timestamp for output.
-        
-        Args:
-            timestamp (str): ISO format timestamp.
-            
-        Returns:
-            str: Formatted date string.
-        """
-        try:
-            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            return dt.strftime("%B %d, %Y at %I:%M %p")
-        except:
-            return timestamp
-
-    def initialize_file(self, username):
-        """Initialize file for saving tweets.
-        
+    def initialize_file(self, username, name=None, directory=None):
+        """Initialize the output files for saving tweets.
+
         Args:
             username (str): Twitter username for the file.
+            name (str): File name without extension. Defaults to '{username}_tweets_{timestamp}'.
+            directory (str): Output directory. Defaults to OUTPUT_SETTINGS['directory'].
         """
-        try:
-            self.current_username = username
-            filename = f"{username}_tweets_{self.format_date()}.txt"
-            self.current_file = str(Path("data/tweets") / filename)
-            
-            # Create data directory if it doesn't exist
-            Path("data/tweets").mkdir(parents=True, exist_ok=True)
-            
-            # Open file in append mode
-            self.file = open(self.current_file, 'a', encoding='utf-8')
-            
-            # Write header
-            header = (
-                f"📱 Tweets from @{username}\n"
-                f"📅 Scraped on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n"
-                f"{'─' * 80}\n\n"
-            )
-            self.file.write(header)
-            self.file.flush()
-            
-        except Exception as e:
-            console.print(f"[red]Error initializing file: {str(e)}[/red]")
+        # Finish the previous profile's files before starting new ones
+        self.close()
+        self.last_stats = None
+        self.current_username = username
+        self.current_files = []
+        self.started_at = datetime.now(timezone.utc)
+
+        # Create data directory if it doesn't exist
+        output_dir = Path(directory or OUTPUT_SETTINGS['directory'])
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path_stem = str(output_dir / (name or f"{username}_tweets_{self.format_date()}"))
+        self.path_stem = path_stem
+
+        for output_format in self.formats:
+            try:
+                sink = create_sink(output_format, path_stem, self.compression)
+                sink.open(username)
+                self.sinks.append(sink)
+                self.current_files.append(sink.path)
+            except Exception as e:
+                console.print(f"[red]Error initializing {output_format} output: {str(e)}[/red]")
+
+        if self.database is not None:
+            self.account_id = self.database.account_id(username)
+
+        self.current_file = self.current_files[0] if self.current_files else None
+        self.manifest_file = f"{path_stem}.manifest.json" if OUTPUT_SETTINGS['manifest'] else None
+        self.write_manifest()
 
     def save_tweet(self, tweet_data):
-        """Save a single tweet to file.
-        
+        """Save a single tweet to every output.
+
         Args:
-            tweet_data (dict): The tweet data to save.
-            
+            tweet_data (Tweet): The tweet to save.
+
         Returns:
             bool: True if save was successful, False otherwise.
         """
         try:
-            if not self.file:
+            if not self.sinks and self.account_id is None:
                 raise Exception("File not initialized. Call initialize_file first.")
-                
-            # Format the tweet data
-            formatted_tweet = (
-                f"🕒 {self.format_timestamp(tweet_data['timestamp'])}\n\n"
-                f"{tweet_data['text']}\n\n"
-                f"{self.format_metrics(tweet_data['metrics'])}\n"
-                f"{'─' * 80}\n\n"
-            )
-            
-            # Write to file and flush immediately
-            self.file.write(formatted_tweet)
-            self.file.flush()
-            
+
+            if self.database is not None:
+                self.database.save_tweet(tweet_data, self.account_id)
+
+            rotated = False
+            for sink in self.sinks:
+                rotated = sink.write(tweet_data) or rotated
+
+            # Readers follow the manifest to find finished segments
+            if rotated:
+                self.write_manifest()
+
             return True
-            
+
         except Exception as e:
             console.print(f"[red]Error saving tweet: {str(e)}[/red]")
             return False
 
-    def __del__(self):
-        """Clean up file handler."""
+    def checkpoint(self, wait=False):
+        """Mark a consistent point, e.g. after a scroll or page.
+
+        Everything saved so far is flushed, and synced to disk when
+        WRITER_SETTINGS['fsync'] is 'checkpoint'.
+
+        Args:
+            wait (bool): Block until the checkpoint has been written.
+
+        Returns:
+            bool: False if any output failed to write, in which case the
+                database is not committed either.
+        """
+        saved = all([sink.checkpoint(wait) for sink in self.sinks])
+        if saved and self.database is not None:
+            self.database.flush()
+        return saved
+
+    def get_stats(self):
+        """Get the background writers' statistics.
+
+        Returns:
+            dict: Writer statistics per output format for the open or last
+                closed files, or None when writing synchronously.
+        """
+        if not self.sinks:
+            return self.last_stats
+        stats = {sink.name: sink.get_stats() for sink in self.sinks if sink.get_stats()}
+        return stats or None
+
+    def write_manifest(self, complete=False):
+        """Write the manifest listing every output segment.
+
+        Each segment lists its file, tweet count, the time range of its
+        tweets and whether it is complete. The file is replaced atomically
+        so it can be read at any time during the run.
+
+        Args:
+            complete (bool): Whether the run has finished.
+        """
+        if not self.manifest_file:
+            return
+
+        manifest = {
+            'username': self.current_username,
+            'started_at': self.started_at.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'updated_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'complete': complete,
+            'compression': self.sinks[0].compression if self.sinks else self.compression,
+            'outputs': {
+                sink.name: {'tweets': sink.count, 'segments': sink.segments}
+                for sink in self.sinks
+            }
+        }
+
         try:
-            if self.file:
-                self.file.close()
-        except:
-            pass 
\ No newline at end of file
+            temp_path = f"{self.manifest_file}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.manifest_file)
+        except Exception as e:
+            console.print(f"[red]Error writing manifest: {str(e)}[/red]")
+
+    def close(self):
+        """Write out any queued tweets, close the files and finish the manifest.
+
+        Returns:
+            bool: False if any tweets failed to reach the files.
+        """
+        if not self.sinks:
+            if self.database is not None:
+                self.database.flush()
+            return True
+
+        try:
+            saved = self.checkpoint(wait=True)
+        except Exception as e:
+            console.print(f"[red]Error writing tweets: {str(e)}[/red]")
+            saved = False
+        self.last_stats = self.get_stats()
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception as e:
+                console.print(f"[red]Error closing {sink.path}: {str(e)}[/red]")
+                saved = False
+        self.write_manifest(complete=True)
+        self.sinks = []
+        return saved
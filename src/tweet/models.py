@@ -0,0 +1,191 @@
+"""Compact record type for scraped tweets."""
+
+import json
+from datetime import datetime, timezone
+
+def parse_count(value):
+    """Convert a scraped metric to an int.
+
+    Args:
+        value: The metric as scraped, usually a digit string.
+
+    Returns:
+        int: The count, 0 if it is missing or not a number.
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+def parse_epoch(timestamp):
+    """Parse an ISO timestamp into Unix seconds.
+
+    Args:
+        timestamp (str): ISO format timestamp; naive times are taken as UTC.
+
+    Returns:
+        int: Seconds since the epoch, or None if it cannot be parsed.
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+def parse_status_id(status_id):
+    """Convert a status ID to an int.
+
+    Args:
+        status_id: The ID as a string or int.
+
+    Returns:
+        int: The ID, or None if there is none.
+    """
+    if isinstance(status_id, int):
+        return status_id
+    if status_id and str(status_id).isdigit():
+        return int(status_id)
+    return None
+
+class Tweet:
+    """One scraped tweet.
+
+    Uses __slots__ with ints for the ID, metrics and time, so millions of
+    tweets cost a fraction of the equivalent nested dicts.
+    """
+
+    __slots__ = ('status_id', 'text', 'created_at', 'author', 'url', 'comments', 'retweets', 'likes', 'views')
+
+    # Typed fields in output order, shared by the machine-readable sinks
+    FIELDS = ('status_id', 'url', 'author', 'created_at', 'text', 'comments', 'retweets', 'likes', 'views')
+
+    def __init__(self, text, created_at=None, status_id=None, author=None, url=None,
+                 comments=0, retweets=0, likes=0, views=0):
+        """Initialize the tweet.
+
+        Args:
+            text (str): The tweet text.
+            created_at (int): Unix seconds, or None if unknown.
+            status_id (int): The status ID, or None if unknown.
+            author (str): The author's screen name.
+            url (str): The tweet's permalink.
+            comments (int): Reply count.
+            retweets (int): Retweet count.
+            likes (int): Like count.
+            views (int): View count.
+        """
+        self.status_id = status_id
+        self.text = text
+        self.created_at = created_at
+        self.author = author
+        self.url = url
+        self.comments = comments
+        self.retweets = retweets
+        self.likes = likes
+        self.views = views
+
+    @classmethod
+    def from_dict(cls, tweet_data):
+        """Build a tweet from the dict shape used by the parsers.
+
+        Args:
+            tweet_data (dict): Dict with text, an ISO timestamp, a metrics dict of
+                digit strings and optionally status_id, url and author.
+
+        Returns:
+            Tweet: The tweet.
+        """
+        metrics = tweet_data.get('metrics') or {}
+        return cls(
+            tweet_data.get('text', ''),
+            created_at=parse_epoch(tweet_data.get('timestamp')),
+            status_id=parse_status_id(tweet_data.get('status_id')),
+            author=tweet_data.get('author'),
+            url=tweet_data.get('url'),
+            comments=parse_count(metrics.get('comments')),
+            retweets=parse_count(metrics.get('retweets')),
+            likes=parse_count(metrics.get('likes')),
+            views=parse_count(metrics.get('views'))
+        )
+
+    @property
+    def created_datetime(self):
+        """datetime: The creation time in UTC, or None if unknown."""
+        if self.created_at is None:
+            return None
+        return datetime.fromtimestamp(self.created_at, timezone.utc)
+
+    @property
+    def timestamp(self):
+        """str: The creation time as ISO 8601 UTC ('...Z'), or '' if unknown."""
+        if self.created_at is None:
+            return ''
+        return self.created_datetime.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    @property
+    def metrics(self):
+        """dict: The engagement counts in the shape of the old tweet dicts."""
+        return {'comments': self.comments, 'retweets': self.retweets, 'likes': self.likes, 'views': self.views}
+
+    def to_dict(self):
+        """Convert to the dict shape earlier versions returned.
+
+        Returns:
+            dict: text, timestamp, metrics, status_id, url and author.
+        """
+        return {
+            'text': self.text,
+            'timestamp': self.timestamp,
+            'metrics': self.metrics,
+            'status_id': str(self.status_id) if self.status_id is not None else None,
+            'url': self.url,
+            'author': self.author
+        }
+
+    @classmethod
+    def from_json(cls, line):
+        """Build a tweet from a line written by to_json.
+
+        Args:
+            line (str): The JSON text.
+
+        Returns:
+            Tweet: The tweet.
+        """
+        record = json.loads(line)
+        return cls(
+            record.get('text', ''),
+            created_at=parse_epoch(record.get('created_at')),
+            status_id=parse_status_id(record.get('status_id')),
+            author=record.get('author'),
+            url=record.get('url'),
+            comments=parse_count(record.get('comments')),
+            retweets=parse_count(record.get('retweets')),
+            likes=parse_count(record.get('likes')),
+            views=parse_count(record.get('views'))
+        )
+
+    def to_record(self):
+        """Convert to a flat typed record.
+
+        Returns:
+            dict: The FIELDS, with created_at as a UTC datetime.
+        """
+        record = {field: getattr(self, field) for field in self.FIELDS}
+        record['created_at'] = self.created_datetime
+        return record
+
+    def to_json(self):
+        """Serialize as one JSON object with typed fields.
+
+        Returns:
+            str: The JSON text, with created_at as ISO 8601 UTC.
+        """
+        record = {field: getattr(self, field) for field in self.FIELDS}
+        record['created_at'] = self.timestamp or None
+        return json.dumps(record, ensure_ascii=False)
+
+    def __repr__(self):
+        return f"Tweet(status_id={self.status_id!r}, author={self.author!r}, created_at={self.timestamp!r})"
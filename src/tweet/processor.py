@@ -1,32 +1,126 @@
 """Tweet processing module for Twitter scraping."""
 
+import re
 import hashlib
-from datetime import datetime
+from datetime import datetime, timezone
 from selenium.webdriver.common.by import By
 from rich.console import Console
 
+from .models import Tweet, parse_count, parse_epoch, parse_status_id
+
 # Initialize Rich console
 console = Console()
 
+# Permalinks look like {base_url}/{author}/status/{id}
+STATUS_URL_PATTERN = re.compile(r'/([^/?#]+)/status/(\d+)')
+
+# Status IDs are snowflakes: milliseconds since this epoch, shifted left 22 bits
+SNOWFLAKE_EPOCH_MS = 1288834974657
+
 class TweetProcessor:
     """Processes tweets extracted from Twitter."""
     
-    def __init__(self):
-        """Initialize the tweet processor."""
+    def __init__(self, dedup_index=None):
+        """Initialize the tweet processor.
+        
+        Args:
+            dedup_index (DedupIndex): Keys scraped in earlier runs, to skip them as well.
+        """
+        # Int keys: status IDs, or content hashes when the ID is unknown
         self.processed_tweet_ids = set()
+        self.dedup_index = dedup_index
+        self.start_scan()
+
+    def reset(self):
+        """Forget the tweets seen so far, so a new run starts clean.
+        
+        The dedup index is kept; it holds what earlier runs saved.
+        """
+        self.processed_tweet_ids = set()
+        self.start_scan()
+
+    def start_scan(self, account=None, watermark=None):
+        """Reset the position tracking for a pass over a timeline.
+        
+        Args:
+            account (str): The profile being scraped. Only its own tweets mark
+                a position; retweets and pinned tweets are out of order.
+            watermark (int): Newest status ID saved by earlier runs, if any.
+        """
+        self.account = account.lstrip('@').lower() if account else None
+        self.watermark = watermark
+        self.newest_id = None
+        self.position_id = None
+        self.known_streak = 0
 
     def generate_tweet_id(self, tweet_text, timestamp):
         """Generate a unique ID for a tweet using text and timestamp.
         
+        The timestamp is hashed as Unix seconds, so the raw datetime from
+        the page and a saved Tweet's normalized timestamp give the same ID.
+        
         Args:
+            tweet_text (str): The text content of the tweet.
+            timestamp (str): The timestamp of the tweet, or None if it is unknown.
+            
+        Returns:
+            int: A 63-bit hash of the content, negated so it never equals a real status ID
+                and still fits a signed 64-bit SQLite integer.
+        """
+        created_at = parse_epoch(timestamp)
+        content = f"{tweet_text}{'' if created_at is None else created_at}".encode('utf-8')
+        return -1 - (int.from_bytes(hashlib.md5(content).digest()[:8], 'big') >> 1)
+
+    def dedup_key(self, status_id, tweet_text, timestamp):
+        """Get the key a tweet is deduplicated on.
+        
+        Args:
+            status_id (int): The status ID, if known.
             tweet_text (str): The text content of the tweet.
             timestamp (str): The timestamp of the tweet.
             
         Returns:
-            str: A unique hash ID for the tweet.
+            int: The status ID, or a content hash when it is unknown.
         """
-        content = f"{tweet_text}{timestamp}".encode('utf-8')
-        return hashlib.md5(content).hexdigest()
+        return status_id if status_id is not None else self.generate_tweet_id(tweet_text, timestamp)
+
+    def is_new(self, key, author=None):
+        """Record a dedup key.
+        
+        Also tracks the scan position: the newest and the latest own tweet
+        seen, and how many tweets in a row were saved by earlier runs.
+        
+        Args:
+            key (int): The tweet's dedup key.
+            author (str): The tweet's author, if known.
+            
+        Returns:
+            bool: True if the key had not been seen before.
+        """
+        if key in self.processed_tweet_ids:
+            return False
+        self.processed_tweet_ids.add(key)
+        
+        own = key > 0 and self.account is not None and (author or '').lower() == self.account
+        if own:
+            self.position_id = key
+            if self.newest_id is None or key > self.newest_id:
+                self.newest_id = key
+        
+        known = False
+        if self.dedup_index is not None:
+            if key in self.dedup_index:
+                self.dedup_index.skipped += 1
+                known = True
+            else:
+                self.dedup_index.add(key)
+        
+        # Tweets below the watermark count even if the index was deleted
+        if known or (own and self.watermark is not None and key <= self.watermark):
+            self.known_streak += 1
+        else:
+            self.known_streak = 0
+        return not known
 
     def extract_text(self, tweet_element):
         """Extract text from a tweet element.
@@ -50,20 +144,71 @@ class TweetProcessor:
                 pass
         return ""
 
-    def extract_timestamp(self, tweet_element):
+    def parse_permalink(self, url):
+        """Get the author and status ID from a tweet permalink.
+        
+        Args:
+            url (str): The permalink.
+            
+        Returns:
+            tuple: (author, int status ID), or (None, None) if it is not a status URL.
+        """
+        match = STATUS_URL_PATTERN.search(url or '')
+        if not match:
+            return None, None
+        return match.group(1), int(match.group(2))
+
+    def snowflake_timestamp(self, status_id):
+        """Derive a tweet's creation time from its status ID.
+        
+        Args:
+            status_id (int): The status ID.
+            
+        Returns:
+            str: ISO format timestamp in UTC.
+        """
+        milliseconds = (status_id >> 22) + SNOWFLAKE_EPOCH_MS
+        return datetime.fromtimestamp(milliseconds / 1000, timezone.utc).isoformat()
+
+    def extract_permalink(self, tweet_element):
+        """Extract the permalink of a tweet element.
+        
+        The tweet's own link wraps its <time>; quoted tweets come later in
+        the article, so the first status link is the fallback.
+        
+        Args:
+            tweet_element: The Selenium element containing the tweet.
+            
+        Returns:
+            str: The permalink, or None if there is none.
+        """
+        try:
+            link = tweet_element.find_element(By.XPATH, './/time/ancestor::a[contains(@href, "/status/")][1]')
+            return link.get_attribute('href')
+        except:
+            try:
+                link = tweet_element.find_element(By.CSS_SELECTOR, 'a[href*="/status/"]')
+                return link.get_attribute('href')
+            except:
+                return None
+
+    def extract_timestamp(self, tweet_element, status_id=None):
         """Extract timestamp from a tweet element.
         
         Args:
             tweet_element: The Selenium element containing the tweet.
+            status_id (int): The status ID, used when the element has no time.
             
         Returns:
-            str: The timestamp of the tweet.
+            str: The timestamp of the tweet, or None if it is unknown.
         """
         try:
             time_element = tweet_element.find_element(By.TAG_NAME, "time")
             return time_element.get_attribute("datetime")
         except:
-            return datetime.now().isoformat()
+            if status_id:
+                return self.snowflake_timestamp(status_id)
+            return None
 
     def extract_metrics(self, tweet_element):
         """Extract engagement metrics from a tweet element.
@@ -74,12 +219,8 @@ class TweetProcessor:
         Returns:
             dict: A dictionary containing the tweet's metrics.
         """
-        metrics = {
-            'comments': '0',
-            'retweets': '0',
-            'likes': '0',
-            'views': '0'
-        }
+        metric_labels = []
+        views_label = ''
         
         try:
             metric_groups = tweet_element.find_elements(By.CSS_SELECTOR, '[role="group"]')
@@ -88,29 +229,51 @@ class TweetProcessor:
                 try:
                     buttons = group.find_elements(By.CSS_SELECTOR, '[role="button"]')
                     for button in buttons:
-                        aria_label = button.get_attribute('aria-label') or ''
-                        aria_label = aria_label.lower()
-                        
-                        if 'repl' in aria_label:
-                            metrics['comments'] = ''.join(filter(str.isdigit, aria_label))
-                        elif 'repost' in aria_label or 'retweet' in aria_label:
-                            metrics['retweets'] = ''.join(filter(str.isdigit, aria_label))
-                        elif 'like' in aria_label:
-                            metrics['likes'] = ''.join(filter(str.isdigit, aria_label))
+                        metric_labels.append(button.get_attribute('aria-label') or '')
                 except:
                     continue
             
             try:
                 analytics = tweet_element.find_element(By.CSS_SELECTOR, '[href*="analytics"]')
-                aria_label = analytics.get_attribute('aria-label') or ''
-                if 'view' in aria_label.lower():
-                    metrics['views'] = ''.join(filter(str.isdigit, aria_label))
+                views_label = analytics.get_attribute('aria-label') or ''
             except:
                 pass
             
         except:
             pass
         
+        return self.parse_metric_labels(metric_labels, views_label)
+
+    def parse_metric_labels(self, metric_labels, views_label=''):
+        """Build the metrics dictionary from raw aria-labels.
+        
+        Args:
+            metric_labels (list): aria-labels of the buttons in the tweet's action groups.
+            views_label (str): aria-label of the tweet's analytics link.
+            
+        Returns:
+            dict: A dictionary containing the tweet's metrics.
+        """
+        metrics = {
+            'comments': '0',
+            'retweets': '0',
+            'likes': '0',
+            'views': '0'
+        }
+        
+        for aria_label in metric_labels:
+            aria_label = (aria_label or '').lower()
+            
+            if 'repl' in aria_label:
+                metrics['comments'] = ''.join(filter(str.isdigit, aria_label))
+            elif 'repost' in aria_label or 'retweet' in aria_label:
+                metrics['retweets'] = ''.join(filter(str.isdigit, aria_label))
+            elif 'like' in aria_label:
+                metrics['likes'] = ''.join(filter(str.isdigit, aria_label))
+        
+        if views_label and 'view' in views_label.lower():
+            metrics['views'] = ''.join(filter(str.isdigit, views_label))
+        
         return metrics
 
     def process_tweet(self, tweet_element):
@@ -120,7 +283,7 @@ class TweetProcessor:
             tweet_element: The Selenium element containing the tweet.
             
         Returns:
-            dict: A dictionary containing the processed tweet data.
+            Tweet: The processed tweet, or None if it is empty or a duplicate.
         """
         try:
             # Extract tweet text
@@ -128,27 +291,104 @@ class TweetProcessor:
             if not tweet_text:
                 return None
             
-            # Extract timestamp
-            timestamp = self.extract_timestamp(tweet_element)
+            permalink = self.extract_permalink(tweet_element)
+            author, status_id = self.parse_permalink(permalink)
+            
+            # Extract timestamp; the status ID encodes it when <time> is missing
+            timestamp = self.extract_timestamp(tweet_element, status_id)
             
             # Check for duplicates
-            tweet_id = self.generate_tweet_id(tweet_text, timestamp)
-            if tweet_id in self.processed_tweet_ids:
+            if not self.is_new(self.dedup_key(status_id, tweet_text, timestamp), author):
                 return None
             
-            self.processed_tweet_ids.add(tweet_id)
-            
             # Extract metrics
             metrics = self.extract_metrics(tweet_element)
             
-            tweet_data = {
-                'text': tweet_text,
-                'timestamp': timestamp,
-                'metrics': metrics
-            }
+            return self.build_tweet(tweet_text, timestamp, metrics, status_id, permalink, author)
             
-            return tweet_data
+        except Exception as e:
+            console.print(f"[red]Error processing tweet: {str(e)}[/red]")
+            return None 
+
+    def process_payload(self, payload):
+        """Process a tweet payload extracted in the page and return structured data.
+        
+        Args:
+            payload (dict): Raw article fields returned by the batch extraction script.
+            
+        Returns:
+            Tweet: The processed tweet, or None if it is empty or a duplicate.
+        """
+        try:
+            tweet_text = (payload.get('text') or '').strip()
+            if not tweet_text:
+                return None
+            
+            permalink = payload.get('permalink')
+            author, status_id = self.parse_permalink(permalink)
+            if status_id is None:
+                status_id = parse_status_id(payload.get('status_id'))
+            timestamp = payload.get('timestamp')
+            if not timestamp:
+                timestamp = self.snowflake_timestamp(status_id) if status_id else None
+            
+            # Check for duplicates
+            if not self.is_new(self.dedup_key(status_id, tweet_text, timestamp), author):
+                return None
+            
+            metrics = self.parse_metric_labels(
+                payload.get('metric_labels') or [],
+                payload.get('views_label') or ''
+            )
+            
+            return self.build_tweet(tweet_text, timestamp, metrics, status_id, permalink, author)
             
         except Exception as e:
             console.print(f"[red]Error processing tweet: {str(e)}[/red]")
-            return None 
\ No newline at end of file
+            return None
+
+    def process_api_tweet(self, tweet_data):
+        """Deduplicate a tweet decoded from a timeline API response.
+        
+        Args:
+            tweet_data (dict): Tweet data produced by the TimelineParser.
+            
+        Returns:
+            Tweet: The tweet, or None if it was already processed.
+        """
+        if not tweet_data or not tweet_data.get('text'):
+            return None
+        
+        # API tweets carry their real status ID, which is a better key than content
+        status_id = parse_status_id(tweet_data.get('status_id'))
+        key = self.dedup_key(status_id, tweet_data['text'], tweet_data['timestamp'])
+        if not self.is_new(key, tweet_data.get('author')):
+            return None
+        
+        return Tweet.from_dict(tweet_data)
+
+    def build_tweet(self, tweet_text, timestamp, metrics, status_id=None, url=None, author=None):
+        """Build a Tweet from scraped fields.
+        
+        Args:
+            tweet_text (str): The text content of the tweet.
+            timestamp (str): ISO format timestamp, or None if it is unknown.
+            metrics (dict): Digit strings from parse_metric_labels.
+            status_id (int): The status ID, if known.
+            url (str): The permalink, if known.
+            author (str): The author's screen name, if known.
+            
+        Returns:
+            Tweet: The tweet.
+        """
+        return Tweet(
+            tweet_text,
+            created_at=parse_epoch(timestamp),
+            status_id=status_id,
+            author=author,
+            url=url,
+            comments=parse_count(metrics['comments']),
+            retweets=parse_count(metrics['retweets']),
+            likes=parse_count(metrics['likes']),
+            views=parse_count(metrics['views'])
+        )
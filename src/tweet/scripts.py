@@ -0,0 +1,278 @@
+"""JavaScript snippets injected into the page for tweet extraction."""
+
+# Extracts the raw fields of a single article element. Shared by every
+# script below so all extraction modes read the DOM the same way.
+EXTRACT_ARTICLE_FUNCTION = """
+function extractArticle(article) {
+    var text = '';
+    var textEl = article.querySelector('[data-testid="tweetText"]');
+    if (textEl) {
+        text = (textEl.innerText || '').trim();
+    } else {
+        var langEls = article.querySelectorAll('[lang]');
+        for (var i = 0; i < langEls.length; i++) {
+            var candidate = (langEls[i].innerText || '').trim();
+            if (candidate) {
+                text = candidate;
+                break;
+            }
+        }
+    }
+
+    var timeEl = article.querySelector('time');
+    var timestamp = timeEl ? timeEl.getAttribute('datetime') : null;
+
+    var link = timeEl ? timeEl.closest('a[href*="/status/"]') : null;
+    if (!link) {
+        link = article.querySelector('a[href*="/status/"]');
+    }
+    var permalink = link ? link.href : null;
+    var match = permalink ? permalink.match(/\\/status\\/(\\d+)/) : null;
+
+    var metricLabels = [];
+    var groups = article.querySelectorAll('[role="group"]');
+    for (var g = 0; g < groups.length; g++) {
+        var buttons = groups[g].querySelectorAll('[role="button"]');
+        for (var b = 0; b < buttons.length; b++) {
+            metricLabels.push(buttons[b].getAttribute('aria-label') || '');
+        }
+    }
+
+    var analytics = article.querySelector('[href*="analytics"]');
+
+    return {
+        text: text,
+        timestamp: timestamp,
+        permalink: permalink,
+        status_id: match ? match[1] : null,
+        metric_labels: metricLabels,
+        views_label: analytics ? (analytics.getAttribute('aria-label') || '') : ''
+    };
+}
+"""
+
+# Extracts every visible article in one round trip and reports the page
+# height alongside, so the scroll loop needs no separate height query.
+# Articles collapsed by PRUNE_ARTICLES_SCRIPT are skipped.
+EXTRACT_ARTICLES_SCRIPT = EXTRACT_ARTICLE_FUNCTION + """
+var articles = document.querySelectorAll('article[role="article"]:not([data-scraper-pruned])');
+var results = [];
+for (var i = 0; i < articles.length; i++) {
+    try {
+        results.push(extractArticle(articles[i]));
+    } catch (e) {}
+}
+return {
+    height: document.documentElement.scrollHeight,
+    articles: results
+};
+"""
+
+# Captures the HTML around the rendered articles in one round trip, for
+# SnapshotParser to read offline. Takes the section holding the timeline,
+# falling back to <main> or the whole body.
+CAPTURE_TIMELINE_SCRIPT = """
+var first = document.querySelector('article[role="article"]');
+var container = first ? first.closest('section') : null;
+container = container || document.querySelector('main') || document.body;
+return {
+    height: document.documentElement.scrollHeight,
+    html: container.outerHTML
+};
+"""
+
+# Drains only the articles inserted since the previous call. On first use
+# (and after any navigation) it installs a MutationObserver that queues
+# newly added articles in the page; drained articles are marked with
+# data-scraper-seen so they are never extracted twice. Articles that have
+# not rendered their text yet are kept queued for a few more attempts.
+DRAIN_NEW_ARTICLES_SCRIPT = EXTRACT_ARTICLE_FUNCTION + """
+var maxAttempts = arguments[0] || 3;
+var state = window.__tweetScraper;
+if (!state) {
+    state = {queue: []};
+    var enqueue = function(node) {
+        if (node.nodeType !== 1) {
+            return;
+        }
+        if (node.matches('article[role="article"]')) {
+            state.queue.push(node);
+            return;
+        }
+        var found = node.querySelectorAll('article[role="article"]');
+        for (var f = 0; f < found.length; f++) {
+            state.queue.push(found[f]);
+        }
+    };
+    enqueue(document.body);
+    state.observer = new MutationObserver(function(mutations) {
+        for (var m = 0; m < mutations.length; m++) {
+            var added = mutations[m].addedNodes;
+            for (var n = 0; n < added.length; n++) {
+                enqueue(added[n]);
+            }
+        }
+    });
+    state.observer.observe(document.body, {childList: true, subtree: true});
+    window.__tweetScraper = state;
+}
+
+var pending = state.queue;
+state.queue = [];
+var results = [];
+var retry = [];
+for (var i = 0; i < pending.length; i++) {
+    var article = pending[i];
+    if (!article.isConnected || article.hasAttribute('data-scraper-seen')) {
+        continue;
+    }
+    try {
+        var data = extractArticle(article);
+        if (!data.text) {
+            var attempts = parseInt(article.getAttribute('data-scraper-attempts') || '0', 10) + 1;
+            article.setAttribute('data-scraper-attempts', attempts);
+            if (attempts < maxAttempts) {
+                retry.push(article);
+            }
+            continue;
+        }
+        article.setAttribute('data-scraper-seen', '1');
+        results.push(data);
+    } catch (e) {}
+}
+state.queue = retry.concat(state.queue);
+
+return {
+    height: document.documentElement.scrollHeight,
+    articles: results,
+    pending: state.queue.length
+};
+"""
+
+# Scrolls once and resolves as soon as the page reacts: more articles, a
+# different last article (virtualized lists keep the count constant), a
+# changed scrollHeight, or a loading spinner that has cleared. Resolves
+# with 'timeout' at the ceiling. Run with execute_async_script; the
+# optional floor keeps a minimum, jittered wait for stealth.
+SCROLL_AND_WAIT_SCRIPT = """
+var amount = arguments[0];
+var timeoutMs = arguments[1];
+var floorMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var root = document.documentElement;
+
+function articleCount() {
+    return document.querySelectorAll('article[role="article"]').length;
+}
+function lastArticleKey() {
+    var articles = document.querySelectorAll('article[role="article"]');
+    if (!articles.length) {
+        return null;
+    }
+    var link = articles[articles.length - 1].querySelector('a[href*="/status/"]');
+    return link ? link.getAttribute('href') : articles.length;
+}
+function spinnerVisible() {
+    return !!document.querySelector('[role="progressbar"]');
+}
+
+var previousHeight = root.scrollHeight;
+var previousPosition = window.pageYOffset;
+var previousArticles = articleCount();
+var previousKey = lastArticleKey();
+var sawSpinner = false;
+var started = performance.now();
+
+window.scrollBy(0, amount);
+
+function finish(reason) {
+    done({
+        reason: reason,
+        height: root.scrollHeight,
+        previous_height: previousHeight,
+        position: window.pageYOffset,
+        previous_position: previousPosition,
+        viewport: window.innerHeight,
+        articles: articleCount(),
+        previous_articles: previousArticles,
+        elapsed: (performance.now() - started) / 1000
+    });
+}
+
+function check() {
+    var elapsed = performance.now() - started;
+    var spinner = spinnerVisible();
+    sawSpinner = sawSpinner || spinner;
+
+    var changed = articleCount() > previousArticles
+        || lastArticleKey() !== previousKey
+        || root.scrollHeight !== previousHeight
+        || (sawSpinner && !spinner);
+
+    if (changed && !spinner && elapsed >= floorMs) {
+        finish('content');
+    } else if (elapsed >= timeoutMs) {
+        finish('timeout');
+    } else {
+        setTimeout(check, 50);
+    }
+}
+check();
+"""
+
+# Returns the first of the given texts shown on the page, or null. Matches
+# text nodes with XPath, so no layout is forced on long timelines.
+DETECT_ERROR_SCRIPT = """
+var texts = arguments[0];
+for (var i = 0; i < texts.length; i++) {
+    var literal = texts[i].indexOf('"') === -1 ? '"' + texts[i] + '"' : "'" + texts[i] + "'";
+    var match = document.evaluate(
+        '//*[not(self::script)][text()[contains(., ' + literal + ')]]',
+        document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (match) {
+        return texts[i];
+    }
+}
+return null;
+"""
+
+# Collapses processed articles above the viewport, except the `keep`
+# closest to it. Only styles and a data-scraper-pruned marker are set: the
+# children belong to React, which breaks when its nodes disappear under it.
+# Each keeps its box, so the scroll position, the list's own anchoring and
+# the loading trigger at the bottom are unaffected, and content-visibility
+# stops its contents from being laid out or painted. The extraction scripts
+# skip marked articles. Reads all boxes before changing any, so the page is
+# laid out once per call.
+PRUNE_ARTICLES_SCRIPT = """
+var keep = arguments[0];
+var requireSeen = arguments[1];
+var articles = document.querySelectorAll('article[role="article"]:not([data-scraper-pruned])');
+var above = 0;
+while (above < articles.length && articles[above].getBoundingClientRect().bottom < 0) {
+    above++;
+}
+var candidates = [];
+for (var i = 0; i < above - keep; i++) {
+    var article = articles[i];
+    if (requireSeen && !article.hasAttribute('data-scraper-seen')) {
+        continue;
+    }
+    candidates.push([article, article.offsetHeight]);
+}
+for (var j = 0; j < candidates.length; j++) {
+    var pruned = candidates[j][0];
+    pruned.style.height = candidates[j][1] + 'px';
+    pruned.style.minHeight = '0';
+    pruned.style.boxSizing = 'border-box';
+    pruned.style.overflow = 'hidden';
+    pruned.style.contentVisibility = 'hidden';
+    pruned.setAttribute('data-scraper-pruned', '1');
+}
+return {
+    pruned: candidates.length,
+    articles: articles.length - candidates.length,
+    nodes: document.getElementsByTagName('*').length
+};
+"""
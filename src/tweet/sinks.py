@@ -0,0 +1,557 @@
+"""Output sinks that write collected tweets in different formats."""
+
+import io
+import csv
+import gzip
+from datetime import datetime
+from rich.console import Console
+
+from .models import Tweet
+from .writer import BackgroundWriter
+from ..config.settings import WRITER_SETTINGS, OUTPUT_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# File suffix added by each stream compression
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+class TweetSink:
+    """Base class for an output format.
+
+    Output is split into segments when OUTPUT_SETTINGS['rotate_tweets'] or
+    ['rotate_bytes'] is set. A segment is finished (and readable on its own)
+    as soon as the next one is due. Subclasses set `name` and `extension`
+    and implement open_segment, write_tweet and close_segment.
+    """
+
+    name = None
+    extension = None
+
+    def __init__(self, path_stem, compression=None):
+        """Initialize the sink.
+
+        Args:
+            path_stem (str): Output path without extension.
+            compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+        """
+        self.path_stem = path_stem
+        self.compression = compression or OUTPUT_SETTINGS['compression']
+        if self.compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression '{self.compression}'. Choose from: gzip, zstd")
+        self.rotating = bool(OUTPUT_SETTINGS['rotate_tweets'] or OUTPUT_SETTINGS['rotate_bytes'])
+        self.path = None
+        self.username = None
+        self.segment = None
+        self.segments = []
+        self.count = 0
+
+    def segment_path(self, index):
+        """Build the file path of a segment.
+
+        Args:
+            index (int): One-based segment number.
+
+        Returns:
+            str: The path.
+        """
+        suffix = f"_part{index:03d}" if self.rotating else ''
+        return f"{self.path_stem}{suffix}.{self.extension}{COMPRESSION_SUFFIXES[self.compression]}"
+
+    def open(self, username):
+        """Create the first output file.
+
+        Args:
+            username (str): The profile being scraped.
+        """
+        self.username = username
+        self.start_segment()
+        self.path = self.segment['file']
+
+    def start_segment(self):
+        """Open the next segment."""
+        path = self.segment_path(len(self.segments) + 1)
+        self.open_segment(path)
+        self.segment = {'file': path, 'tweets': 0, 'bytes': 0, 'oldest': None, 'newest': None, 'complete': False}
+        self.segments.append(self.segment)
+
+    def finish_segment(self):
+        """Close the current segment and mark it complete."""
+        self.close_segment()
+        self.segment['complete'] = True
+        self.segment = None
+
+    def write(self, tweet):
+        """Write one tweet, rotating to a new segment when the current one is full.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            bool: True if a segment was finished by this write.
+        """
+        if self.segment is None:
+            self.start_segment()
+
+        size = self.write_tweet(tweet)
+        self.count += 1
+        self.segment['tweets'] += 1
+        self.segment['bytes'] += size
+
+        created_at = tweet.timestamp
+        if created_at:
+            if not self.segment['oldest'] or created_at < self.segment['oldest']:
+                self.segment['oldest'] = created_at
+            if not self.segment['newest'] or created_at > self.segment['newest']:
+                self.segment['newest'] = created_at
+
+        rotate_tweets = OUTPUT_SETTINGS['rotate_tweets']
+        rotate_bytes = OUTPUT_SETTINGS['rotate_bytes']
+        if (rotate_tweets and self.segment['tweets'] >= rotate_tweets) or \
+                (rotate_bytes and self.segment['bytes'] >= rotate_bytes):
+            # The next segment is opened lazily so a run never ends on an empty one
+            self.finish_segment()
+            return True
+        return False
+
+    def open_segment(self, path):
+        """Create a segment file.
+
+        Args:
+            path (str): The segment path.
+        """
+        raise NotImplementedError
+
+    def write_tweet(self, tweet):
+        """Write one tweet to the current segment.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            int: Uncompressed bytes written, used for size rotation.
+        """
+        raise NotImplementedError
+
+    def close_segment(self):
+        """Finish and close the current segment."""
+        raise NotImplementedError
+
+    def checkpoint(self, wait=False):
+        """Make everything written so far durable, where the format allows it.
+
+        Args:
+            wait (bool): Block until the checkpoint has been written.
+
+        Returns:
+            bool: False if writing failed.
+        """
+        return True
+
+    def get_stats(self):
+        """Get the sink's writer statistics.
+
+        Returns:
+            dict: Writer statistics, or None if the sink writes synchronously.
+        """
+        return None
+
+    def close(self):
+        """Finish the last segment."""
+        if self.segment is not None:
+            self.finish_segment()
+
+class TextStreamSink(TweetSink):
+    """A sink that writes formatted text, through a BackgroundWriter if enabled."""
+
+    def __init__(self, path_stem, compression=None):
+        """Initialize the sink.
+
+        Args:
+            path_stem (str): Output path without extension.
+            compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+        """
+        super().__init__(path_stem, compression)
+        self.file = None
+        self.writer = None
+        self.writer_stats = None
+
+    def open_stream(self, path):
+        """Open the underlying text stream, compressing it if configured.
+
+        Compressed streams are flushed block by block, so everything flushed
+        so far can be decompressed while the file is still being written.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            file: A writable text file.
+        """
+        level = OUTPUT_SETTINGS['compression_level']
+        if self.compression == 'gzip':
+            return gzip.open(path, 'wt', compresslevel=level or 6, encoding='utf-8', newline='')
+        if self.compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise Exception("zstd compression needs zstandard: pip install zstandard")
+            compressor = zstandard.ZstdCompressor(level=level or 3)
+            return zstandard.open(path, 'w', cctx=compressor, encoding='utf-8', newline='')
+        return open(path, 'a', encoding='utf-8', newline='')
+
+    def format_header(self, username):
+        """Format the text written at the start of each segment.
+
+        Args:
+            username (str): The profile being scraped.
+
+        Returns:
+            str: The header, possibly empty.
+        """
+        return ''
+
+    def format_tweet(self, tweet):
+        """Format one tweet.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            str: The formatted tweet.
+        """
+        raise NotImplementedError
+
+    def open_segment(self, path):
+        """Create a segment file and write the header.
+
+        Args:
+            path (str): The segment path.
+        """
+        self.file = self.open_stream(path)
+        header = self.format_header(self.username)
+        if header:
+            self.file.write(header)
+            self.file.flush()
+
+        if WRITER_SETTINGS['background']:
+            self.writer = BackgroundWriter(self.file)
+
+    def write_tweet(self, tweet):
+        """Write one tweet.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            int: Bytes written before compression.
+        """
+        text = self.format_tweet(tweet)
+        if self.writer:
+            # Batched and flushed by the writer thread
+            self.writer.write(text)
+        else:
+            # Write to file and flush immediately
+            self.file.write(text)
+            self.file.flush()
+        return len(text.encode('utf-8'))
+
+    def checkpoint(self, wait=False):
+        """Flush, and sync if WRITER_SETTINGS['fsync'] asks for it.
+
+        Args:
+            wait (bool): Block until the checkpoint has been written.
+
+        Returns:
+            bool: False if writing failed.
+        """
+        if self.writer:
+            return self.writer.checkpoint(wait)
+        return True
+
+    def get_stats(self):
+        """Get the background writers' statistics, summed over segments.
+
+        Returns:
+            dict: Writer statistics, or None when writing synchronously.
+        """
+        current = self.writer.get_stats() if self.writer else None
+        if not self.writer_stats or not current:
+            return current or self.writer_stats
+        stats = {key: self.writer_stats[key] + current[key] for key in ('items', 'batches', 'flushes', 'fsyncs')}
+        stats['queue_depth'] = current['queue_depth']
+        stats['max_queue_depth'] = max(self.writer_stats['max_queue_depth'], current['max_queue_depth'])
+        stats['max_latency_ms'] = max(self.writer_stats['max_latency_ms'], current['max_latency_ms'])
+        stats['avg_latency_ms'] = (
+            self.writer_stats['avg_latency_ms'] * self.writer_stats['items'] + current['avg_latency_ms'] * current['items']
+        ) / stats['items'] if stats['items'] else 0.0
+        return stats
+
+    def close_segment(self):
+        """Write out any queued tweets and close the segment file."""
+        if self.writer:
+            self.writer.close()
+            self.writer_stats = self.get_stats()
+            self.writer = None
+        elif self.file:
+            self.file.close()
+        self.file = None
+
+class TextSink(TextStreamSink):
+    """The human-readable text format."""
+
+    name = 'text'
+    extension = 'txt'
+
+    def format_metrics(self, metrics):
+        """Format tweet metrics for output.
+
+        Args:
+            metrics (dict): Dictionary containing tweet metrics.
+
+        Returns:
+            str: Formatted metrics string.
+        """
+        return (f"💬 {metrics['comments']} Comments  •  "
+                f"🔄 {metrics['retweets']} Retweets  •  "
+                f"❤️ {metrics['likes']} Likes  •  "
+                f"👁️ {metrics['views']} Views")
+
+    def format_timestamp(self, timestamp):
+        """Format timestamp for output.
+
+        Args:
+            timestamp (str): ISO format timestamp.
+
+        Returns:
+            str: Formatted date string.
+        """
+        try:
+            dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            return dt.strftime("%B %d, %Y at %I:%M %p")
+        except:
+            return timestamp
+
+    def format_header(self, username):
+        """Format the file header.
+
+        Args:
+            username (str): The profile being scraped.
+
+        Returns:
+            str: The header.
+        """
+        return (
+            f"📱 Tweets from @{username}\n"
+            f"📅 Scraped on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n"
+            f"{'─' * 80}\n\n"
+        )
+
+    def format_tweet(self, tweet):
+        """Format one tweet.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            str: The formatted tweet.
+        """
+        return (
+            f"🕒 {self.format_timestamp(tweet.timestamp)}\n\n"
+            f"{tweet.text}\n\n"
+            f"{self.format_metrics(tweet.metrics)}\n"
+            f"{'─' * 80}\n\n"
+        )
+
+class JsonlSink(TextStreamSink):
+    """One JSON object per line with typed fields."""
+
+    name = 'jsonl'
+    extension = 'jsonl'
+
+    def format_tweet(self, tweet):
+        """Format one tweet as a JSON line.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            str: The JSON line.
+        """
+        return tweet.to_json() + '\n'
+
+class CsvSink(TextStreamSink):
+    """Comma-separated values with a header row."""
+
+    name = 'csv'
+    extension = 'csv'
+
+    def format_row(self, values):
+        """Format one CSV row.
+
+        Args:
+            values (list): The row's values.
+
+        Returns:
+            str: The row with proper quoting.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue()
+
+    def format_header(self, username):
+        """Format the header row.
+
+        Args:
+            username (str): The profile being scraped.
+
+        Returns:
+            str: The header row.
+        """
+        return self.format_row(Tweet.FIELDS)
+
+    def format_tweet(self, tweet):
+        """Format one tweet as a CSV row.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            str: The CSV row.
+        """
+        values = [getattr(tweet, field) for field in Tweet.FIELDS]
+        values[Tweet.FIELDS.index('created_at')] = tweet.timestamp
+        return self.format_row(['' if value is None else value for value in values])
+
+class ParquetSink(TweetSink):
+    """Columnar Parquet output written in row groups.
+
+    At most OUTPUT_SETTINGS['parquet_row_group_size'] tweets are held in
+    memory; each full batch is written as one row group. Compression is
+    applied inside the file as the Parquet codec. Requires pyarrow.
+    """
+
+    name = 'parquet'
+    extension = 'parquet'
+
+    def __init__(self, path_stem, compression=None):
+        """Initialize the sink.
+
+        Args:
+            path_stem (str): Output path without extension.
+            compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+        """
+        super().__init__(path_stem, compression)
+        self.rows = []
+        self.schema = None
+        self.parquet_writer = None
+        self.row_groups = 0
+
+    def segment_path(self, index):
+        """Build the file path of a segment. Parquet compresses internally.
+
+        Args:
+            index (int): One-based segment number.
+
+        Returns:
+            str: The path.
+        """
+        suffix = f"_part{index:03d}" if self.rotating else ''
+        return f"{self.path_stem}{suffix}.{self.extension}"
+
+    def open_segment(self, path):
+        """Create a Parquet file.
+
+        Args:
+            path (str): The segment path.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Exception("Parquet output needs pyarrow: pip install pyarrow")
+
+        self.schema = pa.schema([
+            ('status_id', pa.int64()),
+            ('url', pa.string()),
+            ('author', pa.string()),
+            ('created_at', pa.timestamp('s', tz='UTC')),
+            ('text', pa.string()),
+            ('comments', pa.int64()),
+            ('retweets', pa.int64()),
+            ('likes', pa.int64()),
+            ('views', pa.int64())
+        ])
+        self.parquet_writer = pq.ParquetWriter(path, self.schema, compression=self.compression or 'snappy')
+
+    def write_tweet(self, tweet):
+        """Buffer one tweet, writing a row group when the buffer is full.
+
+        Args:
+            tweet (Tweet): The tweet from TweetProcessor.
+
+        Returns:
+            int: Approximate bytes of the row before encoding.
+        """
+        self.rows.append(tweet)
+        if len(self.rows) >= OUTPUT_SETTINGS['parquet_row_group_size']:
+            self.write_row_group()
+        return len(tweet.text.encode('utf-8')) + len(tweet.url or '') + 64
+
+    def write_row_group(self):
+        """Write the buffered tweets as one row group."""
+        if not self.rows:
+            return
+        import pyarrow as pa
+
+        # created_at is stored as epoch seconds, which the timestamp column takes as is
+        columns = {field: [getattr(tweet, field) for tweet in self.rows] for field in Tweet.FIELDS}
+        self.parquet_writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+        self.row_groups += 1
+        self.rows = []
+
+    def checkpoint(self, wait=False):
+        """Write the buffered tweets when the caller waits for them.
+
+        A waiting checkpoint is followed by committing the tweets' keys to
+        the dedup index, so they must not stay in memory. Other checkpoints
+        leave the buffer alone to keep row groups full.
+
+        Args:
+            wait (bool): Write the buffered tweets as a row group now.
+
+        Returns:
+            bool: True; write errors are raised.
+        """
+        if wait and self.parquet_writer:
+            self.write_row_group()
+        return True
+
+    def close_segment(self):
+        """Write the last row group and the file footer."""
+        if self.parquet_writer:
+            self.write_row_group()
+            self.parquet_writer.close()
+            self.parquet_writer = None
+
+SINKS = {
+    'text': TextSink,
+    'jsonl': JsonlSink,
+    'csv': CsvSink,
+    'parquet': ParquetSink
+}
+
+def create_sink(output_format, path_stem, compression=None):
+    """Create a sink for an output format.
+
+    Args:
+        output_format (str): One of SINKS.
+        path_stem (str): Output path without extension.
+        compression (str): None, 'gzip' or 'zstd'. Defaults to OUTPUT_SETTINGS['compression'].
+
+    Returns:
+        TweetSink: The sink.
+    """
+    if output_format not in SINKS:
+        raise ValueError(f"Unknown output format '{output_format}'. Choose from: {', '.join(SINKS)}")
+    return SINKS[output_format](path_stem, compression)
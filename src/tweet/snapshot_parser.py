@@ -0,0 +1,279 @@
+"""Parser for timeline HTML snapshots captured from the page."""
+
+import re
+import gzip
+from pathlib import Path
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from rich.console import Console
+
+from ..config.settings import SNAPSHOT_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+STATUS_ID_PATTERN = re.compile(r'/status/(\d+)')
+
+# Elements that never have children or an end tag
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'
+}
+
+class SnapshotElement:
+    """A parsed HTML element with the subset of the lxml element API the parser uses."""
+
+    def __init__(self, tag, attrs, parent=None):
+        """Initialize the element.
+
+        Args:
+            tag (str): Lowercase tag name.
+            attrs (dict): Attribute values by name.
+            parent (SnapshotElement): The enclosing element.
+        """
+        self.tag = tag
+        self.attrib = attrs
+        self.parent = parent
+        self.children = []
+
+    def get(self, name, default=None):
+        """Get an attribute value.
+
+        Args:
+            name (str): The attribute name.
+            default: Returned if the attribute is missing.
+
+        Returns:
+            str: The value, or default.
+        """
+        return self.attrib.get(name, default)
+
+    def getparent(self):
+        """Get the enclosing element.
+
+        Returns:
+            SnapshotElement: The parent, or None for the root.
+        """
+        return self.parent
+
+    def iter(self, tag=None):
+        """Walk this element and its descendants in document order.
+
+        Args:
+            tag (str): Only yield elements with this tag.
+
+        Yields:
+            SnapshotElement: Each matching element.
+        """
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            if tag is None or element.tag == tag:
+                yield element
+            stack.extend(child for child in reversed(element.children) if isinstance(child, SnapshotElement))
+
+    def text_content(self):
+        """Get the text of this element and its descendants.
+
+        Returns:
+            str: The concatenated text.
+        """
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return ''.join(parts)
+
+class SnapshotTreeBuilder(HTMLParser):
+    """Builds a SnapshotElement tree with the standard library's HTML parser."""
+
+    def __init__(self):
+        """Initialize the builder with an empty document."""
+        super().__init__(convert_charrefs=True)
+        self.root = SnapshotElement('#document', {})
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        element = SnapshotElement(tag, {name: value or '' for name, value in attrs}, self.current)
+        self.current.children.append(element)
+        if tag not in VOID_ELEMENTS:
+            self.current = element
+
+    def handle_startendtag(self, tag, attrs):
+        element = SnapshotElement(tag, {name: value or '' for name, value in attrs}, self.current)
+        self.current.children.append(element)
+
+    def handle_endtag(self, tag):
+        # Close the nearest open element with this tag, and any left open inside it
+        element = self.current
+        while element is not self.root and element.tag != tag:
+            element = element.parent
+        if element is not self.root:
+            self.current = element.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+class SnapshotParser:
+    """Extracts tweet payloads from timeline HTML.
+
+    Reads each article the way EXTRACT_ARTICLE_FUNCTION does in the page,
+    so the payloads go through TweetProcessor.process_payload unchanged.
+    """
+
+    def __init__(self, backend=None):
+        """Initialize the parser.
+
+        Args:
+            backend (str): 'lxml' (needs lxml) or 'html.parser' (standard library,
+                slower). Defaults to SNAPSHOT_SETTINGS['parser'].
+        """
+        self.backend = backend or SNAPSHOT_SETTINGS['parser']
+        if self.backend not in ('lxml', 'html.parser'):
+            raise ValueError(f"Unknown snapshot parser '{self.backend}'. Choose from: lxml, html.parser")
+        if self.backend == 'lxml':
+            try:
+                import lxml.html
+            except ImportError:
+                raise Exception("The lxml snapshot parser needs lxml: pip install lxml")
+            self.lxml_html = lxml.html
+
+    def parse_tree(self, html):
+        """Parse HTML into an element tree.
+
+        Args:
+            html (str): The snapshot.
+
+        Returns:
+            The root element.
+        """
+        if self.backend == 'lxml':
+            return self.lxml_html.fromstring(html)
+        builder = SnapshotTreeBuilder()
+        builder.feed(html)
+        builder.close()
+        return builder.root
+
+    def parse(self, html, base_url=None):
+        """Extract the payload of every article in a snapshot.
+
+        Args:
+            html (str): The snapshot.
+            base_url (str): Origin the page was loaded from, to make permalinks absolute.
+
+        Returns:
+            list: Payload dicts with text, timestamp, permalink, status_id,
+                metric_labels and views_label.
+        """
+        payloads = []
+        for article in self.parse_tree(html).iter('article'):
+            # Articles collapsed by PRUNE_ARTICLES_SCRIPT were already processed
+            if article.get('role') != 'article' or article.get('data-scraper-pruned') is not None:
+                continue
+            try:
+                payloads.append(self.extract_article(article, base_url))
+            except Exception as e:
+                console.print(f"[red]Error parsing snapshot article: {str(e)}[/red]")
+        return payloads
+
+    def extract_article(self, article, base_url=None):
+        """Read the raw fields of one article.
+
+        Args:
+            article: The article element.
+            base_url (str): Origin the page was loaded from.
+
+        Returns:
+            dict: The article's payload.
+        """
+        descendants = [element for element in article.iter() if element is not article]
+
+        text = ''
+        text_element = next((e for e in descendants if e.get('data-testid') == 'tweetText'), None)
+        if text_element is not None:
+            text = text_element.text_content().strip()
+        else:
+            for element in descendants:
+                if element.get('lang') is not None:
+                    candidate = element.text_content().strip()
+                    if candidate:
+                        text = candidate
+                        break
+
+        time_element = next((e for e in descendants if e.tag == 'time'), None)
+        timestamp = time_element.get('datetime') if time_element is not None else None
+
+        # Like Element.closest, the time element itself and its ancestors
+        link = time_element
+        while link is not None and not (link.tag == 'a' and '/status/' in link.get('href', '')):
+            link = link.getparent()
+        if link is None:
+            link = next((e for e in descendants if e.tag == 'a' and '/status/' in e.get('href', '')), None)
+        permalink = None
+        if link is not None:
+            permalink = urljoin(base_url, link.get('href')) if base_url else link.get('href')
+        match = STATUS_ID_PATTERN.search(permalink or '')
+
+        metric_labels = []
+        for group in descendants:
+            if group.get('role') != 'group':
+                continue
+            for button in group.iter():
+                if button is not group and button.get('role') == 'button':
+                    metric_labels.append(button.get('aria-label') or '')
+
+        analytics = next((e for e in descendants if 'analytics' in (e.get('href') or '')), None)
+
+        return {
+            'text': text,
+            'timestamp': timestamp,
+            'permalink': permalink,
+            'status_id': match.group(1) if match else None,
+            'metric_labels': metric_labels,
+            'views_label': (analytics.get('aria-label') or '') if analytics is not None else ''
+        }
+
+def write_snapshot(path, html):
+    """Write a snapshot as gzipped HTML.
+
+    Args:
+        path (str): The output path, ending in .html.gz.
+        html (str): The snapshot.
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf-8', compresslevel=SNAPSHOT_SETTINGS['compresslevel']) as f:
+        f.write(html)
+
+def read_snapshot(path):
+    """Read a snapshot written by write_snapshot.
+
+    Args:
+        path (str): The snapshot path.
+
+    Returns:
+        str: The snapshot HTML.
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return f.read()
+
+def parse_snapshot(html=None, path=None, base_url=None, backend=None, save=False):
+    """Parse one snapshot in a worker process, saving it first if asked.
+
+    Args:
+        html (str): The snapshot, or None to read it from path.
+        path (str): Where the snapshot is saved.
+        base_url (str): Origin the page was loaded from.
+        backend (str): Passed to SnapshotParser.
+        save (bool): Whether to write html to path before parsing.
+
+    Returns:
+        list: The snapshot's article payloads.
+    """
+    if html is None:
+        html = read_snapshot(path)
+    elif save:
+        write_snapshot(path, html)
+    return SnapshotParser(backend).parse(html, base_url)
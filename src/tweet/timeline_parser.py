@@ -0,0 +1,222 @@
+"""Timeline GraphQL response parsing module for Twitter scraping."""
+
+from datetime import datetime
+from rich.console import Console
+
+from ..config.settings import SITE_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# Operation names of the GraphQL endpoints that return timeline tweets
+TIMELINE_OPERATIONS = (
+    'UserTweets',
+    'UserTweetsAndReplies',
+    'UserMedia',
+    'SearchTimeline',
+    'HomeTimeline',
+    'HomeLatestTimeline',
+)
+
+class TimelineParser:
+    """Decodes timeline GraphQL payloads into tweet dictionaries."""
+
+    def is_timeline_url(self, url):
+        """Check whether a response URL belongs to a timeline endpoint.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            bool: True if the URL is a timeline GraphQL request.
+        """
+        if not url or '/graphql/' not in url:
+            return False
+        path = url.split('?', 1)[0]
+        return path.rsplit('/', 1)[-1] in TIMELINE_OPERATIONS
+
+    def find_instructions(self, payload):
+        """Find the timeline instruction list anywhere in a GraphQL payload.
+
+        The list sits under a different path for every timeline operation
+        (and moves between API versions), so it is located by shape.
+
+        Args:
+            payload (dict): The decoded GraphQL response.
+
+        Returns:
+            list: The timeline instructions, or an empty list.
+        """
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                instructions = node.get('instructions')
+                if isinstance(instructions, list):
+                    return instructions
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return []
+
+    def iter_entries(self, payload):
+        """Iterate over the timeline entries of a GraphQL payload.
+
+        Args:
+            payload (dict): The decoded GraphQL response.
+
+        Yields:
+            dict: Each timeline entry, including pinned entries.
+        """
+        for instruction in self.find_instructions(payload):
+            if 'entries' in instruction:
+                for entry in instruction.get('entries') or []:
+                    yield entry
+            elif 'entry' in instruction:
+                yield instruction['entry']
+
+    def extract_cursor(self, payload, cursor_type='Bottom'):
+        """Extract a pagination cursor from a GraphQL payload.
+
+        Args:
+            payload (dict): The decoded GraphQL response.
+            cursor_type (str): 'Bottom' for older tweets, 'Top' for newer ones.
+
+        Returns:
+            str: The cursor value, or None if the payload has none.
+        """
+        for instruction in self.find_instructions(payload):
+            # Search timelines replace the cursor entries on later pages
+            entries = instruction.get('entries') or []
+            if 'entry' in instruction:
+                entries = [instruction['entry']]
+            for entry in entries:
+                content = entry.get('content') or {}
+                if content.get('cursorType') == cursor_type:
+                    return content.get('value')
+        return None
+
+    def extract_tweet_results(self, entry):
+        """Extract the raw tweet results contained in a timeline entry.
+
+        Args:
+            entry (dict): A timeline entry.
+
+        Returns:
+            list: The tweet result objects of the entry.
+        """
+        content = entry.get('content') or {}
+        item_contents = []
+
+        if 'itemContent' in content:
+            item_contents.append(content['itemContent'])
+        for item in content.get('items') or []:
+            item_content = (item.get('item') or {}).get('itemContent')
+            if item_content:
+                item_contents.append(item_content)
+
+        results = []
+        for item_content in item_contents:
+            result = (item_content.get('tweet_results') or {}).get('result')
+            if result:
+                results.append(result)
+        return results
+
+    def unwrap_result(self, result):
+        """Unwrap visibility wrappers around a tweet result.
+
+        Args:
+            result (dict): A tweet result object.
+
+        Returns:
+            dict: The inner tweet object, or None if it is unavailable.
+        """
+        if result.get('__typename') == 'TweetWithVisibilityResults':
+            result = result.get('tweet') or {}
+        if 'legacy' not in result:
+            return None
+        return result
+
+    def extract_author(self, result):
+        """Extract the author's screen name from a tweet result.
+
+        Args:
+            result (dict): A tweet result object.
+
+        Returns:
+            str: The screen name, or None if it is missing.
+        """
+        user = ((result.get('core') or {}).get('user_results') or {}).get('result') or {}
+        return ((user.get('core') or {}).get('screen_name')
+                or (user.get('legacy') or {}).get('screen_name'))
+
+    def format_created_at(self, created_at):
+        """Convert the API's created_at value to an ISO timestamp.
+
+        Args:
+            created_at (str): A timestamp like 'Wed Oct 10 20:19:24 +0000 2018'.
+
+        Returns:
+            str: The ISO format timestamp, or None if it cannot be parsed.
+        """
+        try:
+            return datetime.strptime(created_at, '%a %b %d %H:%M:%S %z %Y').isoformat()
+        except:
+            return None
+
+    def parse_result(self, result):
+        """Convert a tweet result object into a tweet dictionary.
+
+        Args:
+            result (dict): A tweet result object.
+
+        Returns:
+            dict: The tweet data, or None if the result holds no tweet.
+        """
+        result = self.unwrap_result(result)
+        if not result:
+            return None
+
+        legacy = result['legacy']
+        status_id = legacy.get('id_str') or result.get('rest_id')
+
+        # Long tweets carry their full text outside of legacy
+        note = ((result.get('note_tweet') or {}).get('note_tweet_results') or {}).get('result') or {}
+        text = note.get('text') or legacy.get('full_text') or ''
+
+        author = self.extract_author(result)
+        views = (result.get('views') or {}).get('count') or '0'
+
+        return {
+            'text': text.strip(),
+            'timestamp': self.format_created_at(legacy.get('created_at', '')),
+            'metrics': {
+                'comments': str(legacy.get('reply_count', 0)),
+                'retweets': str(legacy.get('retweet_count', 0)),
+                'likes': str(legacy.get('favorite_count', 0)),
+                'views': str(views)
+            },
+            'status_id': status_id,
+            'url': f"{SITE_SETTINGS['base_url']}/{author or 'i'}/status/{status_id}",
+            'author': author
+        }
+
+    def parse(self, payload):
+        """Decode every tweet in a timeline GraphQL payload.
+
+        Args:
+            payload (dict): The decoded GraphQL response.
+
+        Returns:
+            list: Tweet dictionaries in timeline order.
+        """
+        tweets = []
+        for entry in self.iter_entries(payload):
+            for result in self.extract_tweet_results(entry):
+                try:
+                    tweet_data = self.parse_result(result)
+                    if tweet_data and tweet_data['text']:
+                        tweets.append(tweet_data)
+                except Exception as e:
+                    console.print(f"[red]Error parsing timeline tweet: {str(e)}[/red]")
+        return tweets
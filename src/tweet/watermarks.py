@@ -0,0 +1,100 @@
+"""Per-account scrape progress for incremental runs."""
+
+import os
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from rich.console import Console
+
+from .processor import SNOWFLAKE_EPOCH_MS
+from ..config.settings import WATERMARK_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+class WatermarkStore:
+    """Saves how much of each account's timeline has been scraped.
+
+    The saved tweets of an account always form one unbroken stretch of its
+    timeline, from newest_id down to oldest_id. A run scrapes the tweets
+    newer than newest_id and then, unless the stretch already reaches the
+    account's first tweet, continues the backfill below oldest_id.
+    """
+
+    def __init__(self, state_dir=None):
+        """Initialize the store.
+
+        Args:
+            state_dir (str): Directory for state files. Defaults to WATERMARK_SETTINGS['state_dir'].
+        """
+        self.state_dir = Path(state_dir or WATERMARK_SETTINGS['state_dir'])
+
+    def path_for(self, account):
+        """Get the state file of an account.
+
+        Args:
+            account (str): The scraped profile.
+
+        Returns:
+            Path: The state file path.
+        """
+        return self.state_dir / f"{account.lstrip('@').lower()}.json"
+
+    def load(self, account):
+        """Load an account's state.
+
+        Args:
+            account (str): The scraped profile.
+
+        Returns:
+            dict: newest_id, oldest_id, cursor and complete; the IDs are None
+                if the account has not been scraped yet.
+        """
+        state = {'account': account.lstrip('@').lower(), 'newest_id': None, 'oldest_id': None,
+                 'cursor': None, 'complete': False}
+        path = self.path_for(account)
+        if not path.exists():
+            return state
+
+        try:
+            state.update(json.loads(path.read_text(encoding='utf-8')))
+        except Exception as e:
+            console.print(f"[yellow]Ignoring unreadable watermark file: {str(e)}[/yellow]")
+        return state
+
+    def format_time(self, status_id):
+        """Get the creation time encoded in a status ID.
+
+        Args:
+            status_id (int): The status ID.
+
+        Returns:
+            str: ISO 8601 UTC timestamp, or None without an ID.
+        """
+        if status_id is None:
+            return None
+        seconds = ((status_id >> 22) + SNOWFLAKE_EPOCH_MS) / 1000
+        return datetime.fromtimestamp(seconds, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    def save(self, state):
+        """Store an account's state.
+
+        The file is replaced atomically, so an interrupted run leaves the
+        state of its last checkpoint.
+
+        Args:
+            state (dict): The state returned by load, updated.
+        """
+        state['newest_at'] = self.format_time(state['newest_id'])
+        state['oldest_at'] = self.format_time(state['oldest_id'])
+        state['updated_at'] = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            path = self.path_for(state['account'])
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            os.replace(temp_path, path)
+        except Exception as e:
+            console.print(f"[red]Error saving watermark: {str(e)}[/red]")
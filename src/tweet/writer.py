@@ -0,0 +1,223 @@
+"""Background writer that batches file writes off the scraping thread."""
+
+import os
+import time
+import queue
+import atexit
+import threading
+from rich.console import Console
+
+from ..config.settings import WRITER_SETTINGS
+
+# Initialize Rich console
+console = Console()
+
+# Queue marker that stops the writer thread
+_STOP = object()
+
+class _Checkpoint:
+    """Queue marker set once everything queued before it was written."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error = None
+
+class BackgroundWriter:
+    """Writes text to an open file from a worker thread.
+
+    Producers only enqueue; the thread drains the queue in batches, writes
+    each batch with a single call and flushes according to the policy:
+    after `flush_every` queued items, after `flush_interval_ms` since the last
+    flush, and at checkpoints. With fsync 'checkpoint' data reaches the disk
+    at checkpoints and on close; with 'flush' on every flush.
+    """
+
+    def __init__(self, file, flush_every=None, flush_interval_ms=None, queue_size=None, fsync=None):
+        """Initialize and start the writer.
+
+        Args:
+            file: An open text file. The writer owns it and closes it.
+            flush_every (int): Flush after this many items. Defaults to WRITER_SETTINGS['flush_every'].
+            flush_interval_ms (int): Flush pending items at least this often. Defaults to WRITER_SETTINGS.
+            queue_size (int): Items buffered before write() blocks. Defaults to WRITER_SETTINGS['queue_size'].
+            fsync (str): 'never', 'checkpoint' or 'flush'. Defaults to WRITER_SETTINGS['fsync'].
+        """
+        self.file = file
+        self.flush_every = flush_every or WRITER_SETTINGS['flush_every']
+        self.flush_interval = (flush_interval_ms or WRITER_SETTINGS['flush_interval_ms']) / 1000
+        self.fsync = fsync or WRITER_SETTINGS['fsync']
+        self.queue = queue.Queue(maxsize=queue_size or WRITER_SETTINGS['queue_size'])
+        self.error = None
+        self.closed = False
+        self.unsynced = 0
+        self.stats = {
+            'items': 0,
+            'batches': 0,
+            'flushes': 0,
+            'fsyncs': 0,
+            'max_queue_depth': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0
+        }
+
+        self.thread = threading.Thread(target=self.run, name="tweet-writer", daemon=True)
+        self.thread.start()
+        # Drain the queue even if the process exits without calling close()
+        atexit.register(self.close)
+
+    def write(self, text):
+        """Queue text for writing.
+
+        Blocks while the queue is full, so a slow disk slows the scraper
+        down instead of growing memory without bound.
+
+        Args:
+            text (str): The text to write.
+        """
+        if self.error:
+            raise self.error
+        if self.closed:
+            raise Exception("Writer is closed.")
+
+        self.queue.put((text, time.perf_counter()))
+        depth = self.queue.qsize()
+        if depth > self.stats['max_queue_depth']:
+            self.stats['max_queue_depth'] = depth
+
+    def checkpoint(self, wait=False):
+        """Flush everything queued so far, and fsync if the policy asks for it.
+
+        Args:
+            wait (bool): Block until the checkpoint has been written.
+
+        Returns:
+            bool: False if writing failed. Without wait, only errors from
+                earlier batches are known yet.
+        """
+        if self.closed or self.error:
+            return self.error is None
+        marker = _Checkpoint()
+        self.queue.put(marker)
+        if not wait:
+            return True
+        marker.done.wait()
+        return marker.error is None
+
+    def run(self):
+        """Drain the queue until close() is called."""
+        pending = 0
+        last_flush = time.perf_counter()
+
+        while True:
+            timeout = self.flush_interval - (time.perf_counter() - last_flush) if pending else None
+            try:
+                item = self.queue.get(timeout=max(timeout, 0) if timeout is not None else None)
+            except queue.Empty:
+                item = None
+
+            # Take whatever else is already queued so it goes out in one write
+            items = [] if item is None else [item]
+            while item is not None and len(items) < self.flush_every:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            texts = []
+            markers = []
+            stop = False
+            for entry in items:
+                if entry is _STOP:
+                    stop = True
+                elif isinstance(entry, _Checkpoint):
+                    markers.append(entry)
+                else:
+                    texts.append(entry)
+
+            try:
+                if texts:
+                    self.write_batch(texts)
+                    pending += len(texts)
+
+                due = time.perf_counter() - last_flush >= self.flush_interval
+                if markers or stop or pending >= self.flush_every or (pending and due):
+                    self.flush(sync=self.fsync == 'flush' or (self.fsync == 'checkpoint' and (markers or stop)))
+                    pending = 0
+                    last_flush = time.perf_counter()
+
+            except Exception as e:
+                if not self.error:
+                    console.print(f"[red]Error writing tweets: {str(e)}[/red]")
+                self.error = e
+
+            for marker in markers:
+                marker.error = self.error
+                marker.done.set()
+            if stop:
+                return
+
+    def write_batch(self, texts):
+        """Write a batch of queued items with one call.
+
+        Args:
+            texts (list): (text, enqueue time) pairs.
+        """
+        self.file.write(''.join(text for text, _ in texts))
+
+        written = time.perf_counter()
+        for _, queued in texts:
+            latency = written - queued
+            self.stats['total_latency'] += latency
+            if latency > self.stats['max_latency']:
+                self.stats['max_latency'] = latency
+        self.unsynced += len(texts)
+        self.stats['items'] += len(texts)
+        self.stats['batches'] += 1
+
+    def flush(self, sync=False):
+        """Flush the file, optionally forcing it to disk.
+
+        Args:
+            sync (bool): Whether to fsync after flushing. Skipped if nothing was written since the last one.
+        """
+        self.file.flush()
+        self.stats['flushes'] += 1
+        if sync and self.unsynced:
+            os.fsync(self.file.fileno())
+            self.stats['fsyncs'] += 1
+            self.unsynced = 0
+
+    def get_stats(self):
+        """Report the writer's throughput, queue depth and latency.
+
+        Returns:
+            dict: Items written, batches, flushes, fsyncs, current and peak
+                queue depth, and average and peak enqueue-to-write latency in ms.
+        """
+        items = self.stats['items']
+        return {
+            'items': items,
+            'batches': self.stats['batches'],
+            'flushes': self.stats['flushes'],
+            'fsyncs': self.stats['fsyncs'],
+            'queue_depth': self.queue.qsize(),
+            'max_queue_depth': self.stats['max_queue_depth'],
+            'avg_latency_ms': self.stats['total_latency'] / items * 1000 if items else 0.0,
+            'max_latency_ms': self.stats['max_latency'] * 1000
+        }
+
+    def close(self):
+        """Write everything still queued, sync it and close the file."""
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+
+        if self.thread.is_alive():
+            self.queue.put(_STOP)
+            self.thread.join()
+
+        try:
+            self.file.close()
+        except Exception as e:
+            console.print(f"[red]Error closing file: {str(e)}[/red]")
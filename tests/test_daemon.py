@@ -0,0 +1,189 @@
+"""Tests for the scraper daemon, run against a fake browser."""
+
+import sys
+import threading
+from pathlib import Path
+from urllib.request import urlopen
+from urllib.error import HTTPError
+
+import pytest
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import src.scraper
+from src.daemon import BrowserPool, ScraperDaemon
+from src.scheduler import Backoff
+from src.config.settings import OUTPUT_SETTINGS, METRICS_SETTINGS, WRITER_SETTINGS, DAEMON_SETTINGS
+
+# Tweets on the fake profile's timeline
+TIMELINE_SIZE = 30
+
+class FakeWait:
+    """Stands in for WebDriverWait; the timeline is always rendered."""
+
+    def until(self, condition):
+        return True
+
+class FakeDriver:
+    """Serves a fixed timeline to EXTRACT_ARTICLES_SCRIPT, 10 more tweets per scroll."""
+
+    def __init__(self):
+        self.visible = 10
+        self.current_url = 'about:blank'
+
+    def execute(self, driver_command, params=None):
+        return {'value': None}
+
+    def get(self, url):
+        self.current_url = url
+        self.visible = 10
+
+    def execute_script(self, script, *args):
+        articles = [{
+            'text': f"tweet {index}",
+            'permalink': f"/alice/status/{1000 + TIMELINE_SIZE - index}",
+            'timestamp': '2024-01-01T00:00:00.000Z',
+            'metric_labels': []
+        } for index in range(self.visible)]
+        return {'articles': articles, 'height': self.visible * 100}
+
+class FakeBrowser:
+    """Stands in for BrowserManager without launching Chrome."""
+
+    def __init__(self, *args, **kwargs):
+        self.driver = FakeDriver()
+        self.wait = FakeWait()
+        self.metrics = None
+        self.last_scroll = None
+
+    def login(self, username, password, session_store=None):
+        return True
+
+    def scroll(self, scroll_fraction=None, timeout=None):
+        self.driver.visible = min(self.driver.visible + 10, TIMELINE_SIZE)
+        return True
+
+    def random_sleep(self, min_seconds=0.5, max_seconds=2):
+        pass
+
+    def detect_rate_limit(self):
+        return None
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    """A one-browser pool on the fake browser, not started yet."""
+    monkeypatch.setattr(src.scraper, 'BrowserManager', FakeBrowser)
+    monkeypatch.setitem(OUTPUT_SETTINGS, 'directory', str(tmp_path))
+    monkeypatch.setitem(METRICS_SETTINGS, 'summary', False)
+    monkeypatch.setitem(WRITER_SETTINGS, 'report_stats', False)
+    monkeypatch.setitem(DAEMON_SETTINGS, 'retry_delay', 0.1)
+    monkeypatch.setitem(DAEMON_SETTINGS, 'spool_dir', str(tmp_path / 'spool'))
+
+    return BrowserPool(1, 'user', 'password', {
+        'extraction_mode': 'batch',
+        'engine': 'browser',
+        'output_formats': ['jsonl'],
+        'skip_known': False,
+        'since_last_run': False,
+        'database': False,
+        'prune': False,
+        'pipeline': False
+    })
+
+@pytest.fixture
+def daemon(pool):
+    """A started daemon with one pooled scraper on the fake browser."""
+    assert pool.start() == 1
+    daemon = ScraperDaemon(pool, host='127.0.0.1', port=0)
+    daemon.start()
+    yield daemon
+    daemon.stop()
+
+def run(daemon, username):
+    """Submit a job and wait for it to end."""
+    job = daemon.submit(username)
+    with job.changed:
+        assert job.changed.wait_for(lambda: job.finished, timeout=30)
+    return job
+
+def spooled(job):
+    """Read the JSON lines a job spooled."""
+    return job.spool_path.read_text(encoding='utf-8').splitlines()
+
+def test_same_profile_twice_on_one_scraper(daemon):
+    first = run(daemon, 'alice')
+    second = run(daemon, 'alice')
+
+    assert daemon.pool.get_stats()['ready'] == 1
+    assert first.status == 'done'
+    assert second.status == 'done'
+    assert first.to_dict()['tweets'] == TIMELINE_SIZE
+    assert len(spooled(first)) == TIMELINE_SIZE
+    assert spooled(second) == spooled(first)
+
+def test_scrape_error_fails_the_job(daemon, monkeypatch):
+    def crash(self, script, *args):
+        raise Exception("chrome not reachable")
+    monkeypatch.setattr(FakeDriver, 'execute_script', crash)
+
+    job = run(daemon, 'alice')
+
+    assert job.status == 'failed'
+    assert job.error == "chrome not reachable"
+
+def test_bad_stream_offset_is_rejected(daemon):
+    job = run(daemon, 'alice')
+
+    for offset in ('abc', '-1'):
+        with pytest.raises(HTTPError) as error:
+            urlopen(f"http://127.0.0.1:{daemon.port}/jobs/{job.id}/tweets?offset={offset}")
+        assert error.value.code == 400
+    with urlopen(f"http://127.0.0.1:{daemon.port}/jobs/{job.id}/tweets?offset=25") as response:
+        assert len(response.read().splitlines()) == TIMELINE_SIZE - 25
+
+def test_stop_with_no_browser_logged_in(pool, monkeypatch):
+    monkeypatch.setattr(FakeBrowser, 'login', lambda self, username, password, session_store=None: False)
+    assert pool.start() == 0
+    daemon = ScraperDaemon(pool, host='127.0.0.1', port=0)
+    daemon.start()
+    job = daemon.submit('alice')
+
+    stopper = threading.Thread(target=daemon.stop, daemon=True)
+    stopper.start()
+    stopper.join(timeout=5)
+
+    assert not stopper.is_alive()
+    assert job.status == 'cancelled'
+
+def test_spools_are_removed_with_forgotten_jobs(daemon, monkeypatch):
+    monkeypatch.setitem(DAEMON_SETTINGS, 'keep_jobs', 1)
+    first = run(daemon, 'alice')
+    assert first.spool_path.exists()
+
+    second = run(daemon, 'alice')
+    daemon.submit('alice')
+
+    assert daemon.get_job(first.id) is None
+    assert not first.spool_path.exists()
+    assert len(spooled(second)) == TIMELINE_SIZE
+
+def test_cancel_interrupts_rate_limit_backoff(daemon, monkeypatch):
+    backing_off = threading.Event()
+
+    def long_delay(self):
+        backing_off.set()
+        return 600
+    monkeypatch.setattr(FakeBrowser, 'detect_rate_limit', lambda self: ("HTTP 429", None))
+    monkeypatch.setattr(Backoff, 'next_delay', long_delay)
+    job = daemon.submit('alice')
+    assert backing_off.wait(timeout=30)
+
+    daemon.cancel(job)
+    with job.changed:
+        assert job.changed.wait_for(lambda: job.finished, timeout=5)
+    assert job.status == 'cancelled'
+    assert job.tweets == TIMELINE_SIZE
@@ -0,0 +1,95 @@
+"""Tests for the SQLite tweet database."""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import src.tweet.database
+from src.tweet.models import Tweet
+from src.tweet.database import TweetDatabase
+from src.tweet.processor import TweetProcessor
+from src.tweet.timeline_parser import TimelineParser
+from src.testing.payloads import build_synthetic_page
+
+@pytest.fixture
+def database(tmp_path):
+    """An empty database in a temporary directory."""
+    database = TweetDatabase(tmp_path / 'tweets.sqlite')
+    yield database
+    database.close()
+
+def synthetic_tweets(page, count, screen_name='fixture_user'):
+    """Decode one synthetic timeline page into tweets."""
+    payload = build_synthetic_page(page, count, screen_name=screen_name)
+    return [Tweet.from_dict(tweet_data) for tweet_data in TimelineParser().parse(payload)]
+
+def save_all(database, tweets, account_id):
+    """Save tweets and commit them."""
+    for tweet in tweets:
+        database.save_tweet(tweet, account_id)
+    database.flush()
+
+def test_rescrape_updates_metrics_and_keeps_a_snapshot(database, monkeypatch):
+    account_id = database.account_id('fixture_user')
+    tweets = synthetic_tweets(0, 10)
+    monkeypatch.setattr(src.tweet.database, 'time', SimpleNamespace(time=lambda: 1700000000))
+    save_all(database, tweets, account_id)
+
+    tweets[3].likes += 100
+    monkeypatch.setattr(src.tweet.database, 'time', SimpleNamespace(time=lambda: 1700003600))
+    save_all(database, tweets, account_id)
+
+    assert database.connection.execute("SELECT COUNT(*) FROM tweets").fetchone()[0] == 10
+    history = database.get_metric_history(tweets[3].status_id)
+    assert [(snapshot['scraped_at'], snapshot['likes']) for snapshot in history] == [(1700000000, 3), (1700003600, 103)]
+    # Unchanged metrics add no snapshot
+    assert len(database.get_metric_history(tweets[4].status_id)) == 1
+    stored = next(tweet for tweet in database.query(account='fixture_user') if tweet.status_id == tweets[3].status_id)
+    assert stored.likes == 103
+
+def test_tweets_without_an_id_match_the_processor_key(database):
+    account_id = database.account_id('fixture_user')
+    processor = TweetProcessor()
+    tweet = processor.process_payload({'text': "No permalink", 'timestamp': '2024-01-01T00:00:00.000Z'})
+
+    save_all(database, [tweet, tweet], account_id)
+
+    key = processor.dedup_key(None, "No permalink", '2024-01-01T00:00:00.000Z')
+    assert database.connection.execute("SELECT id FROM tweets").fetchall() == [(key,)]
+
+def test_retweets_are_found_under_the_retweeter(database):
+    author_id = database.account_id('fixture_user')
+    retweeter_id = database.account_id('retweeter')
+    tweets = synthetic_tweets(0, 5)
+
+    # The retweeter's profile is scraped first, then the author's
+    save_all(database, tweets[:2], retweeter_id)
+    save_all(database, tweets, author_id)
+
+    assert len(list(database.query(account='retweeter'))) == 2
+    assert len(list(database.query(account='fixture_user'))) == 5
+    owners = database.connection.execute("SELECT DISTINCT account_id FROM tweets").fetchall()
+    assert owners == [(author_id,)]
+    # Rescraping the retweeter does not take the tweets back
+    save_all(database, tweets[:2], retweeter_id)
+    assert database.connection.execute("SELECT DISTINCT account_id FROM tweets").fetchall() == [(author_id,)]
+    accounts = {account['username']: account['tweets'] for account in database.get_accounts()}
+    assert accounts == {'fixture_user': 5, 'retweeter': 2}
+
+def test_query_filters(database):
+    account_id = database.account_id('fixture_user')
+    tweets = synthetic_tweets(0, 10)
+    save_all(database, tweets, account_id)
+
+    newest = list(database.query(account='@fixture_user', limit=3))
+    assert [tweet.status_id for tweet in newest] == [tweet.status_id for tweet in tweets[:3]]
+    oldest_first = list(database.query(newest_first=False, limit=1))
+    assert oldest_first[0].status_id == tweets[-1].status_id
+    assert [tweet.text for tweet in database.query(search='#7 ')] == [tweets[7].text]
+    since = list(database.query(since=tweets[4].created_at))
+    assert len(since) == 5
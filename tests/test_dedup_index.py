@@ -0,0 +1,87 @@
+"""Tests for the per-account dedup index and its Bloom filter."""
+
+import sys
+import sqlite3
+from pathlib import Path
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.tweet.dedup_index import BloomFilter, DedupIndex
+from src.tweet.processor import TweetProcessor
+from src.tweet.timeline_parser import TimelineParser
+from src.testing.payloads import build_synthetic_page
+from src.config.settings import DEDUP_SETTINGS
+
+def committed_keys(index):
+    """Count the keys another connection sees, i.e. the committed ones."""
+    connection = sqlite3.connect(str(index.path))
+    try:
+        return connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+    finally:
+        connection.close()
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    for key in range(1000):
+        bloom.add(key * 7919)
+
+    assert all(key * 7919 in bloom for key in range(1000))
+    false_positives = sum(-1 - key in bloom for key in range(10000))
+    assert false_positives < 300
+
+def test_keys_survive_a_reopen(tmp_path):
+    index = DedupIndex('@Alice', index_dir=tmp_path)
+    index.add(1001)
+    index.add(-42)
+    index.close()
+
+    index = DedupIndex('alice', index_dir=tmp_path)
+    assert 1001 in index and -42 in index
+    assert 1002 not in index
+    assert len(index) == 2
+    index.close()
+
+def test_keys_wait_for_flush(tmp_path):
+    index = DedupIndex('alice', index_dir=tmp_path)
+    index.add(1)
+    assert committed_keys(index) == 0
+    index.flush()
+    assert committed_keys(index) == 1
+
+    # Keys of tweets that failed to save are dropped
+    index.add(2)
+    index.close(commit=False)
+    index = DedupIndex('alice', index_dir=tmp_path)
+    assert 1 in index and 2 not in index
+    index.close()
+
+def test_bloom_grows_past_capacity_without_committing(tmp_path, monkeypatch):
+    monkeypatch.setitem(DEDUP_SETTINGS, 'bloom_capacity', 10)
+    index = DedupIndex('alice', index_dir=tmp_path)
+
+    for key in range(25):
+        index.add(key)
+
+    assert index.filter.capacity > 10
+    assert all(key in index for key in range(25))
+    assert committed_keys(index) == 0
+    index.close()
+
+def test_processor_skips_tweets_saved_by_earlier_runs(tmp_path):
+    parser = TimelineParser()
+    first_page = parser.parse(build_synthetic_page(0, 10))
+    second_page = parser.parse(build_synthetic_page(1, 10))
+
+    index = DedupIndex('fixture_user', index_dir=tmp_path)
+    processor = TweetProcessor(index)
+    assert all(processor.process_api_tweet(tweet) for tweet in first_page)
+    index.close()
+
+    index = DedupIndex('fixture_user', index_dir=tmp_path)
+    processor = TweetProcessor(index)
+    new = [processor.process_api_tweet(tweet) for tweet in first_page + second_page]
+    index.close()
+
+    assert sum(tweet is not None for tweet in new) == 10
+    assert index.skipped == 10
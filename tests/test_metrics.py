@@ -0,0 +1,110 @@
+"""Tests for run metrics and their Prometheus exposition."""
+
+import sys
+import threading
+from pathlib import Path
+from urllib.request import urlopen
+from urllib.error import HTTPError
+
+import pytest
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.monitoring import RunMetrics, Histogram, MetricsServer, format_prometheus, write_textfile
+
+class FakeDriver:
+    """Answers every WebDriver command at once."""
+
+    def execute(self, driver_command, params=None):
+        return {'value': None}
+
+def finished_run(username='alice'):
+    """Build the summary of a small finished run."""
+    metrics = RunMetrics()
+    metrics.reset(username)
+    metrics.count('tweets', 8)
+    metrics.count('extracted', 10)
+    metrics.count('throttles')
+    metrics.observe('scroll', 0.3)
+    metrics.observe('scroll', 2)
+    metrics.observe('scroll', 60)
+    metrics.finish()
+    return metrics.summary()
+
+def samples(text):
+    """Map each sample line's series to its value."""
+    return dict(line.rsplit(' ', 1) for line in text.splitlines() if not line.startswith('#'))
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1, 10))
+    for value in (0.05, 0.5, 0.5, 5, 50):
+        histogram.observe(value)
+
+    summary = histogram.to_dict()
+
+    assert summary['buckets'] == [[0.1, 1], [1, 3], [10, 4]]
+    assert summary['count'] == 5
+    assert summary['p50'] == 1
+    assert summary['p95'] == 50
+
+def test_prometheus_text_format():
+    text = format_prometheus([finished_run()])
+    series = samples(text)
+
+    assert '# TYPE twitter_scraper_tweets_total counter' in text
+    assert series['twitter_scraper_tweets_total{account="alice"}'] == '8'
+    assert series['twitter_scraper_duplicate_ratio{account="alice"}'] == '0.2'
+    assert series['twitter_scraper_events_total{account="alice",event="throttles"}'] == '1'
+    assert 'twitter_scraper_events_total{account="alice",event="tweets"}' not in series
+    # Bucket counts are cumulative and end with +Inf holding every observation
+    assert series['twitter_scraper_phase_seconds_bucket{account="alice",phase="scroll",le="0.5"}'] == '1'
+    assert series['twitter_scraper_phase_seconds_bucket{account="alice",phase="scroll",le="30"}'] == '2'
+    assert series['twitter_scraper_phase_seconds_bucket{account="alice",phase="scroll",le="+Inf"}'] == '3'
+    assert series['twitter_scraper_phase_seconds_count{account="alice",phase="scroll"}'] == '3'
+    assert series['twitter_scraper_phase_seconds_sum{account="alice",phase="scroll"}'] == '62.3'
+    assert text.endswith('\n')
+
+def test_label_values_are_escaped():
+    text = format_prometheus([finished_run('we"ird\\name')])
+
+    assert 'twitter_scraper_tweets_total{account="we\\"ird\\\\name"} 8' in text
+
+def test_textfile_is_replaced_whole(tmp_path):
+    path = tmp_path / 'batch.prom'
+    summaries = [finished_run('alice'), finished_run('bob')]
+
+    write_textfile(str(path), summaries)
+
+    assert path.read_text(encoding='utf-8') == format_prometheus(summaries)
+    assert [file.name for file in tmp_path.iterdir()] == ['batch.prom']
+
+def test_server_serves_metrics_on_localhost():
+    server = MetricsServer(0)
+    server.update(finished_run())
+    server.start()
+    try:
+        assert server.host == '127.0.0.1'
+        with urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            assert 'twitter_scraper_tweets_total{account="alice"} 8' in response.read().decode('utf-8')
+        with pytest.raises(HTTPError) as error:
+            urlopen(f"http://127.0.0.1:{server.port}/")
+        assert error.value.code == 404
+    finally:
+        server.stop()
+
+def test_driver_commands_from_several_threads_are_all_counted():
+    metrics = RunMetrics()
+    driver = FakeDriver()
+    metrics.instrument_driver(driver)
+
+    def send():
+        for index in range(500):
+            driver.execute(f"command{index % 20}")
+    threads = [threading.Thread(target=send) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.summary()['webdriver_commands'] == 2000
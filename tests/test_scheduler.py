@@ -0,0 +1,92 @@
+"""Tests for rate-limit pacing, backoff and credential rotation."""
+
+import sys
+import time
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.api.timeline_client import TimelineClient
+from src.scheduler import Backoff, TokenBucket, RateLimitScheduler, RateLimitError
+from src.testing.mock_timeline import MockTimelineServer
+from src.config.settings import SITE_SETTINGS, RATE_LIMIT_SETTINGS
+
+def test_backoff_doubles_up_to_its_ceiling():
+    backoff = Backoff(base=30, factor=2, max_delay=200, jitter=0)
+
+    assert [backoff.next_delay() for _ in range(5)] == [30, 60, 120, 200, 200]
+    backoff.reset()
+    assert backoff.next_delay() == 30
+
+def test_backoff_jitter_stays_in_its_band():
+    backoff = Backoff(base=100, factor=1, max_delay=100, jitter=0.2)
+
+    delays = [backoff.next_delay() for _ in range(200)]
+
+    assert all(80 <= delay <= 120 for delay in delays)
+    assert len(set(delays)) > 1
+
+def test_token_bucket_allows_a_burst_then_paces():
+    bucket = TokenBucket(rate_per_minute=600, burst=3)
+
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert 0.05 < bucket.acquire() <= 0.1
+
+def test_token_bucket_wait_ends_on_cancel():
+    bucket = TokenBucket(rate_per_minute=1, burst=1)
+    bucket.acquire()
+    cancel = threading.Event()
+    threading.Timer(0.1, cancel.set).start()
+
+    started = time.monotonic()
+    bucket.acquire(cancel)
+
+    assert time.monotonic() - started < 5
+
+def test_rotates_to_a_rested_account_then_backs_off(monkeypatch):
+    monkeypatch.setitem(RATE_LIMIT_SETTINGS, 'backoff_jitter', 0)
+    scheduler = RateLimitScheduler([('first', 'a'), ('second', 'b')])
+    scheduler.activate('first')
+
+    assert scheduler.on_rate_limited() == ('rotate', ('second', 'b'))
+    scheduler.activate('second')
+
+    # Both accounts rest now; the wait never runs past the earliest reset
+    action, delay = scheduler.on_rate_limited(reset_at=time.time() + 10)
+    assert action == 'wait'
+    assert 9 <= delay <= 10
+    # The active account's rest ends first, so it stays
+    assert scheduler.ready_credentials() is None
+
+def test_gives_up_after_max_attempts(monkeypatch):
+    monkeypatch.setitem(RATE_LIMIT_SETTINGS, 'max_attempts', 2)
+    scheduler = RateLimitScheduler()
+
+    actions = [scheduler.on_rate_limited()[0] for _ in range(3)]
+
+    assert actions == ['wait', 'wait', 'give_up']
+    scheduler.record_success()
+    assert scheduler.on_rate_limited()[0] == 'wait'
+
+def test_waits_for_the_reset_the_server_sends(monkeypatch):
+    server = MockTimelineServer(total=None, rate_limit=1, rate_window=30)
+    server.start()
+    monkeypatch.setitem(SITE_SETTINGS, 'base_url', server.base_url)
+    client = TimelineClient(cookies={'auth_token': 'token', 'ct0': 'csrf'}, http2=False)
+    try:
+        with pytest.raises(RateLimitError) as error:
+            for _ in client.iter_pages('1000001'):
+                pass
+    finally:
+        client.close()
+        server.stop()
+
+    scheduler = RateLimitScheduler([('user', 'password')])
+    scheduler.activate('user')
+    action, delay = scheduler.on_rate_limited(error.value.reset_at)
+    assert action == 'wait'
+    assert delay <= error.value.reset_at - time.time() + 1
@@ -0,0 +1,161 @@
+"""Tests for the output sinks, fed with tweets from synthetic timeline pages."""
+
+import sys
+import csv
+import json
+import gzip
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.tweet.models import Tweet
+from src.tweet.sinks import create_sink
+from src.tweet.writer import BackgroundWriter
+from src.tweet.file_handler import TweetFileHandler
+from src.tweet.timeline_parser import TimelineParser
+from src.testing.payloads import build_synthetic_page
+from src.config.settings import OUTPUT_SETTINGS
+
+def synthetic_tweets(count):
+    """Decode the first tweets of a synthetic timeline."""
+    payload = build_synthetic_page(0, count, total=count)
+    return [Tweet.from_dict(tweet_data) for tweet_data in TimelineParser().parse(payload)]
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    """Write output to a temporary directory."""
+    monkeypatch.setitem(OUTPUT_SETTINGS, 'directory', str(tmp_path))
+    return tmp_path
+
+def write_all(output_format, path_stem, tweets, compression=None):
+    """Write tweets through one sink and close it."""
+    sink = create_sink(output_format, str(path_stem), compression)
+    sink.open('fixture_user')
+    for tweet in tweets:
+        sink.write(tweet)
+    sink.close()
+    return sink
+
+def test_jsonl_keeps_typed_fields(output_dir):
+    tweets = synthetic_tweets(5)
+
+    sink = write_all('jsonl', output_dir / 'out', tweets)
+
+    rows = [json.loads(line) for line in Path(sink.path).read_text(encoding='utf-8').splitlines()]
+    assert [row['status_id'] for row in rows] == [tweet.status_id for tweet in tweets]
+    assert rows[3]['likes'] == 3
+    assert rows[0]['created_at'] == '2024-01-01T00:00:00Z'
+
+def test_csv_has_a_header_and_one_row_per_tweet(output_dir):
+    tweets = synthetic_tweets(5)
+
+    sink = write_all('csv', output_dir / 'out', tweets)
+
+    with open(sink.path, encoding='utf-8', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == list(Tweet.FIELDS)
+    assert [row['text'] for row in rows] == [tweet.text for tweet in tweets]
+
+def test_parquet_round_trip(output_dir):
+    pq = pytest.importorskip('pyarrow.parquet')
+    tweets = synthetic_tweets(5)
+
+    sink = write_all('parquet', output_dir / 'out', tweets)
+
+    table = pq.read_table(sink.path)
+    assert table.column('status_id').to_pylist() == [tweet.status_id for tweet in tweets]
+    assert table.column('views').to_pylist() == [tweet.views for tweet in tweets]
+
+def test_parquet_writes_buffered_rows_at_a_waiting_checkpoint(output_dir):
+    pytest.importorskip('pyarrow')
+    sink = create_sink('parquet', str(output_dir / 'out'))
+    sink.open('fixture_user')
+    for tweet in synthetic_tweets(3):
+        sink.write(tweet)
+
+    # Only a waiting checkpoint is followed by committing dedup keys
+    assert sink.checkpoint() and len(sink.rows) == 3
+    assert sink.checkpoint(wait=True) and sink.rows == []
+    assert sink.row_groups == 1
+    sink.close()
+
+def test_gzip_output_reads_back(output_dir):
+    tweets = synthetic_tweets(5)
+
+    sink = write_all('jsonl', output_dir / 'out', tweets, compression='gzip')
+
+    assert sink.path.endswith('.jsonl.gz')
+    with gzip.open(sink.path, 'rt', encoding='utf-8') as f:
+        assert len(f.read().splitlines()) == 5
+
+def test_rotation_by_tweet_count(output_dir, monkeypatch):
+    monkeypatch.setitem(OUTPUT_SETTINGS, 'rotate_tweets', 4)
+    handler = TweetFileHandler(['jsonl'])
+    handler.initialize_file('fixture_user')
+    for tweet in synthetic_tweets(10):
+        handler.save_tweet(tweet)
+
+    # The finished segments are listed while the run is still going
+    manifest = json.loads(Path(handler.manifest_file).read_text(encoding='utf-8'))
+    assert [segment['complete'] for segment in manifest['outputs']['jsonl']['segments']] == [True, True]
+    handler.close()
+
+    manifest = json.loads(Path(handler.manifest_file).read_text(encoding='utf-8'))
+    segments = manifest['outputs']['jsonl']['segments']
+    assert [segment['tweets'] for segment in segments] == [4, 4, 2]
+    assert all(segment['complete'] for segment in segments)
+    assert [Path(segment['file']).name.rsplit('_', 1)[-1] for segment in segments] == \
+        ['part001.jsonl', 'part002.jsonl', 'part003.jsonl']
+    for segment in segments:
+        assert len(Path(segment['file']).read_text(encoding='utf-8').splitlines()) == segment['tweets']
+    # Tweets are newest first, so each segment covers an older stretch
+    assert segments[0]['oldest'] > segments[1]['newest']
+
+def test_rotation_ends_without_an_empty_segment(output_dir, monkeypatch):
+    monkeypatch.setitem(OUTPUT_SETTINGS, 'rotate_tweets', 5)
+
+    sink = write_all('csv', output_dir / 'out', synthetic_tweets(10))
+
+    assert [segment['tweets'] for segment in sink.segments] == [5, 5]
+
+def test_parquet_rotation_by_size(output_dir, monkeypatch):
+    pq = pytest.importorskip('pyarrow.parquet')
+    monkeypatch.setitem(OUTPUT_SETTINGS, 'rotate_bytes', 500)
+
+    sink = write_all('parquet', output_dir / 'out', synthetic_tweets(12))
+
+    assert len(sink.segments) > 1
+    assert sum(pq.read_table(segment['file']).num_rows for segment in sink.segments) == 12
+
+def test_writer_checkpoint_reports_a_failed_write():
+    class FullDisk:
+        def write(self, text):
+            raise OSError("No space left on device")
+
+        def flush(self):
+            pass
+
+        def close(self):
+            pass
+
+    writer = BackgroundWriter(FullDisk())
+    writer.write("tweet\n")
+
+    assert writer.checkpoint(wait=True) is False
+    writer.close()
+    assert writer.checkpoint(wait=True) is False
+
+def test_file_handler_writes_every_format(output_dir):
+    handler = TweetFileHandler(['jsonl', 'csv'])
+    handler.initialize_file('fixture_user')
+    for tweet in synthetic_tweets(4):
+        assert handler.save_tweet(tweet)
+
+    assert handler.close() is True
+    assert [Path(path).suffix for path in handler.current_files] == ['.jsonl', '.csv']
+    manifest = json.loads(Path(handler.manifest_file).read_text(encoding='utf-8'))
+    assert manifest['complete']
+    assert {name: output['tweets'] for name, output in manifest['outputs'].items()} == {'jsonl': 4, 'csv': 4}
@@ -0,0 +1,79 @@
+"""Tests for the HTTP engine's timeline client, run against the mock timeline."""
+
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.api.timeline_client import TimelineClient
+from src.scheduler import RateLimitError
+from src.testing.mock_timeline import MockTimelineServer
+from src.config.settings import SITE_SETTINGS
+
+SESSION = {'auth_token': 'token', 'ct0': 'csrf'}
+
+@pytest.fixture
+def timeline(monkeypatch):
+    """Start a mock timeline and point the client at it."""
+    def start(**kwargs):
+        server = MockTimelineServer(**kwargs)
+        server.start()
+        started.append(server)
+        monkeypatch.setitem(SITE_SETTINGS, 'base_url', server.base_url)
+        return server
+
+    started = []
+    yield start
+    for server in started:
+        server.stop()
+
+def test_pages_through_the_whole_timeline(timeline):
+    server = timeline(total=50, page_size=20, require_auth=True)
+    client = TimelineClient(cookies=SESSION, http2=False)
+
+    user_id = client.get_user_id('mock_user')
+    pages = list(client.iter_pages(user_id))
+    client.close()
+
+    tweets = [tweet for page in pages for tweet in client.parser.parse(page)]
+    assert user_id == server.user_id
+    assert len(pages) == 3
+    assert len({tweet['status_id'] for tweet in tweets}) == 50
+    assert client.request_count == 4
+
+def test_resumes_from_a_cursor(timeline):
+    timeline(total=50, page_size=20)
+    client = TimelineClient(cookies=SESSION, http2=False)
+
+    pages = list(client.iter_pages('1000001', cursor='page-2'))
+    client.close()
+
+    assert len(pages) == 1
+    assert len(client.parser.parse(pages[0])) == 10
+
+def test_requests_without_the_csrf_token_are_refused(timeline):
+    timeline(require_auth=True)
+    client = TimelineClient(cookies={'auth_token': 'token'}, http2=False)
+
+    with pytest.raises(httpx.HTTPStatusError) as error:
+        client.get_user_id('mock_user')
+    client.close()
+
+    assert error.value.response.status_code == 403
+
+def test_throttled_requests_raise_with_the_reset_time(timeline):
+    server = timeline(total=None, rate_limit=2, rate_window=60)
+    client = TimelineClient(cookies=SESSION, http2=False)
+
+    with pytest.raises(RateLimitError) as error:
+        for _ in client.iter_pages('1000001'):
+            pass
+    client.close()
+
+    assert server.throttled == 1
+    assert client.request_count == 3
+    assert error.value.reset_at is not None
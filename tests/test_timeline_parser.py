@@ -0,0 +1,92 @@
+"""Tests for decoding timeline GraphQL payloads."""
+
+import sys
+import json
+from pathlib import Path
+from datetime import datetime, timezone
+from urllib.parse import quote
+from urllib.request import urlopen
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.tweet.timeline_parser import TimelineParser
+from src.testing.fixture_server import FixtureServer
+from src.testing.payloads import build_tweet_result, build_timeline_payload, build_synthetic_page
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def fetch(server, cursor=None):
+    """Request one UserTweets page from a stand-in server."""
+    variables = quote(json.dumps({'cursor': cursor} if cursor else {}))
+    with urlopen(f"{server.base_url}/i/api/graphql/abc/UserTweets?variables={variables}") as response:
+        return json.loads(response.read())
+
+def test_synthetic_page():
+    parser = TimelineParser()
+    payload = build_synthetic_page(0, 20, total=50)
+
+    tweets = parser.parse(payload)
+
+    assert len(tweets) == 20
+    assert [tweet['status_id'] for tweet in tweets] == [str(1740000000000000000 - index) for index in range(20)]
+    first = tweets[0]
+    assert first['text'] == "Synthetic tweet #0 from @fixture_user"
+    assert first['author'] == 'fixture_user'
+    assert first['timestamp'] == '2024-01-01T00:00:00+00:00'
+    assert first['url'].endswith('/fixture_user/status/1740000000000000000')
+    assert tweets[8]['metrics'] == {'comments': '1', 'retweets': '8', 'likes': '8', 'views': '104'}
+    assert parser.extract_cursor(payload) == 'page-1'
+    assert parser.extract_cursor(build_synthetic_page(2, 20, total=50)) is None
+
+def test_wrapped_long_and_withheld_tweets():
+    parser = TimelineParser()
+    long_tweet = build_tweet_result(3, "Cut off…", NOW)
+    long_tweet['note_tweet'] = {'note_tweet_results': {'result': {'text': "The whole long tweet"}}}
+    withheld = {'__typename': 'TweetTombstone', 'rest_id': '2'}
+    payload = build_timeline_payload([
+        {'__typename': 'TweetWithVisibilityResults', 'rest_id': '4', 'tweet': build_tweet_result(4, "Limited", NOW)},
+        long_tweet,
+        withheld
+    ])
+
+    tweets = parser.parse(payload)
+
+    assert [(tweet['status_id'], tweet['text']) for tweet in tweets] == [('4', "Limited"), ('3', "The whole long tweet")]
+
+def test_unparseable_time_is_left_empty():
+    parser = TimelineParser()
+    result = build_tweet_result(5, "No time", NOW)
+    result['legacy']['created_at'] = 'yesterday'
+
+    # A made-up time would change the tweet's content hash on every run
+    assert parser.parse_result(result)['timestamp'] is None
+
+def test_timeline_urls():
+    parser = TimelineParser()
+
+    assert parser.is_timeline_url("https://x.com/i/api/graphql/abc/UserTweets?variables=%7B%7D")
+    assert parser.is_timeline_url("https://x.com/i/api/graphql/abc/SearchTimeline")
+    assert not parser.is_timeline_url("https://x.com/i/api/graphql/abc/UserByScreenName")
+    assert not parser.is_timeline_url("https://x.com/alice/status/1")
+    assert not parser.is_timeline_url(None)
+
+def test_recorded_fixtures_follow_their_cursors():
+    parser = TimelineParser()
+    status_ids = []
+
+    with FixtureServer() as server:
+        payload = fetch(server)
+        while True:
+            status_ids += [tweet['status_id'] for tweet in parser.parse(payload)]
+            cursor = parser.extract_cursor(payload)
+            if not cursor:
+                break
+            payload = fetch(server, cursor)
+
+    assert len(status_ids) == len(set(status_ids))
+    assert len(status_ids) == sum(
+        len(parser.parse(json.loads(path.read_text(encoding='utf-8'))))
+        for path in server.fixtures_dir.glob('UserTweets_*.json')
+    )
+    assert status_ids == sorted(status_ids, reverse=True)
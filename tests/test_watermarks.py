@@ -0,0 +1,68 @@
+"""Tests for the per-account watermarks of since-last-run scraping."""
+
+import sys
+from pathlib import Path
+from datetime import datetime
+
+# Add the parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.tweet.watermarks import WatermarkStore
+from src.tweet.processor import TweetProcessor
+from src.tweet.timeline_parser import TimelineParser
+from src.testing.payloads import build_synthetic_page
+
+NEWEST_ID = 1740000000000000000
+
+def test_unknown_account_starts_empty(tmp_path):
+    state = WatermarkStore(tmp_path).load('@Alice')
+
+    assert state == {'account': 'alice', 'newest_id': None, 'oldest_id': None, 'cursor': None, 'complete': False}
+
+def test_round_trip(tmp_path):
+    store = WatermarkStore(tmp_path)
+    state = store.load('alice')
+    state.update(newest_id=NEWEST_ID, oldest_id=NEWEST_ID - 99, cursor='page-5')
+    store.save(state)
+
+    loaded = WatermarkStore(tmp_path).load('Alice')
+    assert loaded['newest_id'] == NEWEST_ID
+    assert loaded['oldest_id'] == NEWEST_ID - 99
+    assert loaded['cursor'] == 'page-5'
+    # The times are read from the snowflake IDs
+    newest_at = datetime.fromisoformat(TweetProcessor().snowflake_timestamp(NEWEST_ID))
+    assert loaded['newest_at'] == newest_at.strftime('%Y-%m-%dT%H:%M:%SZ')
+    assert [path.name for path in tmp_path.iterdir()] == ['alice.json']
+
+def test_unreadable_file_is_ignored(tmp_path):
+    (tmp_path / 'alice.json').write_text('{"newest_id": 12', encoding='utf-8')
+
+    state = WatermarkStore(tmp_path).load('alice')
+
+    assert state['newest_id'] is None and not state['complete']
+
+def test_scan_stops_counting_known_tweets_below_the_watermark():
+    parser = TimelineParser()
+    page = parser.parse(build_synthetic_page(0, 20))
+    processor = TweetProcessor()
+    # The previous run saved everything from the sixth tweet down
+    processor.start_scan('fixture_user', watermark=NEWEST_ID - 5)
+
+    for tweet in page[:8]:
+        processor.process_api_tweet(tweet)
+
+    assert processor.newest_id == NEWEST_ID
+    assert processor.position_id == NEWEST_ID - 7
+    assert processor.known_streak == 3
+
+def test_retweets_do_not_move_the_position():
+    parser = TimelineParser()
+    own = parser.parse(build_synthetic_page(0, 3))
+    retweet = parser.parse(build_synthetic_page(5, 1, screen_name='someone_else'))[0]
+    processor = TweetProcessor()
+    processor.start_scan('fixture_user')
+
+    for tweet in own[:2] + [retweet]:
+        processor.process_api_tweet(tweet)
+
+    assert processor.position_id == NEWEST_ID - 1